@@ -1 +1,20 @@
-# Register your models here.
+from django.contrib import admin
+
+from .models import AccountingPeriod
+
+
+@admin.register(AccountingPeriod)
+class AccountingPeriodAdmin(admin.ModelAdmin):
+    list_display = ["property_obj", "period_start", "period_end", "period_type", "net_income", "is_closed"]
+    list_filter = ["period_type", "is_closed"]
+    search_fields = ["property_obj__property_name"]
+    ordering = ["-period_start"]
+    readonly_fields = ["total_income", "total_expenses", "net_income", "created_at", "updated_at"]
+
+    actions = ["recalculate_totals"]
+
+    def recalculate_totals(self, request, queryset):
+        updated = AccountingPeriod.recompute_bulk(queryset)
+        self.message_user(request, f"Totals recalculated for {updated} periods.")
+
+    recalculate_totals.short_description = "Recalculate totals for selected periods"
@@ -0,0 +1,36 @@
+"""
+Cache helpers for accounting summaries.
+
+Summary payloads are cached under a key that embeds a version number per
+owner (plus a global version for admins). Writing or deleting a
+transaction bumps the versions it affects, so stale summaries are never
+read and simply expire.
+"""
+
+from django.core.cache import cache
+
+SUMMARY_TIMEOUT = 300  # 5 minutes
+ALL_OWNERS = "all"
+
+
+def _version_key(scope):
+    return f"accounting:summary:version:{scope}"
+
+
+def get_summary_version(scope):
+    """Current summary version for an owner id (or ALL_OWNERS)"""
+    return cache.get_or_set(_version_key(scope), 1, None)
+
+
+def bump_summary_version(owner_id):
+    """Invalidate cached summaries covering the given owner's properties"""
+    for scope in (owner_id, ALL_OWNERS):
+        try:
+            cache.incr(_version_key(scope))
+        except ValueError:
+            # Key missing or evicted: start a fresh version
+            cache.set(_version_key(scope), 2, None)
+
+
+def summary_cache_key(scope, start_date, end_date):
+    return f"accounting:summary:{scope}:v{get_summary_version(scope)}:{start_date}:{end_date}"
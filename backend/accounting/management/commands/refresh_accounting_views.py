@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from accounting.models import TOTALS_VIEW, AccountingPeriod
+
+
+class Command(BaseCommand):
+    help = "Refresh the accounting totals materialized view (schedule hourly via cron)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--update-periods",
+            action="store_true",
+            help="Also recompute stored totals of open accounting periods from the refreshed view",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            self.stdout.write(self.style.WARNING("Materialized views require PostgreSQL; nothing to refresh"))
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {TOTALS_VIEW}")
+        self.stdout.write(self.style.SUCCESS(f"Refreshed {TOTALS_VIEW}"))
+
+        if options["update_periods"]:
+            updated = 0
+            for period in AccountingPeriod.objects.filter(is_closed=False).iterator():
+                period.calculate_totals(use_view=True)
+                updated += 1
+            self.stdout.write(self.style.SUCCESS(f"Updated totals for {updated} open periods"))
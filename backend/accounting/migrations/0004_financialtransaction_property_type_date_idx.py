@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounting", "0003_financialtransaction_accounting__transac_a02795_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="financialtransaction",
+            name="accounting__propert_81c1a9_idx",
+        ),
+        migrations.AddIndex(
+            model_name="financialtransaction",
+            index=models.Index(
+                fields=["property_obj", "transaction_type", "transaction_date"],
+                name="accounting__propert_35a823_idx",
+            ),
+        ),
+    ]
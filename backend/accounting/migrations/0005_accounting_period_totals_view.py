@@ -0,0 +1,39 @@
+from django.db import migrations
+
+# Monthly income/expense totals per property, refreshed by the
+# refresh_accounting_views management command. PostgreSQL only.
+CREATE_VIEW_SQL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS accounting_period_totals AS
+SELECT
+    property_obj_id,
+    date_trunc('month', transaction_date)::date AS period_start,
+    COALESCE(SUM(amount) FILTER (WHERE transaction_type = 'income'), 0) AS income,
+    COALESCE(SUM(amount) FILTER (WHERE transaction_type = 'expense'), 0) AS expense
+FROM accounting_financialtransaction
+GROUP BY 1, 2;
+CREATE UNIQUE INDEX IF NOT EXISTS accounting_period_totals_uniq
+    ON accounting_period_totals (property_obj_id, period_start);
+"""
+
+DROP_VIEW_SQL = "DROP MATERIALIZED VIEW IF EXISTS accounting_period_totals;"
+
+
+def create_view(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(CREATE_VIEW_SQL)
+
+
+def drop_view(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_VIEW_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounting", "0004_financialtransaction_property_type_date_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_view, drop_view),
+    ]
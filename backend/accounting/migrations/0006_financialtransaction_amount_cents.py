@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:43
+
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import Cast, Round
+
+
+def backfill_amount_cents(apps, schema_editor):
+    FinancialTransaction = apps.get_model("accounting", "FinancialTransaction")
+    FinancialTransaction.objects.update(amount_cents=Cast(Round(F("amount") * 100), models.BigIntegerField()))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounting", "0005_accounting_period_totals_view"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="financialtransaction",
+            name="amount_cents",
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_amount_cents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:44
+
+from django.db import migrations, models
+
+
+def backfill_is_expense(apps, schema_editor):
+    FinancialTransaction = apps.get_model("accounting", "FinancialTransaction")
+    FinancialTransaction.objects.filter(transaction_type="expense").update(is_expense=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounting", "0006_financialtransaction_amount_cents"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="financialtransaction",
+            name="is_expense",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.RunPython(backfill_is_expense, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="financialtransaction",
+            index=models.Index(
+                condition=models.Q(("is_expense", False)),
+                fields=["property_obj", "transaction_date"],
+                name="acct_txn_income_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="financialtransaction",
+            index=models.Index(
+                condition=models.Q(("is_expense", True)),
+                fields=["property_obj", "transaction_date"],
+                name="acct_txn_expense_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,45 @@
+from django.db import migrations
+
+# Trigram GIN indexes backing ?search= on transactions. DRF's SearchFilter
+# issues icontains, which Django renders as UPPER(col::text) LIKE UPPER(%s),
+# so the indexes are on UPPER(col) to match. PostgreSQL only.
+CREATE_INDEX_SQL = """
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS acct_txn_desc_trgm
+    ON accounting_financialtransaction USING gin (UPPER(description) gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS acct_txn_vendor_trgm
+    ON accounting_financialtransaction USING gin (UPPER(vendor_name) gin_trgm_ops);
+"""
+
+DROP_INDEX_SQL = """
+DROP INDEX CONCURRENTLY IF EXISTS acct_txn_desc_trgm;
+DROP INDEX CONCURRENTLY IF EXISTS acct_txn_vendor_trgm;
+"""
+
+
+def _run(sql, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        # CONCURRENTLY cannot run inside a multi-statement transaction block
+        for statement in filter(None, (s.strip() for s in sql.split(";"))):
+            schema_editor.execute(statement)
+
+
+def create_indexes(apps, schema_editor):
+    _run(CREATE_INDEX_SQL, schema_editor)
+
+
+def drop_indexes(apps, schema_editor):
+    _run(DROP_INDEX_SQL, schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("accounting", "0007_financialtransaction_is_expense"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
@@ -1,32 +1,61 @@
+from datetime import timedelta
+from decimal import ROUND_HALF_UP, Decimal
+
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import connection, models
+from django.db.models import Q
 
 
-class FinancialTransaction(models.Model):
-    TRANSACTION_TYPE_CHOICES = (
-        ("income", "Income"),
-        ("expense", "Expense"),
-    )
+TRANSACTION_TYPE_CHOICES = (
+    ("income", "Income"),
+    ("expense", "Expense"),
+)
+
+CATEGORY_CHOICES = (
+    # Income categories
+    ("rent", "Rent Income"),
+    ("late_fees", "Late Fees"),
+    ("pet_deposit", "Pet Deposit"),
+    ("security_deposit", "Security Deposit"),
+    ("other_income", "Other Income"),
+    # Expense categories
+    ("maintenance", "Maintenance & Repairs"),
+    ("utilities", "Utilities"),
+    ("insurance", "Insurance"),
+    ("property_tax", "Property Tax"),
+    ("management_fees", "Property Management Fees"),
+    ("marketing", "Marketing & Advertising"),
+    ("legal_fees", "Legal Fees"),
+    ("accounting_fees", "Accounting Fees"),
+    ("supplies", "Office Supplies"),
+    ("other_expenses", "Other Expenses"),
+)
+
+# Months between occurrences of a recurring transaction
+RECURRING_FREQUENCY_MONTHS = {
+    "monthly": 1,
+    "quarterly": 3,
+    "yearly": 12,
+}
+
+
+def to_cents(amount):
+    """Convert a monetary amount to integer cents"""
+    return int((Decimal(str(amount)) * 100).to_integral_value(rounding=ROUND_HALF_UP))
 
-    CATEGORY_CHOICES = (
-        # Income categories
-        ("rent", "Rent Income"),
-        ("late_fees", "Late Fees"),
-        ("pet_deposit", "Pet Deposit"),
-        ("security_deposit", "Security Deposit"),
-        ("other_income", "Other Income"),
-        # Expense categories
-        ("maintenance", "Maintenance & Repairs"),
-        ("utilities", "Utilities"),
-        ("insurance", "Insurance"),
-        ("property_tax", "Property Tax"),
-        ("management_fees", "Property Management Fees"),
-        ("marketing", "Marketing & Advertising"),
-        ("legal_fees", "Legal Fees"),
-        ("accounting_fees", "Accounting Fees"),
-        ("supplies", "Office Supplies"),
-        ("other_expenses", "Other Expenses"),
-    )
+
+def from_cents(cents):
+    """Convert integer cents (or None from an empty aggregate) back to a 2dp Decimal"""
+    return Decimal(cents or 0).scaleb(-2)
+
+
+# Materialized view of monthly per-property totals (PostgreSQL only)
+TOTALS_VIEW = "accounting_period_totals"
+
+
+class FinancialTransaction(models.Model):
+    TRANSACTION_TYPE_CHOICES = TRANSACTION_TYPE_CHOICES
+    CATEGORY_CHOICES = CATEGORY_CHOICES
 
     property_obj = models.ForeignKey(
         "properties.Property", on_delete=models.CASCADE, related_name="financial_transactions"
@@ -34,8 +63,12 @@ class FinancialTransaction(models.Model):
 
     # Transaction details
     transaction_type = models.CharField(max_length=10, choices=TRANSACTION_TYPE_CHOICES)
+    # Derived from transaction_type on save; filters and partial indexes use the bool
+    is_expense = models.BooleanField(default=False, editable=False)
     category = models.CharField(max_length=50, choices=CATEGORY_CHOICES)
     amount = models.DecimalField(max_digits=12, decimal_places=2, validators=[MinValueValidator(0.01)])
+    # Integer shadow of amount kept in sync on save; aggregates sum this instead of NUMERIC
+    amount_cents = models.BigIntegerField(default=0, editable=False)
 
     # Description and date
     description = models.TextField(blank=True)
@@ -84,24 +117,26 @@ class FinancialTransaction(models.Model):
     class Meta:
         ordering = ["-transaction_date"]
         indexes = [
-            models.Index(fields=["property_obj"]),
+            # Matches the summary/period-total filters on (property, type, date range)
+            models.Index(fields=["property_obj", "transaction_type", "transaction_date"]),
             models.Index(fields=["transaction_type"]),
             models.Index(fields=["category"]),
             models.Index(fields=["transaction_date"]),
             models.Index(fields=["transaction_type", "transaction_date"]),  # For financial reports
             models.Index(fields=["property_obj", "transaction_date"]),  # For property financial history
             models.Index(fields=["lease"]),  # For lease-related transactions
+            # Half-size partial indexes for per-type date range scans
+            models.Index(
+                fields=["property_obj", "transaction_date"], condition=Q(is_expense=False), name="acct_txn_income_idx"
+            ),
+            models.Index(
+                fields=["property_obj", "transaction_date"], condition=Q(is_expense=True), name="acct_txn_expense_idx"
+            ),
         ]
 
     def __str__(self):
         return f"{self.get_transaction_type_display()}: {self.category} - ${self.amount}"
 
-    def get_transaction_type_display(self):
-        return dict(self.TRANSACTION_TYPE_CHOICES).get(self.transaction_type, self.transaction_type)
-
-    def get_category_display(self):
-        return dict(self.CATEGORY_CHOICES).get(self.category, self.category)
-
 
 class AccountingPeriod(models.Model):
     """Model to track accounting periods (months/quarters)"""
@@ -149,34 +184,107 @@ class AccountingPeriod(models.Model):
 
     @property
     def profit_margin(self):
-        """Calculate profit margin percentage"""
+        """Calculate profit margin percentage (precomputed by the list queryset when annotated)"""
+        if "profit_margin_db" in self.__dict__:
+            return self.profit_margin_db
         if self.total_income == 0:
             return 0
         return round((self.net_income / self.total_income) * 100, 2)
 
-    def calculate_totals(self):
-        """Calculate total income and expenses for this period"""
-        from django.db.models import Sum
+    @classmethod
+    def recompute_bulk(cls, periods):
+        """
+        Recalculate totals for every period in the queryset set-at-a-time:
+        one SELECT with correlated SUM subqueries over amount_cents and one
+        bulk UPDATE, instead of one calculate_totals() round-trip per
+        period. Sums are converted with from_cents(), exactly as
+        calculate_totals() does.
 
-        income_total = (
-            FinancialTransaction.objects.filter(
-                property_obj=self.property_obj,
-                transaction_type="income",
-                transaction_date__gte=self.period_start,
-                transaction_date__lte=self.period_end,
-            ).aggregate(total=Sum("amount"))["total"]
-            or 0
+        Returns the number of periods updated.
+        """
+        from django.db.models import BigIntegerField, OuterRef, Subquery, Sum
+        from django.utils import timezone
+
+        def period_cents(is_expense):
+            total = (
+                FinancialTransaction.objects.filter(
+                    property_obj=OuterRef("property_obj"),
+                    is_expense=is_expense,
+                    transaction_date__gte=OuterRef("period_start"),
+                    transaction_date__lte=OuterRef("period_end"),
+                )
+                .order_by()
+                .values("property_obj")
+                .annotate(total=Sum("amount_cents"))
+                .values("total")
+            )
+            return Subquery(total, output_field=BigIntegerField())
+
+        now = timezone.now()
+        updated = list(
+            periods.order_by()
+            .only("id")
+            .annotate(income_cents=period_cents(False), expense_cents=period_cents(True))
         )
+        for period in updated:
+            period.total_income = from_cents(period.income_cents)
+            period.total_expenses = from_cents(period.expense_cents)
+            period.net_income = period.total_income - period.total_expenses
+            period.updated_at = now
+
+        cls.objects.bulk_update(updated, ["total_income", "total_expenses", "net_income", "updated_at"])
+        return len(updated)
+
+    @property
+    def is_month_aligned(self):
+        """Whether the period spans whole calendar months"""
+        return self.period_start.day == 1 and (self.period_end + timedelta(days=1)).day == 1
 
-        expense_total = (
-            FinancialTransaction.objects.filter(
-                property_obj=self.property_obj,
-                transaction_type="expense",
+    def totals_from_view(self):
+        """
+        Read income/expense totals from the accounting_period_totals
+        materialized view. Returns None when the view cannot answer for
+        this period (non-PostgreSQL database or a partial-month period).
+        """
+        if connection.vendor != "postgresql" or not self.is_month_aligned:
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT COALESCE(SUM(income), 0), COALESCE(SUM(expense), 0)
+                FROM {TOTALS_VIEW}
+                WHERE property_obj_id = %s AND period_start >= %s AND period_start <= %s
+                """,
+                [self.property_obj_id, self.period_start, self.period_end],
+            )
+            return cursor.fetchone()
+
+    def calculate_totals(self, use_view=False):
+        """
+        Calculate total income and expenses for this period.
+
+        With use_view=True an open period is read from the precomputed
+        materialized view (as fresh as its last refresh); closed periods
+        and periods the view can't answer use live aggregation.
+        """
+        from django.db.models import Sum
+
+        totals = self.totals_from_view() if use_view and not self.is_closed else None
+
+        if totals is not None:
+            income_total, expense_total = totals
+        else:
+            totals = FinancialTransaction.objects.filter(
+                property_obj_id=self.property_obj_id,
                 transaction_date__gte=self.period_start,
                 transaction_date__lte=self.period_end,
-            ).aggregate(total=Sum("amount"))["total"]
-            or 0
-        )
+            ).aggregate(
+                income=Sum("amount_cents", filter=Q(is_expense=False)),
+                expense=Sum("amount_cents", filter=Q(is_expense=True)),
+            )
+            income_total = from_cents(totals["income"])
+            expense_total = from_cents(totals["expense"])
 
         self.total_income = income_total
         self.total_expenses = expense_total
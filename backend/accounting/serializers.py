@@ -1,17 +1,19 @@
 from rest_framework import serializers
 
+from properties.models import Property
+
 from .models import AccountingPeriod, FinancialTransaction
 
 
 class FinancialTransactionSerializer(serializers.ModelSerializer):
-    property_name = serializers.CharField(source="property.property_name", read_only=True)
+    property_name = serializers.CharField(source="property_obj.property_name", read_only=True)
     recorded_by_name = serializers.CharField(source="recorded_by.get_full_name", read_only=True)
 
     class Meta:
         model = FinancialTransaction
         fields = [
             "id",
-            "property",
+            "property_obj",
             "property_name",
             "transaction_type",
             "category",
@@ -32,16 +34,32 @@ class FinancialTransactionSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at"]
 
 
+class GenerateRecurringSerializer(serializers.Serializer):
+    """Input for FinancialTransactionViewSet.generate_recurring"""
+
+    end_date = serializers.DateField(required=False)
+    property = serializers.PrimaryKeyRelatedField(queryset=Property.objects.all(), required=False)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Limit property to the ones the requesting user manages, like the transactions themselves
+        user = self.context["request"].user
+        if user.user_type in ["owner", "manager"]:
+            self.fields["property"].queryset = Property.objects.filter(owner=user)
+        elif user.user_type != "admin":
+            self.fields["property"].queryset = Property.objects.none()
+
+
 class AccountingPeriodSerializer(serializers.ModelSerializer):
-    property_name = serializers.CharField(source="property.property_name", read_only=True)
+    property_name = serializers.CharField(source="property_obj.property_name", read_only=True)
     closed_by_name = serializers.CharField(source="closed_by.get_full_name", read_only=True)
-    profit_margin = serializers.SerializerMethodField()
+    profit_margin = serializers.FloatField(read_only=True)
 
     class Meta:
         model = AccountingPeriod
         fields = [
             "id",
-            "property",
+            "property_obj",
             "property_name",
             "period_start",
             "period_end",
@@ -59,5 +77,17 @@ class AccountingPeriodSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "created_at", "updated_at", "profit_margin"]
 
-    def get_profit_margin(self, obj):
-        return obj.profit_margin
+
+class PeriodTransactionSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = FinancialTransaction
+        fields = ["id", "transaction_type", "category", "amount", "transaction_date"]
+        read_only_fields = fields
+
+
+class AccountingPeriodDetailSerializer(AccountingPeriodSerializer):
+    # Filled by the viewset with the in-period rows only (see AccountingPeriodViewSet.get_object)
+    transactions = PeriodTransactionSerializer(source="property_obj.period_transactions", many=True, read_only=True)
+
+    class Meta(AccountingPeriodSerializer.Meta):
+        fields = AccountingPeriodSerializer.Meta.fields + ["transactions"]
@@ -0,0 +1,23 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .cache import bump_summary_version
+from .models import FinancialTransaction, to_cents
+
+
+@receiver(pre_save, sender=FinancialTransaction)
+def sync_denormalized_fields(sender, instance, **kwargs):
+    """
+    Signal to keep amount_cents and is_expense in step with amount and transaction_type.
+    """
+    instance.amount_cents = to_cents(instance.amount)
+    instance.is_expense = instance.transaction_type == "expense"
+
+
+@receiver(post_save, sender=FinancialTransaction)
+@receiver(post_delete, sender=FinancialTransaction)
+def invalidate_summary_cache(sender, instance, **kwargs):
+    """
+    Signal to invalidate cached financial summaries when a transaction changes.
+    """
+    bump_summary_version(instance.property_obj.owner_id)
@@ -1 +1,446 @@
-# Create your tests here.
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from properties.models import Property
+
+from .models import AccountingPeriod, FinancialTransaction
+
+User = get_user_model()
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class FinancialTransactionModelTest(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="owner", email="owner@example.com", password="owner123", user_type="owner"
+        )
+        self.property = Property.objects.create(
+            owner=self.owner,
+            property_name="Test Property",
+            address="123 Test St",
+            city="Test City",
+            state="TS",
+            zip_code="12345",
+            property_type="apartment",
+            total_units=5,
+        )
+
+    def test_display_helpers(self):
+        """Test built-in choice display helpers and their raw-key fallback"""
+        txn = FinancialTransaction.objects.create(
+            property_obj=self.property,
+            transaction_type="income",
+            category="rent",
+            amount=Decimal("1500.00"),
+            transaction_date=date(2024, 1, 1),
+        )
+        self.assertEqual(txn.get_transaction_type_display(), "Income")
+        self.assertEqual(txn.get_category_display(), "Rent Income")
+        self.assertEqual(str(txn), "Income: rent - $1500.00")
+
+        txn.category = "unknown"
+        self.assertEqual(txn.get_category_display(), "unknown")
+
+    def test_amount_cents_kept_in_sync(self):
+        """Test the integer cents shadow follows amount on every save"""
+        txn = FinancialTransaction.objects.create(
+            property_obj=self.property,
+            transaction_type="expense",
+            category="supplies",
+            amount=19.99,
+            transaction_date=date(2024, 1, 1),
+        )
+        self.assertEqual(txn.amount_cents, 1999)
+
+        txn.amount = Decimal("250.05")
+        txn.save()
+        txn.refresh_from_db()
+        self.assertEqual(txn.amount_cents, 25005)
+
+    def test_period_calculate_totals(self):
+        """Test period totals only include transactions inside the period"""
+        rows = [
+            ("income", "rent", "2000.00", date(2024, 1, 1)),
+            ("expense", "utilities", "300.00", date(2024, 1, 31)),
+            ("income", "rent", "99.00", date(2024, 2, 1)),
+        ]
+        for transaction_type, category, amount, transaction_date in rows:
+            FinancialTransaction.objects.create(
+                property_obj=self.property,
+                transaction_type=transaction_type,
+                category=category,
+                amount=Decimal(amount),
+                transaction_date=transaction_date,
+            )
+        period = AccountingPeriod.objects.create(
+            property_obj=self.property, period_start=date(2024, 1, 1), period_end=date(2024, 1, 31)
+        )
+        self.assertTrue(period.is_month_aligned)
+
+        # The view is PostgreSQL-only, so this falls back to live aggregation
+        period.calculate_totals(use_view=True)
+        period.refresh_from_db()
+        self.assertEqual(period.total_income, Decimal("2000.00"))
+        self.assertEqual(period.total_expenses, Decimal("300.00"))
+        self.assertEqual(period.net_income, Decimal("1700.00"))
+
+    def test_recompute_bulk_matches_calculate_totals(self):
+        """Test the bulk recompute gives the same totals as calculate_totals()"""
+        rows = [
+            ("income", "rent", "1999.99", date(2024, 1, 1)),
+            ("income", "late_fees", "0.01", date(2024, 1, 15)),
+            ("expense", "utilities", "300.10", date(2024, 1, 31)),
+            ("expense", "maintenance", "45.55", date(2024, 2, 1)),
+        ]
+        for transaction_type, category, amount, transaction_date in rows:
+            FinancialTransaction.objects.create(
+                property_obj=self.property,
+                transaction_type=transaction_type,
+                category=category,
+                amount=Decimal(amount),
+                transaction_date=transaction_date,
+            )
+        january = AccountingPeriod.objects.create(
+            property_obj=self.property, period_start=date(2024, 1, 1), period_end=date(2024, 1, 31)
+        )
+        february = AccountingPeriod.objects.create(
+            property_obj=self.property, period_start=date(2024, 2, 1), period_end=date(2024, 2, 29)
+        )
+
+        updated = AccountingPeriod.recompute_bulk(AccountingPeriod.objects.all())
+
+        self.assertEqual(updated, 2)
+        for period in (january, february):
+            period.refresh_from_db()
+            bulk_totals = (period.total_income, period.total_expenses, period.net_income)
+            period.calculate_totals()
+            period.refresh_from_db()
+            self.assertEqual(bulk_totals, (period.total_income, period.total_expenses, period.net_income))
+        self.assertEqual(january.net_income, Decimal("1699.90"))
+        self.assertEqual(february.total_income, Decimal("0.00"))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class FinancialTransactionAPITestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username="owner",
+            email="owner@example.com",
+            password="owner123",
+            user_type="owner",
+            first_name="Olive",
+            last_name="Owner",
+        )
+        self.property = Property.objects.create(
+            owner=self.owner,
+            property_name="Test Property",
+            address="123 Test St",
+            city="Test City",
+            state="TS",
+            zip_code="12345",
+            property_type="apartment",
+            total_units=5,
+        )
+        self.client.force_authenticate(user=self.owner)
+
+    def create_transaction(self, transaction_type="income", category="rent", amount="1000.00", **kwargs):
+        kwargs.setdefault("transaction_date", date.today())
+        return FinancialTransaction.objects.create(
+            property_obj=self.property,
+            transaction_type=transaction_type,
+            category=category,
+            amount=Decimal(amount),
+            recorded_by=self.owner,
+            **kwargs,
+        )
+
+    def test_list_transactions(self):
+        """Test listing transactions includes related names without per-row queries"""
+        for _ in range(5):
+            self.create_transaction()
+
+        url = reverse("transaction-list")
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 5)
+        row = response.data["results"][0]
+        self.assertEqual(row["property_name"], "Test Property")
+        self.assertEqual(row["recorded_by_name"], "Olive Owner")
+
+        # Page count + one joined select, regardless of the number of rows
+        with self.assertNumQueries(2):
+            self.client.get(url)
+
+    def test_filter_by_transaction_type(self):
+        """Test the transaction_type filter"""
+        self.create_transaction()
+        self.create_transaction(transaction_type="expense", category="utilities")
+
+        response = self.client.get(reverse("transaction-list"), {"transaction_type": "expense"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["category"] for row in response.data["results"]], ["utilities"])
+
+    def test_search_description_and_vendor(self):
+        """Test case-insensitive search over description and vendor name"""
+        self.create_transaction(description="January rent payment")
+        self.create_transaction(transaction_type="expense", category="utilities", vendor_name="City Water")
+
+        response = self.client.get(reverse("transaction-list"), {"search": "RENT"})
+        self.assertEqual([row["category"] for row in response.data["results"]], ["rent"])
+        response = self.client.get(reverse("transaction-list"), {"search": "water"})
+        self.assertEqual([row["category"] for row in response.data["results"]], ["utilities"])
+
+    def test_summary(self):
+        """Test summary totals and category breakdown"""
+        self.create_transaction(amount="1000.00")
+        self.create_transaction(category="late_fees", amount="50.00")
+        self.create_transaction(transaction_type="expense", category="utilities", amount="200.00")
+        self.create_transaction(transaction_date=date(2000, 1, 1))
+
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("transaction-summary"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        summary = response.data["summary"]
+        self.assertEqual(Decimal(summary["total_income"]), Decimal("1050.00"))
+        self.assertEqual(Decimal(summary["total_expenses"]), Decimal("200.00"))
+        self.assertEqual(Decimal(summary["net_income"]), Decimal("850.00"))
+        self.assertEqual(summary["transaction_count"], 3)
+        self.assertEqual(
+            [row["category"] for row in response.data["income_by_category"]], ["rent", "late_fees"]
+        )
+        self.assertEqual(response.data["expense_by_category"], [{"category": "utilities", "total": Decimal("200.00")}])
+
+    def test_summary_invalid_dates(self):
+        """Test malformed summary dates are rejected with 400"""
+        response = self.client.get(reverse("transaction-summary"), {"start_date": "2024-13-01"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_summary_cached_until_transactions_change(self):
+        """Test summary is served from cache and invalidated by writes"""
+        url = reverse("transaction-summary")
+        txn = self.create_transaction(amount="1000.00")
+        self.client.get(url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(Decimal(response.data["summary"]["total_income"]), Decimal("1000.00"))
+
+        self.create_transaction(amount="500.00")
+        response = self.client.get(url)
+        self.assertEqual(Decimal(response.data["summary"]["total_income"]), Decimal("1500.00"))
+
+        txn.delete()
+        response = self.client.get(url)
+        self.assertEqual(Decimal(response.data["summary"]["total_income"]), Decimal("500.00"))
+
+    def test_generate_recurring(self):
+        """Test recurring transactions expand into dated occurrences once"""
+        self.create_transaction(
+            transaction_date=date(2024, 1, 31), is_recurring=True, recurring_frequency="monthly"
+        )
+        self.create_transaction(
+            transaction_type="expense",
+            category="insurance",
+            transaction_date=date(2024, 1, 15),
+            is_recurring=True,
+            recurring_frequency="quarterly",
+        )
+
+        url = reverse("transaction-generate-recurring")
+        response = self.client.post(url, {"end_date": "2024-06-30"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 6)
+
+        rent_dates = list(
+            FinancialTransaction.objects.filter(category="rent", is_recurring=False)
+            .order_by("transaction_date")
+            .values_list("transaction_date", flat=True)
+        )
+        self.assertEqual(
+            rent_dates,
+            [date(2024, 2, 29), date(2024, 3, 31), date(2024, 4, 30), date(2024, 5, 31), date(2024, 6, 30)],
+        )
+
+        # A second run only fills the gap up to the new end date
+        response = self.client.post(url, {"end_date": "2024-07-31"}, format="json")
+        self.assertEqual(response.data["created"], 2)
+
+        response = self.client.post(url, {"end_date": "not-a-date"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_generate_recurring_rejects_bad_property(self):
+        """Test an unknown, malformed or someone else's property is a 400, not a 500"""
+        other_owner = User.objects.create_user(
+            username="other", email="other@example.com", password="other123", user_type="owner"
+        )
+        other_property = Property.objects.create(
+            owner=other_owner,
+            property_name="Other Property",
+            address="9 Elm St",
+            city="Test City",
+            state="TS",
+            zip_code="12345",
+            property_type="single_family",
+            total_units=1,
+        )
+        url = reverse("transaction-generate-recurring")
+
+        for value in ["abc", 999999, other_property.id]:
+            response = self.client.post(url, {"end_date": "2024-06-30", "property": value}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("property", response.data)
+
+        response = self.client.post(url, {"end_date": "2024-06-30", "property": self.property.id}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AccountingPeriodAPITestCase(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="owner", email="owner@example.com", password="owner123", user_type="owner"
+        )
+        self.property = Property.objects.create(
+            owner=self.owner,
+            property_name="Test Property",
+            address="123 Test St",
+            city="Test City",
+            state="TS",
+            zip_code="12345",
+            property_type="apartment",
+            total_units=5,
+        )
+        self.period = AccountingPeriod.objects.create(
+            property_obj=self.property,
+            period_start=date(2024, 1, 1),
+            period_end=date(2024, 1, 31),
+            total_income=Decimal("2000.00"),
+            total_expenses=Decimal("500.00"),
+            net_income=Decimal("1500.00"),
+        )
+        self.client.force_authenticate(user=self.owner)
+
+    def test_list_profit_margin(self):
+        """Test profit margin is computed for listed periods"""
+        AccountingPeriod.objects.create(
+            property_obj=self.property, period_start=date(2024, 2, 1), period_end=date(2024, 2, 29)
+        )
+        response = self.client.get(reverse("accounting-period-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        margins = {row["period_start"]: row["profit_margin"] for row in response.data["results"]}
+        self.assertEqual(margins, {"2024-01-01": 75.0, "2024-02-01": 0.0})
+
+    def test_profit_margin_matches_between_list_and_detail(self):
+        """Test the SQL margin on the list matches the detail's, as a 2dp number"""
+        period = AccountingPeriod.objects.create(
+            property_obj=self.property,
+            period_start=date(2024, 2, 1),
+            period_end=date(2024, 2, 29),
+            total_income=Decimal("3.00"),
+            total_expenses=Decimal("2.00"),
+            net_income=Decimal("1.00"),
+        )
+
+        listed = self.client.get(reverse("accounting-period-list")).data["results"]
+        detail = self.client.get(reverse("accounting-period-detail", args=[period.id])).data
+
+        self.assertEqual(next(row for row in listed if row["id"] == period.id)["profit_margin"], 33.33)
+        self.assertEqual(detail["profit_margin"], 33.33)
+
+    def test_retrieve_period_transactions(self):
+        """Test period detail lists only the transactions inside the period"""
+        for transaction_date in [date(2024, 1, 10), date(2024, 1, 20), date(2024, 2, 1)]:
+            FinancialTransaction.objects.create(
+                property_obj=self.property,
+                transaction_type="income",
+                category="rent",
+                amount=Decimal("100.00"),
+                transaction_date=transaction_date,
+            )
+
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("accounting-period-detail", args=[self.period.id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            sorted(row["transaction_date"] for row in response.data["transactions"]), ["2024-01-10", "2024-01-20"]
+        )
+
+    def test_close_period(self):
+        """Test closing a period recalculates totals from its transactions"""
+        FinancialTransaction.objects.create(
+            property_obj=self.property,
+            transaction_type="income",
+            category="rent",
+            amount=Decimal("1000.00"),
+            transaction_date=date(2024, 1, 5),
+        )
+        url = reverse("accounting-period-close", args=[self.period.id])
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data["is_closed"])
+        self.assertEqual(Decimal(response.data["total_income"]), Decimal("1000.00"))
+        self.assertEqual(response.data["profit_margin"], 100.0)
+
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_close_periods(self):
+        """Test bulk close recalculates and closes all periods for the same range"""
+        other_property = Property.objects.create(
+            owner=self.owner,
+            property_name="Second Property",
+            address="456 Test St",
+            city="Test City",
+            state="TS",
+            zip_code="12345",
+            property_type="single_family",
+            total_units=1,
+        )
+        other_period = AccountingPeriod.objects.create(
+            property_obj=other_property, period_start=date(2024, 1, 1), period_end=date(2024, 1, 31)
+        )
+        for property_obj, transaction_type, amount in [
+            (self.property, "income", "1200.00"),
+            (self.property, "expense", "200.00"),
+            (other_property, "expense", "75.00"),
+        ]:
+            FinancialTransaction.objects.create(
+                property_obj=property_obj,
+                transaction_type=transaction_type,
+                category="rent" if transaction_type == "income" else "utilities",
+                amount=Decimal(amount),
+                transaction_date=date(2024, 1, 15),
+            )
+
+        url = reverse("accounting-period-close", args=[self.period.id])
+        response = self.client.post(f"{url}?bulk=true")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+
+        self.period.refresh_from_db()
+        other_period.refresh_from_db()
+        self.assertTrue(self.period.is_closed and other_period.is_closed)
+        self.assertEqual(self.period.closed_by, self.owner)
+        self.assertEqual(self.period.net_income, Decimal("1000.00"))
+        self.assertEqual(other_period.total_income, Decimal("0"))
+        self.assertEqual(other_period.net_income, Decimal("-75.00"))
+
+    def test_close_period_of_other_owner(self):
+        """Test a period of another owner's property cannot be closed"""
+        other = User.objects.create_user(
+            username="other", email="other@example.com", password="other123", user_type="owner"
+        )
+        self.client.force_authenticate(user=other)
+        response = self.client.post(reverse("accounting-period-close", args=[self.period.id]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
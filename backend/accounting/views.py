@@ -1,17 +1,54 @@
+import calendar
+from datetime import date
+
 import django_filters
-from django.db.models import Sum
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    FloatField,
+    Prefetch,
+    Q,
+    Sum,
+    Value,
+    When,
+    prefetch_related_objects,
+)
+from django.db.models.functions import Cast, Round
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, permissions, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from .models import AccountingPeriod, FinancialTransaction
-from .serializers import AccountingPeriodSerializer, FinancialTransactionSerializer
+from .cache import ALL_OWNERS, SUMMARY_TIMEOUT, bump_summary_version, summary_cache_key
+from .models import (
+    RECURRING_FREQUENCY_MONTHS,
+    TRANSACTION_TYPE_CHOICES,
+    AccountingPeriod,
+    FinancialTransaction,
+    from_cents,
+)
+from .serializers import (
+    AccountingPeriodDetailSerializer,
+    AccountingPeriodSerializer,
+    FinancialTransactionSerializer,
+    GenerateRecurringSerializer,
+)
+
+
+def _add_months(value, months):
+    """Shift a date by whole months, clamping to the last day of the target month"""
+    month_index = value.month - 1 + months
+    year, month = value.year + month_index // 12, month_index % 12 + 1
+    return value.replace(year=year, month=month, day=min(value.day, calendar.monthrange(year, month)[1]))
 
 
 class FinancialTransactionFilter(django_filters.FilterSet):
     property = django_filters.NumberFilter(field_name="property_obj", lookup_expr="exact")
+    transaction_type = django_filters.ChoiceFilter(choices=TRANSACTION_TYPE_CHOICES, method="filter_transaction_type")
     date_from = django_filters.DateFilter(field_name="transaction_date", lookup_expr="gte")
     date_to = django_filters.DateFilter(field_name="transaction_date", lookup_expr="lte")
 
@@ -19,6 +56,9 @@ class FinancialTransactionFilter(django_filters.FilterSet):
         model = FinancialTransaction
         fields = ["transaction_type", "category", "property"]
 
+    def filter_transaction_type(self, queryset, name, value):
+        return queryset.filter(is_expense=value == "expense")
+
 
 class FinancialTransactionViewSet(viewsets.ModelViewSet):
     """
@@ -30,24 +70,56 @@ class FinancialTransactionViewSet(viewsets.ModelViewSet):
     PUT /api/accounting/transactions/{id}/ - Update transaction
     DELETE /api/accounting/transactions/{id}/ - Delete transaction
     GET /api/accounting/transactions/summary/ - Get financial summary
+    POST /api/accounting/transactions/generate_recurring/ - Generate recurring transaction occurrences
     """
 
     serializer_class = FinancialTransactionSerializer
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = FinancialTransactionFilter
+    # Both backed by trigram GIN indexes on PostgreSQL (migration 0008)
     search_fields = ["description", "vendor_name"]
     ordering_fields = ["transaction_date", "amount"]
     ordering = ["-transaction_date"]
 
+    # Columns the list serializer reads; keeps the joined property/user/lease/
+    # maintenance rows down to the few columns actually rendered
+    list_only_fields = [
+        "id",
+        "property_obj__id",
+        "property_obj__property_name",
+        "transaction_type",
+        "category",
+        "amount",
+        "description",
+        "transaction_date",
+        "lease__id",
+        "maintenance_request__id",
+        "vendor_name",
+        "vendor_invoice_number",
+        "recorded_by__id",
+        "recorded_by__first_name",
+        "recorded_by__last_name",
+        "is_recurring",
+        "recurring_frequency",
+        "created_at",
+        "updated_at",
+    ]
+
     def get_queryset(self):
         """Filter transactions by user permissions"""
         user = self.request.user
 
+        queryset = FinancialTransaction.objects.select_related(
+            "property_obj", "recorded_by", "lease", "maintenance_request"
+        )
+        if self.action == "list":
+            queryset = queryset.only(*self.list_only_fields)
+
         if user.user_type == "admin":
-            return FinancialTransaction.objects.all()
+            return queryset
         elif user.user_type in ["owner", "manager"]:
-            return FinancialTransaction.objects.filter(property_obj__owner=user)
+            return queryset.filter(property_obj__owner=user)
         else:
             return FinancialTransaction.objects.none()
 
@@ -60,58 +132,133 @@ class FinancialTransactionViewSet(viewsets.ModelViewSet):
         start_date = request.query_params.get("start_date")
         end_date = request.query_params.get("end_date")
 
-        if not start_date:
-            start_date = today.replace(day=1)
-        else:
-            start_date = timezone.datetime.fromisoformat(start_date).date()
+        try:
+            start_date = date.fromisoformat(start_date) if start_date else today.replace(day=1)
+            end_date = date.fromisoformat(end_date) if end_date else today
+        except ValueError:
+            return Response(
+                {"error": "start_date and end_date must be ISO dates (YYYY-MM-DD)"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        if not end_date:
-            end_date = today
-        else:
-            end_date = timezone.datetime.fromisoformat(end_date).date()
+        # Summaries are cached per owner (admins share one scope) and invalidated on writes
+        scope = ALL_OWNERS if request.user.user_type == "admin" else request.user.id
+        cache_key = summary_cache_key(scope, start_date, end_date)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return Response(cached)
 
         # Filter transactions by user permissions and date range
         transactions = self.get_queryset().filter(transaction_date__gte=start_date, transaction_date__lte=end_date)
 
-        # Calculate totals
-        income_total = transactions.filter(transaction_type="income").aggregate(total=Sum("amount"))["total"] or 0
-
-        expense_total = transactions.filter(transaction_type="expense").aggregate(total=Sum("amount"))["total"] or 0
-
+        # Calculate totals and count in a single pass
+        totals = transactions.aggregate(
+            income=Sum("amount_cents", filter=Q(is_expense=False)),
+            expense=Sum("amount_cents", filter=Q(is_expense=True)),
+            count=Count("id"),
+        )
+        income_total = from_cents(totals["income"])
+        expense_total = from_cents(totals["expense"])
         net_income = income_total - expense_total
 
-        # Category breakdown
-        income_by_category = (
-            transactions.filter(transaction_type="income")
-            .values("category")
-            .annotate(total=Sum("amount"))
-            .order_by("-total")
+        # Category breakdown for both types in one grouped query, streamed
+        # without filling the queryset result cache
+        income_by_category = []
+        expense_by_category = []
+        category_totals = (
+            transactions.values("is_expense", "category").annotate(total=Sum("amount_cents")).order_by("-total")
         )
-
-        expense_by_category = (
-            transactions.filter(transaction_type="expense")
-            .values("category")
-            .annotate(total=Sum("amount"))
-            .order_by("-total")
+        for row in category_totals.iterator(chunk_size=100):
+            rows = expense_by_category if row["is_expense"] else income_by_category
+            rows.append({"category": row["category"], "total": from_cents(row["total"])})
+
+        payload = {
+            "period": {
+                "start_date": start_date,
+                "end_date": end_date,
+            },
+            "summary": {
+                "total_income": str(income_total),
+                "total_expenses": str(expense_total),
+                "net_income": str(net_income),
+                "transaction_count": totals["count"],
+            },
+            "income_by_category": income_by_category,
+            "expense_by_category": expense_by_category,
+        }
+        cache.set(cache_key, payload, SUMMARY_TIMEOUT)
+
+        return Response(payload)
+
+    @action(detail=False, methods=["post"])
+    def generate_recurring(self, request):
+        """Generate occurrences of recurring transactions up to end_date (default today)"""
+        serializer = GenerateRecurringSerializer(data=request.data, context={"request": request})
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        end_date = serializer.validated_data.get("end_date") or timezone.now().date()
+
+        templates = self.get_queryset().filter(
+            is_recurring=True,
+            recurring_frequency__in=RECURRING_FREQUENCY_MONTHS,
+            transaction_date__lt=end_date,
         )
-
-        return Response(
-            {
-                "period": {
-                    "start_date": start_date,
-                    "end_date": end_date,
-                },
-                "summary": {
-                    "total_income": str(income_total),
-                    "total_expenses": str(expense_total),
-                    "net_income": str(net_income),
-                    "transaction_count": transactions.count(),
-                },
-                "income_by_category": list(income_by_category),
-                "expense_by_category": list(expense_by_category),
-            }
+        if serializer.validated_data.get("property"):
+            templates = templates.filter(property_obj=serializer.validated_data["property"])
+        templates = list(templates)
+
+        # Occurrences generated by earlier runs, so repeated calls don't duplicate rows
+        existing = set(
+            FinancialTransaction.objects.filter(
+                property_obj__in={t.property_obj_id for t in templates},
+                is_recurring=False,
+                transaction_date__lte=end_date,
+            ).values_list("property_obj_id", "transaction_type", "category", "amount", "transaction_date")
         )
 
+        occurrences = []
+        for template in templates:
+            months = RECURRING_FREQUENCY_MONTHS[template.recurring_frequency]
+            step = 1
+            occurrence_date = _add_months(template.transaction_date, months)
+            while occurrence_date <= end_date:
+                key = (
+                    template.property_obj_id,
+                    template.transaction_type,
+                    template.category,
+                    template.amount,
+                    occurrence_date,
+                )
+                if key not in existing:
+                    occurrences.append(
+                        FinancialTransaction(
+                            property_obj_id=template.property_obj_id,
+                            transaction_type=template.transaction_type,
+                            category=template.category,
+                            amount=template.amount,
+                            amount_cents=template.amount_cents,
+                            is_expense=template.is_expense,
+                            description=template.description,
+                            transaction_date=occurrence_date,
+                            lease_id=template.lease_id,
+                            maintenance_request_id=template.maintenance_request_id,
+                            vendor_name=template.vendor_name,
+                            recorded_by=request.user,
+                        )
+                    )
+                step += 1
+                occurrence_date = _add_months(template.transaction_date, months * step)
+
+        # One multi-row INSERT per batch instead of a save() per occurrence
+        with transaction.atomic():
+            created = FinancialTransaction.objects.bulk_create(occurrences, batch_size=1000)
+
+        # bulk_create skips post_save, so invalidate cached summaries here
+        for owner_id in {t.property_obj.owner_id for t in templates}:
+            bump_summary_version(owner_id)
+
+        return Response({"created": len(created)}, status=status.HTTP_201_CREATED)
+
 
 class AccountingPeriodFilter(django_filters.FilterSet):
     property = django_filters.NumberFilter(field_name="property_obj", lookup_expr="exact")
@@ -127,9 +274,10 @@ class AccountingPeriodViewSet(viewsets.ModelViewSet):
 
     GET /api/accounting/periods/ - List accounting periods
     POST /api/accounting/periods/ - Create accounting period
-    GET /api/accounting/periods/{id}/ - Get period details
+    GET /api/accounting/periods/{id}/ - Get period details with its transactions
     PUT /api/accounting/periods/{id}/ - Update period
     POST /api/accounting/periods/{id}/close/ - Close accounting period
+    POST /api/accounting/periods/{id}/close/?bulk=true - Close all open periods with the same date range
     """
 
     serializer_class = AccountingPeriodSerializer
@@ -143,28 +291,76 @@ class AccountingPeriodViewSet(viewsets.ModelViewSet):
         """Filter accounting periods by user permissions"""
         user = self.request.user
 
+        queryset = AccountingPeriod.objects.select_related("property_obj", "closed_by")
+        if self.action == "list":
+            # Compute the margin in SQL rather than per row in Python, rounded like the model
+            # property. The float cast keeps SQLite from dividing the stored values as integers.
+            queryset = queryset.annotate(
+                profit_margin_db=Case(
+                    When(total_income=0, then=Value(0.0)),
+                    default=Round(Cast("net_income", FloatField()) * 100 / F("total_income"), 2),
+                    output_field=FloatField(),
+                )
+            )
+
         if user.user_type == "admin":
-            return AccountingPeriod.objects.all()
+            return queryset
         elif user.user_type in ["owner", "manager"]:
-            return AccountingPeriod.objects.filter(property_obj__owner=user)
+            return queryset.filter(property_obj__owner=user)
         else:
             return AccountingPeriod.objects.none()
 
+    def get_serializer_class(self):
+        if self.action == "retrieve":
+            return AccountingPeriodDetailSerializer
+        return super().get_serializer_class()
+
+    def get_object(self):
+        period = super().get_object()
+
+        if self.action == "retrieve":
+            # Push the period's date range into the prefetch so only in-period rows
+            # (and only the columns shown) are loaded, in one query
+            prefetch_related_objects(
+                [period],
+                Prefetch(
+                    "property_obj__financial_transactions",
+                    queryset=FinancialTransaction.objects.filter(
+                        transaction_date__gte=period.period_start,
+                        transaction_date__lte=period.period_end,
+                    ).only("id", "property_obj", "transaction_type", "category", "amount", "transaction_date"),
+                    to_attr="period_transactions",
+                ),
+            )
+
+        return period
+
     @action(detail=True, methods=["post"])
     def close(self, request, pk=None):
         """Close an accounting period"""
+        # get_queryset() already scopes periods to the user's properties (admins see all),
+        # so other users' periods 404 here without fetching the property or its owner
         period = self.get_object()
 
-        # Check permissions
-        if period.property_obj.owner != request.user and request.user.user_type != "admin":
-            return Response(
-                {"error": "You do not have permission to close this period"},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
         if period.is_closed:
             return Response({"error": "Period is already closed"}, status=status.HTTP_400_BAD_REQUEST)
 
+        if request.query_params.get("bulk") == "true":
+            # Close every open period for the same date range across the user's properties
+            period_ids = list(
+                self.get_queryset()
+                .filter(period_start=period.period_start, period_end=period.period_end, is_closed=False)
+                .values_list("id", flat=True)
+            )
+            periods = AccountingPeriod.objects.filter(id__in=period_ids)
+            now = timezone.now()
+            with transaction.atomic():
+                AccountingPeriod.recompute_bulk(periods)
+                periods.update(is_closed=True, closed_at=now, closed_by=request.user, updated_at=now)
+
+            serializer = self.get_serializer(periods.select_related("property_obj", "closed_by"), many=True)
+            return Response(serializer.data)
+
         # Calculate final totals
         period.calculate_totals()
         period.is_closed = True
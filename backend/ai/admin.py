@@ -5,6 +5,7 @@ Django admin configuration for AI models.
 
 from django.contrib import admin
 from .models import (
+    AIModel,
     AIProcessingResult,
     LeaseAnalysis,
     TenantApplicationAnalysis,
@@ -17,6 +18,14 @@ from .models import (
 )
 
 
+@admin.register(AIModel)
+class AIModelAdmin(admin.ModelAdmin):
+    """Admin for the AI model lookup table."""
+
+    list_display = ['id', 'name']
+    search_fields = ['name']
+
+
 @admin.register(AIProcessingResult)
 class AIProcessingResultAdmin(admin.ModelAdmin):
     """Admin for AI processing results."""
@@ -25,14 +34,15 @@ class AIProcessingResultAdmin(admin.ModelAdmin):
         'id', 'processing_type', 'status', 'ai_model_used',
         'confidence_score', 'created_at', 'created_by'
     ]
-    list_filter = ['processing_type', 'status', 'ai_model_used', 'created_at']
+    list_select_related = ('created_by',)
+    list_filter = ['processing_type', 'status', 'ai_model', 'created_at']
     search_fields = ['input_text', 'generated_content']
     readonly_fields = ['id', 'created_at', 'updated_at']
     ordering = ['-created_at']
 
     fieldsets = (
         ('Processing Info', {
-            'fields': ('processing_type', 'ai_model_used', 'status', 'confidence_score')
+            'fields': ('processing_type', 'ai_model', 'status', 'confidence_score')
         }),
         ('Related Entities', {
             'fields': ('property_obj', 'tenant', 'lease', 'maintenance_request'),
@@ -61,6 +71,7 @@ class LeaseAnalysisAdmin(admin.ModelAdmin):
         'id', 'tenant_name', 'monthly_rent', 'lease_start_date',
         'extraction_quality', 'ai_result'
     ]
+    list_select_related = ('ai_result',)
     list_filter = ['extraction_quality', 'lease_start_date', 'lease_end_date']
     search_fields = ['tenant_name', 'property_address', 'special_terms']
     readonly_fields = ['id']
@@ -88,6 +99,7 @@ class TenantApplicationAnalysisAdmin(admin.ModelAdmin):
         'id', 'applicant_name', 'monthly_income', 'risk_assessment',
         'ai_result'
     ]
+    list_select_related = ('ai_result',)
     list_filter = ['risk_assessment', 'employment_status']
     search_fields = ['applicant_name', 'email', 'current_address']
     readonly_fields = ['id']
@@ -118,6 +130,7 @@ class MaintenanceAnalysisAdmin(admin.ModelAdmin):
         'id', 'priority_assessment', 'estimated_cost_min',
         'vendor_needed', 'ai_result'
     ]
+    list_select_related = ('ai_result',)
     list_filter = ['priority_assessment', 'vendor_needed', 'follow_up_required']
     search_fields = ['approach_recommendation', 'safety_concerns']
     readonly_fields = ['id']
@@ -149,6 +162,7 @@ class PropertyInspectionAdmin(admin.ModelAdmin):
         'id', 'inspection_type', 'room_area', 'overall_condition',
         'urgency_level', 'estimated_repair_cost', 'ai_result'
     ]
+    list_select_related = ('ai_result',)
     list_filter = ['inspection_type', 'overall_condition', 'urgency_level']
     search_fields = ['room_area', 'damage_description', 'safety_concerns']
     readonly_fields = ['id']
@@ -180,9 +194,10 @@ class WorkCompletionAnalysisAdmin(admin.ModelAdmin):
         'id', 'completion_quality', 'compliance_check',
         'monitoring_needed', 'ai_result'
     ]
+    list_select_related = ('ai_result',)
     list_filter = ['completion_quality', 'compliance_check', 'monitoring_needed']
     search_fields = ['workmanship_quality', 'follow_up_work']
-    readonly_fields = ['id']
+    readonly_fields = ['id', 'maintenance_request']
 
     fieldsets = (
         ('Work Assessment', {
@@ -211,6 +226,7 @@ class FinancialAnalysisAdmin(admin.ModelAdmin):
         'id', 'analysis_period', 'report_type', 'profitability_rating',
         'investment_rating', 'ai_result'
     ]
+    list_select_related = ('ai_result',)
     list_filter = ['analysis_period', 'report_type', 'profitability_rating', 'investment_rating']
     search_fields = ['benchmarking_insights', 'recommendations']
     readonly_fields = ['id']
@@ -249,6 +265,7 @@ class VoiceInteractionAdmin(admin.ModelAdmin):
         'id', 'interaction_type', 'detected_intent', 'intent_confidence',
         'needs_clarification', 'action_taken', 'ai_result'
     ]
+    list_select_related = ('ai_result',)
     list_filter = ['interaction_type', 'detected_intent', 'needs_clarification']
     search_fields = ['audio_transcript', 'response_text', 'detected_intent']
     readonly_fields = ['id']
@@ -283,6 +300,7 @@ class VoiceReportAdmin(admin.ModelAdmin):
         'id', 'report_type', 'property_obj', 'audio_duration_seconds',
         'ai_result'
     ]
+    list_select_related = ('ai_result', 'property_obj')
     list_filter = ['report_type']
     search_fields = ['report_text']
     readonly_fields = ['id']
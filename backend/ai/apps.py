@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class AiConfig(AppConfig):
     name = 'ai'
+
+    def ready(self):
+        from .serializers import prebuild_serializer_fields
+
+        prebuild_serializer_fields()
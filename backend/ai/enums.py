@@ -0,0 +1,141 @@
+"""
+AI choice enums for TenantBase
+Choice sets shared by the AI models, defined once at import.
+"""
+
+from django.db import models
+
+
+class ProcessingType(models.TextChoices):
+    """Kind of AI processing performed."""
+
+    LEASE_ANALYSIS = 'lease_analysis', 'Lease Document Analysis'
+    TENANT_APPLICATION = 'tenant_application', 'Tenant Application Analysis'
+    MAINTENANCE_REQUEST = 'maintenance_request', 'Maintenance Request Analysis'
+    PROPERTY_INSPECTION = 'property_inspection', 'Property Inspection Analysis'
+    COMMUNICATION = 'communication', 'Generated Communication'
+    FINANCIAL_ANALYSIS = 'financial_analysis', 'Financial Report Analysis'
+
+
+class ProcessingStatus(models.TextChoices):
+    """Status of an AI processing run."""
+
+    PENDING = 'pending', 'Pending'
+    PROCESSING = 'processing', 'Processing'
+    COMPLETED = 'completed', 'Completed'
+    FAILED = 'failed', 'Failed'
+
+
+class ExtractionQuality(models.TextChoices):
+    """Quality of data extracted from a document."""
+
+    EXCELLENT = 'excellent', 'Excellent'
+    GOOD = 'good', 'Good'
+    FAIR = 'fair', 'Fair'
+    POOR = 'poor', 'Poor'
+
+
+class RiskAssessment(models.TextChoices):
+    """Risk level of a tenant application."""
+
+    LOW = 'low', 'Low Risk'
+    MEDIUM = 'medium', 'Medium Risk'
+    HIGH = 'high', 'High Risk'
+
+
+class PriorityLevel(models.TextChoices):
+    """Priority or urgency of a maintenance issue."""
+
+    LOW = 'low', 'Low'
+    MEDIUM = 'medium', 'Medium'
+    HIGH = 'high', 'High'
+    EMERGENCY = 'emergency', 'Emergency'
+
+
+class InspectionType(models.TextChoices):
+    """Kind of property inspection."""
+
+    INITIAL = 'initial', 'Initial Inspection'
+    MOVE_IN = 'move_in', 'Move-in Inspection'
+    MOVE_OUT = 'move_out', 'Move-out Inspection'
+    MAINTENANCE = 'maintenance', 'Maintenance Inspection'
+    ANNUAL = 'annual', 'Annual Inspection'
+    DAMAGE_ASSESSMENT = 'damage_assessment', 'Damage Assessment'
+
+
+class ConditionRating(models.TextChoices):
+    """Condition or profitability rating from poor to excellent."""
+
+    EXCELLENT = 'excellent', 'Excellent'
+    GOOD = 'good', 'Good'
+    FAIR = 'fair', 'Fair'
+    POOR = 'poor', 'Poor'
+    CRITICAL = 'critical', 'Critical'
+
+
+class CompletionQuality(models.TextChoices):
+    """Quality of completed maintenance work."""
+
+    EXCELLENT = 'excellent', 'Excellent'
+    GOOD = 'good', 'Good'
+    SATISFACTORY = 'satisfactory', 'Satisfactory'
+    POOR = 'poor', 'Poor'
+    INCOMPLETE = 'incomplete', 'Incomplete'
+
+
+class ComplianceStatus(models.TextChoices):
+    """Compliance outcome of completed work."""
+
+    COMPLIANT = 'compliant', 'Compliant'
+    NON_COMPLIANT = 'non_compliant', 'Non-compliant'
+    UNKNOWN = 'unknown', 'Unknown'
+
+
+class AnalysisPeriod(models.TextChoices):
+    """Period covered by a financial analysis."""
+
+    THREE_MONTHS = '3_months', '3 Months'
+    SIX_MONTHS = '6_months', '6 Months'
+    TWELVE_MONTHS = '12_months', '12 Months'
+    TWENTY_FOUR_MONTHS = '24_months', '24 Months'
+    CUSTOM = 'custom', 'Custom Period'
+
+
+class FinancialReportType(models.TextChoices):
+    """Kind of financial analysis report."""
+
+    MONTHLY = 'monthly', 'Monthly Report'
+    QUARTERLY = 'quarterly', 'Quarterly Report'
+    ANNUAL = 'annual', 'Annual Report'
+    INVESTMENT = 'investment', 'Investment Analysis'
+    FORECAST = 'forecast', 'Financial Forecast'
+
+
+class InvestmentRating(models.TextChoices):
+    """Investment quality rating."""
+
+    EXCELLENT = 'excellent', 'Excellent Investment'
+    GOOD = 'good', 'Good Investment'
+    FAIR = 'fair', 'Fair Investment'
+    POOR = 'poor', 'Poor Investment'
+    HIGH_RISK = 'high_risk', 'High Risk - Avoid'
+
+
+class InteractionType(models.TextChoices):
+    """Kind of voice interaction."""
+
+    COMMAND = 'command', 'Voice Command'
+    REPORT = 'report', 'Voice Report'
+    STATUS_CHECK = 'status_check', 'Status Check'
+    REMINDER = 'reminder', 'Voice Reminder'
+    HELP = 'help', 'Help Request'
+
+
+class VoiceReportType(models.TextChoices):
+    """Kind of generated voice report."""
+
+    PROPERTY_STATUS = 'property_status', 'Property Status Report'
+    FINANCIAL_SUMMARY = 'financial_summary', 'Financial Summary'
+    MAINTENANCE_OVERVIEW = 'maintenance_overview', 'Maintenance Overview'
+    OCCUPANCY_UPDATE = 'occupancy_update', 'Occupancy Update'
+    URGENT_ALERTS = 'urgent_alerts', 'Urgent Alerts'
@@ -0,0 +1,46 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from ai.enums import ProcessingStatus
+from ai.models import AIProcessingResult
+
+
+class Command(BaseCommand):
+    help = "Delete old AI processing results (and their analyses) in batches to bound table growth"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=365, help="Delete results older than this many days (default: 365)")
+        parser.add_argument(
+            "--status", choices=ProcessingStatus.values, help="Only delete results with this status (default: any)"
+        )
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows deleted per statement (default: 1000)")
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Show what would be deleted without actually doing it"
+        )
+
+    def handle(self, *args, **options):
+        cutoff_date = timezone.now() - timedelta(days=options["days"])
+
+        # created_at range scan, served by the BRIN index on PostgreSQL
+        old_results = AIProcessingResult.objects.filter(created_at__lt=cutoff_date)
+        if options["status"]:
+            old_results = old_results.filter(status=options["status"])
+
+        if options["dry_run"]:
+            count = old_results.count()
+            self.stdout.write(f"DRY RUN: Would delete {count} AI results older than {cutoff_date.date()}")
+            return
+
+        # Delete oldest-first in bounded batches so no single transaction
+        # holds locks on (or cascades through) the whole range at once
+        deleted = 0
+        while True:
+            ids = list(old_results.order_by("created_at").values_list("id", flat=True)[: options["batch_size"]])
+            if not ids:
+                break
+            AIProcessingResult.objects.filter(id__in=ids).delete()
+            deleted += len(ids)
+
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} AI results older than {cutoff_date.date()}"))
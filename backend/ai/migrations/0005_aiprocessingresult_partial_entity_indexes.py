@@ -0,0 +1,106 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:50
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("properties", "0003_property_version_alter_property_annual_property_tax_and_more"),
+        ("leases", "0003_lease_version_alter_lease_deposit_amount_and_more"),
+        ("tenants", "0001_initial"),
+        ("maintenance", "0002_initial"),
+        ("ai", "0004_voicereport_voiceinteraction"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="aiprocessingresult",
+            name="ai_aiproces_propert_033186_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="aiprocessingresult",
+            name="ai_aiproces_tenant__ace0e3_idx",
+        ),
+        migrations.AlterField(
+            model_name="aiprocessingresult",
+            name="lease",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="ai_processing_results",
+                to="leases.lease",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="aiprocessingresult",
+            name="maintenance_request",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="ai_processing_results",
+                to="maintenance.maintenancerequest",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="aiprocessingresult",
+            name="property_obj",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="ai_processing_results",
+                to="properties.property",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="aiprocessingresult",
+            name="tenant",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="ai_processing_results",
+                to="tenants.tenant",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="aiprocessingresult",
+            index=models.Index(
+                condition=models.Q(("property_obj__isnull", False)),
+                fields=["property_obj", "processing_type", "-created_at"],
+                name="ai_result_property_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="aiprocessingresult",
+            index=models.Index(
+                condition=models.Q(("tenant__isnull", False)),
+                fields=["tenant", "processing_type", "-created_at"],
+                name="ai_result_tenant_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="aiprocessingresult",
+            index=models.Index(
+                condition=models.Q(("lease__isnull", False)),
+                fields=["lease"],
+                name="ai_result_lease_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="aiprocessingresult",
+            index=models.Index(
+                condition=models.Q(("maintenance_request__isnull", False)),
+                fields=["maintenance_request"],
+                name="ai_result_maintenance_idx",
+            ),
+        ),
+    ]
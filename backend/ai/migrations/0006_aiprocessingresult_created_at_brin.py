@@ -0,0 +1,46 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:52
+
+from django.db import migrations, models
+
+# Results are append-only, so created_at follows physical row order and a
+# BRIN index covers time-range scans at a fraction of a btree's size.
+# PostgreSQL only.
+CREATE_BRIN_SQL = """
+CREATE INDEX IF NOT EXISTS ai_result_created_brin
+    ON ai_aiprocessingresult USING brin (created_at) WITH (pages_per_range = 32);
+"""
+
+DROP_BRIN_SQL = "DROP INDEX IF EXISTS ai_result_created_brin;"
+
+
+def create_brin(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(CREATE_BRIN_SQL)
+
+
+def drop_brin(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_BRIN_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0005_aiprocessingresult_partial_entity_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="aiprocessingresult",
+            name="ai_aiproces_created_93b606_idx",
+        ),
+        migrations.AddIndex(
+            model_name="aiprocessingresult",
+            index=models.Index(
+                fields=["-created_at"],
+                include=("processing_type", "status"),
+                name="ai_result_recent_idx",
+            ),
+        ),
+        migrations.RunPython(create_brin, drop_brin),
+    ]
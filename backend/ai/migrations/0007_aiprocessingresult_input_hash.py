@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0006_aiprocessingresult_created_at_brin"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="aiprocessingresult",
+            name="input_hash",
+            field=models.BinaryField(
+                blank=True,
+                help_text="SHA-256 of model, processing type and full input, for reusing completed results",
+                max_length=32,
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="aiprocessingresult",
+            index=models.Index(
+                condition=models.Q(("status", "completed")),
+                fields=["input_hash"],
+                name="ai_input_hash_idx",
+            ),
+        ),
+    ]
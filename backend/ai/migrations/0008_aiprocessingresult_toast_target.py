@@ -0,0 +1,29 @@
+from django.db import migrations
+
+# Move input_text/generated_content out of line sooner (default target is
+# ~2 kB) so heap rows stay small and metadata scans touch fewer pages.
+# PostgreSQL only.
+SET_TOAST_TARGET_SQL = "ALTER TABLE ai_aiprocessingresult SET (toast_tuple_target = 256);"
+
+RESET_TOAST_TARGET_SQL = "ALTER TABLE ai_aiprocessingresult RESET (toast_tuple_target);"
+
+
+def set_toast_target(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(SET_TOAST_TARGET_SQL)
+
+
+def reset_toast_target(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(RESET_TOAST_TARGET_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0007_aiprocessingresult_input_hash"),
+    ]
+
+    operations = [
+        migrations.RunPython(set_toast_target, reset_toast_target),
+    ]
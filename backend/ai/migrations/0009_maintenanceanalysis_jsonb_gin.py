@@ -0,0 +1,37 @@
+from django.db import migrations
+
+# GIN indexes for containment (@>) lookups on the skill/part lists, e.g.
+# required_skills__contains=["HVAC"]. jsonb_path_ops is smaller than the
+# default opclass and only needs to support @>. PostgreSQL only.
+CREATE_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS ai_maint_skills_gin
+    ON ai_maintenanceanalysis USING gin (required_skills jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS ai_maint_parts_gin
+    ON ai_maintenanceanalysis USING gin (parts_needed jsonb_path_ops);
+"""
+
+DROP_INDEX_SQL = """
+DROP INDEX IF EXISTS ai_maint_skills_gin;
+DROP INDEX IF EXISTS ai_maint_parts_gin;
+"""
+
+
+def create_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(CREATE_INDEX_SQL)
+
+
+def drop_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_INDEX_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0008_aiprocessingresult_toast_target"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0009_maintenanceanalysis_jsonb_gin"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="voiceinteraction",
+            name="audio_file_url",
+            field=models.TextField(blank=True, help_text="URL to stored audio file", null=True),
+        ),
+        migrations.AlterField(
+            model_name="voiceinteraction",
+            name="response_audio_url",
+            field=models.TextField(
+                blank=True, help_text="URL to generated audio response", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="voicereport",
+            name="report_audio_url",
+            field=models.TextField(
+                blank=True, help_text="URL to the generated audio report", null=True
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="voiceinteraction",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    ("audio_file_url__startswith", "https://"),
+                    ("audio_file_url__startswith", "/"),
+                    ("audio_file_url", ""),
+                    ("audio_file_url__isnull", True),
+                    _connector="OR",
+                ),
+                name="ai_voice_audio_url_check",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="voiceinteraction",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    ("response_audio_url__startswith", "https://"),
+                    ("response_audio_url__startswith", "/"),
+                    ("response_audio_url", ""),
+                    ("response_audio_url__isnull", True),
+                    _connector="OR",
+                ),
+                name="ai_voice_response_url_check",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="voicereport",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    ("report_audio_url__startswith", "https://"),
+                    ("report_audio_url__startswith", "/"),
+                    ("report_audio_url", ""),
+                    ("report_audio_url__isnull", True),
+                    _connector="OR",
+                ),
+                name="ai_report_audio_url_check",
+            ),
+        ),
+    ]
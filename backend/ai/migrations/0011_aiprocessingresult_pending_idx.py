@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0010_voice_audio_url_text"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="aiprocessingresult",
+            index=models.Index(
+                condition=models.Q(("status__in", ["pending", "processing"])),
+                fields=["processing_type", "created_at"],
+                name="ai_pending_idx",
+            ),
+        ),
+    ]
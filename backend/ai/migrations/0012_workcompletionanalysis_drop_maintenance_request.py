@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:06
+
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def copy_maintenance_request_to_result(apps, schema_editor):
+    """Keep the link on the parent result for analyses where only the child had it"""
+    AIProcessingResult = apps.get_model("ai", "AIProcessingResult")
+    WorkCompletionAnalysis = apps.get_model("ai", "WorkCompletionAnalysis")
+    child_request = WorkCompletionAnalysis.objects.filter(ai_result=OuterRef("pk")).values("maintenance_request")[:1]
+    AIProcessingResult.objects.filter(
+        maintenance_request__isnull=True,
+        work_completion_analysis__maintenance_request__isnull=False,
+    ).update(maintenance_request=Subquery(child_request))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0011_aiprocessingresult_pending_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_maintenance_request_to_result, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name="workcompletionanalysis",
+            name="maintenance_request",
+        ),
+    ]
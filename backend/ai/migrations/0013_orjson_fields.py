@@ -0,0 +1,174 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:08
+
+import core.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0012_workcompletionanalysis_drop_maintenance_request"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="aiprocessingresult",
+            name="structured_output",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="Structured JSON output from AI processing", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="financialanalysis",
+            name="expected_returns",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="Projected returns and IRR calculations", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="financialanalysis",
+            name="financial_ratios",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="Key financial ratios and metrics", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="financialanalysis",
+            name="forecasts",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="Financial projections and forecasts", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="financialanalysis",
+            name="market_analysis",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="Market conditions and competitive positioning", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="financialanalysis",
+            name="recommendations",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="Specific recommendations for improvement", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="financialanalysis",
+            name="risk_assessment",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="Financial risks and mitigation strategies", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="financialanalysis",
+            name="trend_analysis",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="Revenue, expense, and profit trends", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="leaseanalysis",
+            name="utilities_included",
+            field=core.fields.OrjsonField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="maintenanceanalysis",
+            name="parts_needed",
+            field=core.fields.OrjsonField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="maintenanceanalysis",
+            name="required_skills",
+            field=core.fields.OrjsonField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="propertyinspection",
+            name="maintenance_items",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="List of maintenance items identified", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="propertyinspection",
+            name="photo_urls",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="URLs or references to inspection photos", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="tenantapplicationanalysis",
+            name="concerns",
+            field=core.fields.OrjsonField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="voiceinteraction",
+            name="action_result",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="Result of the action taken", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="voiceinteraction",
+            name="extracted_parameters",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="Parameters extracted from voice command", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="voiceinteraction",
+            name="suggested_follow_ups",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="Suggested follow-up actions or questions", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="voicereport",
+            name="key_highlights",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="Key highlights or summary points", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="voicereport",
+            name="recommended_actions",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="Recommended actions from the report", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="voicereport",
+            name="urgent_items",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="Urgent items mentioned in the report", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="workcompletionanalysis",
+            name="after_photo_urls",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="URLs to after-work photos", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="workcompletionanalysis",
+            name="before_photo_urls",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="URLs to before-work photos", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="workcompletionanalysis",
+            name="issues_resolved",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="List of issues that appear resolved", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="workcompletionanalysis",
+            name="remaining_issues",
+            field=core.fields.OrjsonField(
+                blank=True, help_text="Any remaining problems identified", null=True
+            ),
+        ),
+    ]
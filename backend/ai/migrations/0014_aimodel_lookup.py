@@ -0,0 +1,78 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+# Models the views currently call, so the common lookups never need an insert
+SEED_MODELS = ["gemini-2.5-flash", "gemini-2.5-pro"]
+
+
+def populate_ai_models(apps, schema_editor):
+    """Move the model names into the lookup table and point each result at its row"""
+    AIModel = apps.get_model("ai", "AIModel")
+    AIProcessingResult = apps.get_model("ai", "AIProcessingResult")
+    names = set(AIProcessingResult.objects.values_list("ai_model_used", flat=True).distinct())
+    AIModel.objects.bulk_create(
+        [AIModel(name=name) for name in sorted(names | set(SEED_MODELS))], ignore_conflicts=True
+    )
+    AIProcessingResult.objects.update(
+        ai_model=Subquery(AIModel.objects.filter(name=OuterRef("ai_model_used")).values("pk")[:1])
+    )
+
+
+def restore_ai_model_names(apps, schema_editor):
+    AIModel = apps.get_model("ai", "AIModel")
+    AIProcessingResult = apps.get_model("ai", "AIProcessingResult")
+    AIProcessingResult.objects.update(
+        ai_model_used=Subquery(AIModel.objects.filter(pk=OuterRef("ai_model")).values("name")[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0013_orjson_fields"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AIModel",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "name",
+                    models.CharField(help_text="AI model name (e.g., gemini-2.5-pro)", max_length=100, unique=True),
+                ),
+            ],
+            options={
+                "ordering": ["name"],
+            },
+        ),
+        migrations.AddField(
+            model_name="aiprocessingresult",
+            name="ai_model",
+            field=models.ForeignKey(
+                help_text="AI model used for processing",
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="results",
+                to="ai.aimodel",
+            ),
+        ),
+        migrations.RunPython(populate_ai_models, restore_ai_model_names),
+        migrations.AlterField(
+            model_name="aiprocessingresult",
+            name="ai_model",
+            field=models.ForeignKey(
+                help_text="AI model used for processing",
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="results",
+                to="ai.aimodel",
+            ),
+        ),
+        migrations.RemoveField(
+            model_name="aiprocessingresult",
+            name="ai_model_used",
+        ),
+    ]
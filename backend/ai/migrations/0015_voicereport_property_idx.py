@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:16
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("properties", "0003_property_version_alter_property_annual_property_tax_and_more"),
+        ("ai", "0014_aimodel_lookup"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="voicereport",
+            name="ai_voicerep_report__af4f8d_idx",
+        ),
+        migrations.AlterField(
+            model_name="voicereport",
+            name="property_obj",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="voice_reports",
+                to="properties.property",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="voicereport",
+            index=models.Index(
+                fields=["property_obj", "report_type"], name="ai_voicerep_propert_192b71_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations
+
+# Every model name the services can pick, so results never need to create
+# a lookup row (see pick_extraction_model for flash-lite)
+SEED_MODELS = ["gemini-2.5-flash", "gemini-2.5-flash-lite", "gemini-2.5-pro"]
+
+
+def seed_ai_models(apps, schema_editor):
+    AIModel = apps.get_model("ai", "AIModel")
+    AIModel.objects.bulk_create([AIModel(name=name) for name in SEED_MODELS], ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0015_voicereport_property_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_ai_models, migrations.RunPython.noop),
+    ]
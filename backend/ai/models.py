@@ -3,28 +3,186 @@ AI Models for TenantBase
 Stores AI processing results, analysis data, and metadata.
 """
 
-from django.db import models
+import hashlib
+from collections import defaultdict
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Concat
 from django.conf import settings
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+from core.fields import OrjsonField
+
+from .enums import (
+    AnalysisPeriod,
+    ComplianceStatus,
+    CompletionQuality,
+    ConditionRating,
+    ExtractionQuality,
+    FinancialReportType,
+    InspectionType,
+    InteractionType,
+    InvestmentRating,
+    PriorityLevel,
+    ProcessingStatus,
+    ProcessingType,
+    RiskAssessment,
+    VoiceReportType,
+)
+
+
+# Display templates for MaintenanceAnalysis.estimated_cost_range, keyed by
+# which bounds are set. Rendered with format_map so model instances and
+# fast_list .values() rows share one formatter.
+COST_RANGE_TEMPLATES = {
+    (True, True): '${estimated_cost_min:.2f} - ${estimated_cost_max:.2f}',
+    (True, False): 'From ${estimated_cost_min:.2f}',
+    (False, True): 'Up to ${estimated_cost_max:.2f}',
+}
+
+
+def _full_name(tenant_path):
+    """SQL for Tenant.full_name along tenant_path, NULL when there is no tenant."""
+    return Case(When(
+        **{f'{tenant_path}__isnull': False},
+        then=Concat(f'{tenant_path}__first_name', Value(' '), f'{tenant_path}__last_name'),
+    ))
+
+
+class AIProcessingResultQuerySet(models.QuerySet):
+    """QuerySet helpers for AI processing results."""
+
+    # processing_type -> reverse one-to-one accessor of its analysis model
+    SUBTYPE_RELATIONS = {
+        'lease_analysis': 'lease_analysis',
+        'tenant_application': 'tenant_application_analysis',
+        'application_analysis': 'tenant_application_analysis',
+        'maintenance_request': 'maintenance_analysis',
+        'property_inspection': 'property_inspection',
+        'work_completion': 'work_completion_analysis',
+        'financial_analysis': 'financial_analysis',
+        'financial_report': 'financial_analysis',
+        'voice_command': 'voice_interaction',
+        'voice_report': 'voice_report',
+    }
+
+    def with_subtypes(self, types=None):
+        """
+        Join the analysis rows for the given processing types (all by default)
+        so reading e.g. result.lease_analysis doesn't cost a query per row.
+        """
+        relations = {self.SUBTYPE_RELATIONS[t] for t in (types or self.SUBTYPE_RELATIONS)}
+        return self.select_related('created_by', *sorted(relations))
+
+    def with_entity_names(self):
+        """
+        Annotate the related names AIProcessingResultSerializer shows
+        (property_name, tenant_name, lease_tenant_name, maintenance_title),
+        so list views read plain columns instead of loading each related row.
+        """
+        return self.annotate(
+            property_name=F('property_obj__property_name'),
+            tenant_name=_full_name('tenant'),
+            lease_tenant_name=_full_name('lease__tenant'),
+            maintenance_title=F('maintenance_request__title'),
+        )
+
+
+class AIProcessingResultManager(models.Manager.from_queryset(AIProcessingResultQuerySet)):
+    """Leaves the bulky, never-serialized input_text column out of default queries."""
+
+    def get_queryset(self):
+        return super().get_queryset().defer('input_text')
+
+
+class AIModel(models.Model):
+    """Lookup table of AI model names referenced by processing results."""
+
+    name = models.CharField(
+        max_length=100,
+        unique=True,
+        help_text="AI model name (e.g., gemini-2.5-pro)"
+    )
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+    # Rows are only ever added, never renamed, so both directions of the
+    # name <-> id mapping can be cached for the life of the process. Only
+    # committed rows are cached: a row this process creates is remembered
+    # once its transaction commits, so a rollback can't leave its id behind.
+    _ids_by_name = {}
+    _names_by_id = {}
+    _uncommitted = set()
+
+    @classmethod
+    def id_for(cls, name):
+        """Id of the named AI model, created on first use."""
+        pk = cls._ids_by_name.get(name)
+        if pk is None:
+            model, created = cls.objects.get_or_create(name=name)
+            pk = model.pk
+            if created:
+                cls._remember_on_commit(pk, name)
+            else:
+                cls._remember(pk, name)
+        return pk
+
+    @classmethod
+    def name_for(cls, pk):
+        """Name of the AI model with the given id."""
+        name = cls._names_by_id.get(pk)
+        if name is None:
+            name = cls.objects.values_list('name', flat=True).get(pk=pk)
+            cls._remember(pk, name)
+        return name
+
+    @classmethod
+    def _remember(cls, pk, name):
+        # A row created by a transaction still open here waits for its commit
+        if name not in cls._uncommitted:
+            cls._ids_by_name[name] = pk
+            cls._names_by_id[pk] = name
+
+    @classmethod
+    def _remember_on_commit(cls, pk, name):
+        cls._uncommitted.add(name)
+
+        def remember():
+            cls._uncommitted.discard(name)
+            cls._remember(pk, name)
+
+        # Runs straight away outside a transaction; dropped on rollback,
+        # leaving the name uncached
+        transaction.on_commit(remember)
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget the cached name <-> id mapping and any commits still awaited."""
+        cls._ids_by_name.clear()
+        cls._names_by_id.clear()
+        cls._uncommitted.clear()
 
 
 class AIProcessingResult(models.Model):
     """Base model for AI processing results."""
 
-    PROCESSING_TYPES = [
-        ('lease_analysis', 'Lease Document Analysis'),
-        ('tenant_application', 'Tenant Application Analysis'),
-        ('maintenance_request', 'Maintenance Request Analysis'),
-        ('property_inspection', 'Property Inspection Analysis'),
-        ('communication', 'Generated Communication'),
-        ('financial_analysis', 'Financial Report Analysis'),
-    ]
+    PROCESSING_TYPES = ProcessingType.choices
 
-    # Associated entities (nullable foreign keys)
+    # Associated entities (nullable foreign keys). Most rows set only one of
+    # these, so they are indexed by the partial indexes in Meta rather than
+    # the default full-column FK indexes, which would be mostly NULLs.
     property_obj = models.ForeignKey(
         'properties.Property',
         on_delete=models.CASCADE,
         null=True,
         blank=True,
+        db_index=False,
         related_name='ai_processing_results'
     )
     tenant = models.ForeignKey(
@@ -32,6 +190,7 @@ class AIProcessingResult(models.Model):
         on_delete=models.CASCADE,
         null=True,
         blank=True,
+        db_index=False,
         related_name='ai_processing_results'
     )
     lease = models.ForeignKey(
@@ -39,6 +198,7 @@ class AIProcessingResult(models.Model):
         on_delete=models.CASCADE,
         null=True,
         blank=True,
+        db_index=False,
         related_name='ai_processing_results'
     )
     maintenance_request = models.ForeignKey(
@@ -46,18 +206,21 @@ class AIProcessingResult(models.Model):
         on_delete=models.CASCADE,
         null=True,
         blank=True,
+        db_index=False,
         related_name='ai_processing_results'
     )
 
     # AI Processing Details
     processing_type = models.CharField(
         max_length=50,
-        choices=PROCESSING_TYPES,
+        choices=ProcessingType.choices,
         help_text="Type of AI processing performed"
     )
-    ai_model_used = models.CharField(
-        max_length=100,
-        help_text="AI model used for processing (e.g., gemini-2.5-pro)"
+    ai_model = models.ForeignKey(
+        AIModel,
+        on_delete=models.PROTECT,
+        related_name='results',
+        help_text="AI model used for processing"
     )
     confidence_score = models.FloatField(
         null=True,
@@ -69,7 +232,14 @@ class AIProcessingResult(models.Model):
     input_text = models.TextField(
         help_text="Original text input to AI processing"
     )
-    structured_output = models.JSONField(
+    input_hash = models.BinaryField(
+        max_length=32,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="SHA-256 of model, processing type and full input, for reusing completed results"
+    )
+    structured_output = OrjsonField(
         null=True,
         blank=True,
         help_text="Structured JSON output from AI processing"
@@ -102,12 +272,7 @@ class AIProcessingResult(models.Model):
     # Status and Error Handling
     status = models.CharField(
         max_length=20,
-        choices=[
-            ('pending', 'Pending'),
-            ('processing', 'Processing'),
-            ('completed', 'Completed'),
-            ('failed', 'Failed'),
-        ],
+        choices=ProcessingStatus.choices,
         default='pending'
     )
     error_message = models.TextField(
@@ -127,17 +292,191 @@ class AIProcessingResult(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = AIProcessingResultManager()
+
     class Meta:
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['processing_type', 'status']),
-            models.Index(fields=['created_at']),
-            models.Index(fields=['property_obj', 'processing_type']),
-            models.Index(fields=['tenant', 'processing_type']),
+            # Newest-first listings (default ordering) as an index-only scan;
+            # "last N days" range scans use the BRIN index added in migration 0006.
+            models.Index(
+                fields=['-created_at'],
+                include=['processing_type', 'status'],
+                name='ai_result_recent_idx'
+            ),
+            # "Latest results of type T for entity X" as a single range scan
+            models.Index(
+                fields=['property_obj', 'processing_type', '-created_at'],
+                condition=models.Q(property_obj__isnull=False),
+                name='ai_result_property_idx'
+            ),
+            models.Index(
+                fields=['tenant', 'processing_type', '-created_at'],
+                condition=models.Q(tenant__isnull=False),
+                name='ai_result_tenant_idx'
+            ),
+            models.Index(
+                fields=['lease'],
+                condition=models.Q(lease__isnull=False),
+                name='ai_result_lease_idx'
+            ),
+            models.Index(
+                fields=['maintenance_request'],
+                condition=models.Q(maintenance_request__isnull=False),
+                name='ai_result_maintenance_idx'
+            ),
+            # Worker queue polls only ever read the few unfinished rows
+            models.Index(
+                fields=['processing_type', 'created_at'],
+                condition=models.Q(status__in=['pending', 'processing']),
+                name='ai_pending_idx'
+            ),
+            # Exact-duplicate lookups only ever want a completed result
+            models.Index(
+                fields=['input_hash'],
+                condition=models.Q(status='completed'),
+                name='ai_input_hash_idx'
+            ),
         ]
 
     def __str__(self):
-        return f"{self.processing_type} - {self.status} ({self.created_at.date()})"
+        # Format the timestamp directly instead of building a date per row;
+        # unsaved results have no created_at yet
+        created = f"{self.created_at:%Y-%m-%d}" if self.created_at else "unsaved"
+        return f"{self.processing_type} - {self.status} ({created})"
+
+    @property
+    def ai_model_used(self):
+        """Name of the AI model used, e.g. gemini-2.5-pro"""
+        return AIModel.name_for(self.ai_model_id) if self.ai_model_id else None
+
+    @ai_model_used.setter
+    def ai_model_used(self, name):
+        self.ai_model_id = AIModel.id_for(name)
+
+    def save(self, *args, **kwargs):
+        self._fill_input_hash()
+        try:
+            super().save(*args, **kwargs)
+        except IntegrityError:
+            # A cached model id may point at a row that no longer exists
+            AIModel.clear_cache()
+            raise
+
+    def _fill_input_hash(self):
+        """Fill in input_hash from the stored input when the caller didn't supply one"""
+        if self.input_hash is None and 'input_text' not in self.get_deferred_fields() and self.input_text:
+            self.input_hash = self.hash_input(self.input_text, self.ai_model_used, self.processing_type)
+
+    @staticmethod
+    def hash_input(input_text, ai_model_used, processing_type):
+        """
+        Digest identifying an AI call. Pass the full input, not the truncated
+        input_text that gets stored, so long documents don't collide.
+        """
+        digest = hashlib.sha256(f"{ai_model_used}:{processing_type}:".encode())
+        digest.update(input_text.encode())
+        return digest.digest()
+
+    @classmethod
+    def bulk_persist(cls, payloads, batch_size=None):
+        """
+        Insert many results and their analysis rows in batched INSERTs.
+
+        Args:
+            payloads: Iterable of (result, analysis) pairs of unsaved instances.
+                analysis may be None; otherwise its ai_result is set here.
+            batch_size: Rows per INSERT, defaulting to settings.AI_BULK_BATCH_SIZE
+
+        Returns:
+            List of the created AIProcessingResult instances
+        """
+        batch_size = batch_size or getattr(settings, 'AI_BULK_BATCH_SIZE', 100)
+        payloads = list(payloads)
+
+        for result, _ in payloads:
+            result._fill_input_hash()
+
+        try:
+            with transaction.atomic():
+                created = cls.objects.bulk_create([result for result, _ in payloads], batch_size=batch_size)
+
+                analyses = defaultdict(list)
+                for result, analysis in payloads:
+                    if analysis is not None:
+                        analysis.ai_result = result
+                        analyses[type(analysis)].append(analysis)
+                for model, rows in analyses.items():
+                    model.objects.bulk_create(rows, batch_size=batch_size)
+        except IntegrityError:
+            AIModel.clear_cache()
+            raise
+
+        return created
+
+    @classmethod
+    def claim_pending(cls, processing_type=None, limit=10):
+        """
+        Claim up to `limit` of the oldest pending results for a worker by
+        moving them to processing. Rows locked by another worker are skipped
+        rather than waited on, so concurrent workers never claim the same row.
+
+        Returns:
+            List of claimed result ids, oldest first
+        """
+        with transaction.atomic():
+            pending = cls.objects.filter(status='pending')
+            if processing_type:
+                pending = pending.filter(processing_type=processing_type)
+            ids = list(
+                pending.select_for_update(skip_locked=True)
+                .order_by('created_at')
+                .values_list('id', flat=True)[:limit]
+            )
+            cls.objects.filter(id__in=ids).update(status='processing', updated_at=timezone.now())
+        return ids
+
+    @classmethod
+    def recent_completed(cls):
+        """Completed results trimmed to the columns shown in summaries, newest first"""
+        return (
+            cls.objects.filter(status='completed')
+            .only(
+                'id', 'processing_type', 'confidence_score', 'created_at',
+                'property_obj', 'tenant', 'lease', 'maintenance_request'
+            )
+            .order_by('-created_at')
+        )
+
+    @classmethod
+    def recent_prefetch(cls, lookup='ai_processing_results', limit=10, to_attr='recent_ai_results'):
+        """
+        Prefetch the latest completed results of each parent (property,
+        tenant, lease or maintenance request) in one windowed IN query,
+        rather than every result of every parent.
+        """
+        return models.Prefetch(lookup, queryset=cls.recent_completed()[:limit], to_attr=to_attr)
+
+    @classmethod
+    def find_completed(cls, input_hash):
+        """Latest completed result for an identical earlier call, or None"""
+        return (
+            cls.objects.filter(input_hash=input_hash, status='completed')
+            .only('id', 'structured_output', 'generated_content', 'confidence_score', 'created_at')
+            .first()
+        )
+
+
+class AnalysisManager(models.Manager):
+    """
+    Default manager for the per-type analysis models. Nearly every read
+    touches the parent result, so join it up front (minus its bulky
+    input_text) instead of fetching it row by row.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('ai_result').defer('ai_result__input_text')
 
 
 class LeaseAnalysis(models.Model):
@@ -159,23 +498,20 @@ class LeaseAnalysis(models.Model):
     pet_deposit = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
 
     # Additional extracted data
-    utilities_included = models.JSONField(null=True, blank=True)  # List of utilities
+    utilities_included = OrjsonField(null=True, blank=True)  # List of utilities
     special_terms = models.TextField(null=True, blank=True)
     key_terms_summary = models.TextField(null=True, blank=True)
 
     # Analysis metadata
     extraction_quality = models.CharField(
         max_length=20,
-        choices=[
-            ('excellent', 'Excellent'),
-            ('good', 'Good'),
-            ('fair', 'Fair'),
-            ('poor', 'Poor'),
-        ],
+        choices=ExtractionQuality.choices,
         null=True,
         blank=True
     )
 
+    objects = AnalysisManager()
+
     class Meta:
         indexes = [
             models.Index(fields=['lease_start_date', 'lease_end_date']),
@@ -204,21 +540,19 @@ class TenantApplicationAnalysis(models.Model):
     rental_history = models.TextField(null=True, blank=True)
     risk_assessment = models.CharField(
         max_length=20,
-        choices=[
-            ('low', 'Low Risk'),
-            ('medium', 'Medium Risk'),
-            ('high', 'High Risk'),
-        ],
+        choices=RiskAssessment.choices,
         null=True,
         blank=True
     )
     recommendations = models.TextField(null=True, blank=True)
-    concerns = models.JSONField(null=True, blank=True)  # List of concerns
+    concerns = OrjsonField(null=True, blank=True)  # List of concerns
 
     # Pets and other details
     pets_info = models.TextField(null=True, blank=True)
     move_in_timeline = models.CharField(max_length=100, null=True, blank=True)
 
+    objects = AnalysisManager()
+
 
 class MaintenanceAnalysis(models.Model):
     """Specific model for maintenance request analysis results."""
@@ -232,12 +566,7 @@ class MaintenanceAnalysis(models.Model):
     # Analysis results
     priority_assessment = models.CharField(
         max_length=20,
-        choices=[
-            ('low', 'Low'),
-            ('medium', 'Medium'),
-            ('high', 'High'),
-            ('emergency', 'Emergency'),
-        ],
+        choices=PriorityLevel.choices,
         null=True,
         blank=True
     )
@@ -245,8 +574,8 @@ class MaintenanceAnalysis(models.Model):
     estimated_cost_max = models.DecimalField(max_digits=8, decimal_places=2, null=True, blank=True)
 
     # Technical details
-    required_skills = models.JSONField(null=True, blank=True)  # List of skills
-    parts_needed = models.JSONField(null=True, blank=True)  # List of parts
+    required_skills = OrjsonField(null=True, blank=True)  # List of skills
+    parts_needed = OrjsonField(null=True, blank=True)  # List of parts
     safety_concerns = models.TextField(null=True, blank=True)
 
     # Recommendations
@@ -255,11 +584,29 @@ class MaintenanceAnalysis(models.Model):
     vendor_needed = models.BooleanField(default=False)
     follow_up_required = models.BooleanField(default=False)
 
+    objects = AnalysisManager()
+
     class Meta:
         indexes = [
             models.Index(fields=['priority_assessment']),
         ]
 
+    @cached_property
+    def estimated_cost_range(self):
+        """Cost range formatted for display, e.g. "$100.00 - $250.00"."""
+        return self.format_cost_range({
+            'estimated_cost_min': self.estimated_cost_min,
+            'estimated_cost_max': self.estimated_cost_max,
+        })
+
+    @staticmethod
+    def format_cost_range(values):
+        """Format the cost range from a mapping holding both estimated_cost_* values."""
+        template = COST_RANGE_TEMPLATES.get(
+            (bool(values['estimated_cost_min']), bool(values['estimated_cost_max']))
+        )
+        return template.format_map(values) if template else None
+
 
 class PropertyInspection(models.Model):
     """Specific model for property inspection analysis results."""
@@ -273,14 +620,7 @@ class PropertyInspection(models.Model):
     # Inspection details
     inspection_type = models.CharField(
         max_length=50,
-        choices=[
-            ('initial', 'Initial Inspection'),
-            ('move_in', 'Move-in Inspection'),
-            ('move_out', 'Move-out Inspection'),
-            ('maintenance', 'Maintenance Inspection'),
-            ('annual', 'Annual Inspection'),
-            ('damage_assessment', 'Damage Assessment'),
-        ],
+        choices=InspectionType.choices,
         help_text="Type of property inspection performed"
     )
     room_area = models.CharField(
@@ -292,13 +632,7 @@ class PropertyInspection(models.Model):
     # AI assessment results
     overall_condition = models.CharField(
         max_length=20,
-        choices=[
-            ('excellent', 'Excellent'),
-            ('good', 'Good'),
-            ('fair', 'Fair'),
-            ('poor', 'Poor'),
-            ('critical', 'Critical'),
-        ],
+        choices=ConditionRating.choices,
         null=True,
         blank=True
     )
@@ -307,7 +641,7 @@ class PropertyInspection(models.Model):
         blank=True,
         help_text="Description of any damage or issues found"
     )
-    maintenance_items = models.JSONField(
+    maintenance_items = OrjsonField(
         null=True,
         blank=True,
         help_text="List of maintenance items identified"
@@ -328,12 +662,7 @@ class PropertyInspection(models.Model):
     )
     urgency_level = models.CharField(
         max_length=20,
-        choices=[
-            ('low', 'Low'),
-            ('medium', 'Medium'),
-            ('high', 'High'),
-            ('emergency', 'Emergency'),
-        ],
+        choices=PriorityLevel.choices,
         null=True,
         blank=True
     )
@@ -351,12 +680,14 @@ class PropertyInspection(models.Model):
     )
 
     # Photo references (if stored)
-    photo_urls = models.JSONField(
+    photo_urls = OrjsonField(
         null=True,
         blank=True,
         help_text="URLs or references to inspection photos"
     )
 
+    objects = AnalysisManager()
+
     class Meta:
         indexes = [
             models.Index(fields=['inspection_type', 'overall_condition']),
@@ -373,34 +704,19 @@ class WorkCompletionAnalysis(models.Model):
         related_name='work_completion_analysis'
     )
 
-    # Associated maintenance request
-    maintenance_request = models.ForeignKey(
-        'maintenance.MaintenanceRequest',
-        on_delete=models.CASCADE,
-        related_name='work_completion_analyses',
-        null=True,
-        blank=True
-    )
-
     # Work assessment
     completion_quality = models.CharField(
         max_length=20,
-        choices=[
-            ('excellent', 'Excellent'),
-            ('good', 'Good'),
-            ('satisfactory', 'Satisfactory'),
-            ('poor', 'Poor'),
-            ('incomplete', 'Incomplete'),
-        ],
+        choices=CompletionQuality.choices,
         null=True,
         blank=True
     )
-    issues_resolved = models.JSONField(
+    issues_resolved = OrjsonField(
         null=True,
         blank=True,
         help_text="List of issues that appear resolved"
     )
-    remaining_issues = models.JSONField(
+    remaining_issues = OrjsonField(
         null=True,
         blank=True,
         help_text="Any remaining problems identified"
@@ -414,11 +730,7 @@ class WorkCompletionAnalysis(models.Model):
     )
     compliance_check = models.CharField(
         max_length=20,
-        choices=[
-            ('compliant', 'Compliant'),
-            ('non_compliant', 'Non-compliant'),
-            ('unknown', 'Unknown'),
-        ],
+        choices=ComplianceStatus.choices,
         null=True,
         blank=True
     )
@@ -435,17 +747,24 @@ class WorkCompletionAnalysis(models.Model):
     )
 
     # Photo references
-    before_photo_urls = models.JSONField(
+    before_photo_urls = OrjsonField(
         null=True,
         blank=True,
         help_text="URLs to before-work photos"
     )
-    after_photo_urls = models.JSONField(
+    after_photo_urls = OrjsonField(
         null=True,
         blank=True,
         help_text="URLs to after-work photos"
     )
 
+    objects = AnalysisManager()
+
+    @property
+    def maintenance_request(self):
+        """The analyzed maintenance request, recorded once on the parent result"""
+        return self.ai_result.maintenance_request
+
 
 class FinancialAnalysis(models.Model):
     """Model for property financial analysis results."""
@@ -459,25 +778,13 @@ class FinancialAnalysis(models.Model):
     # Analysis metadata
     analysis_period = models.CharField(
         max_length=20,
-        choices=[
-            ('3_months', '3 Months'),
-            ('6_months', '6 Months'),
-            ('12_months', '12 Months'),
-            ('24_months', '24 Months'),
-            ('custom', 'Custom Period'),
-        ],
+        choices=AnalysisPeriod.choices,
         default='12_months',
         help_text="Period covered by this financial analysis"
     )
     report_type = models.CharField(
         max_length=20,
-        choices=[
-            ('monthly', 'Monthly Report'),
-            ('quarterly', 'Quarterly Report'),
-            ('annual', 'Annual Report'),
-            ('investment', 'Investment Analysis'),
-            ('forecast', 'Financial Forecast'),
-        ],
+        choices=FinancialReportType.choices,
         default='monthly',
         help_text="Type of financial report or analysis"
     )
@@ -485,43 +792,37 @@ class FinancialAnalysis(models.Model):
     # Financial health assessment
     profitability_rating = models.CharField(
         max_length=20,
-        choices=[
-            ('excellent', 'Excellent'),
-            ('good', 'Good'),
-            ('fair', 'Fair'),
-            ('poor', 'Poor'),
-            ('critical', 'Critical'),
-        ],
+        choices=ConditionRating.choices,
         null=True,
         blank=True
     )
 
     # Key financial metrics (stored as JSON for flexibility)
-    financial_ratios = models.JSONField(
+    financial_ratios = OrjsonField(
         null=True,
         blank=True,
         help_text="Key financial ratios and metrics"
     )
-    trend_analysis = models.JSONField(
+    trend_analysis = OrjsonField(
         null=True,
         blank=True,
         help_text="Revenue, expense, and profit trends"
     )
-    forecasts = models.JSONField(
+    forecasts = OrjsonField(
         null=True,
         blank=True,
         help_text="Financial projections and forecasts"
     )
 
     # Risk assessment
-    risk_assessment = models.JSONField(
+    risk_assessment = OrjsonField(
         null=True,
         blank=True,
         help_text="Financial risks and mitigation strategies"
     )
 
     # Recommendations and insights
-    recommendations = models.JSONField(
+    recommendations = OrjsonField(
         null=True,
         blank=True,
         help_text="Specific recommendations for improvement"
@@ -535,22 +836,16 @@ class FinancialAnalysis(models.Model):
     # Investment analysis (for investment reports)
     investment_rating = models.CharField(
         max_length=20,
-        choices=[
-            ('excellent', 'Excellent Investment'),
-            ('good', 'Good Investment'),
-            ('fair', 'Fair Investment'),
-            ('poor', 'Poor Investment'),
-            ('high_risk', 'High Risk - Avoid'),
-        ],
+        choices=InvestmentRating.choices,
         null=True,
         blank=True
     )
-    expected_returns = models.JSONField(
+    expected_returns = OrjsonField(
         null=True,
         blank=True,
         help_text="Projected returns and IRR calculations"
     )
-    market_analysis = models.JSONField(
+    market_analysis = OrjsonField(
         null=True,
         blank=True,
         help_text="Market conditions and competitive positioning"
@@ -563,6 +858,8 @@ class FinancialAnalysis(models.Model):
         help_text="Full generated financial report content"
     )
 
+    objects = AnalysisManager()
+
     class Meta:
         indexes = [
             models.Index(fields=['analysis_period', 'report_type']),
@@ -571,6 +868,19 @@ class FinancialAnalysis(models.Model):
         ]
 
 
+def _audio_url_check(field, name):
+    """Audio URLs are absolute https URLs or site-relative paths (placeholder TTS output)"""
+    return models.CheckConstraint(
+        check=(
+            models.Q(**{f'{field}__startswith': 'https://'})
+            | models.Q(**{f'{field}__startswith': '/'})
+            | models.Q(**{field: ''})
+            | models.Q(**{f'{field}__isnull': True})
+        ),
+        name=name
+    )
+
+
 class VoiceInteraction(models.Model):
     """Model for voice assistant interactions."""
 
@@ -583,13 +893,7 @@ class VoiceInteraction(models.Model):
     # Voice interaction details
     interaction_type = models.CharField(
         max_length=50,
-        choices=[
-            ('command', 'Voice Command'),
-            ('report', 'Voice Report'),
-            ('status_check', 'Status Check'),
-            ('reminder', 'Voice Reminder'),
-            ('help', 'Help Request'),
-        ],
+        choices=InteractionType.choices,
         help_text="Type of voice interaction"
     )
 
@@ -602,7 +906,7 @@ class VoiceInteraction(models.Model):
         blank=True,
         help_text="Duration of the audio input in seconds"
     )
-    audio_file_url = models.URLField(
+    audio_file_url = models.TextField(
         null=True,
         blank=True,
         help_text="URL to stored audio file"
@@ -620,7 +924,7 @@ class VoiceInteraction(models.Model):
         blank=True,
         help_text="Confidence score for intent detection"
     )
-    extracted_parameters = models.JSONField(
+    extracted_parameters = OrjsonField(
         null=True,
         blank=True,
         help_text="Parameters extracted from voice command"
@@ -632,7 +936,7 @@ class VoiceInteraction(models.Model):
         blank=True,
         help_text="Text response generated by AI"
     )
-    response_audio_url = models.URLField(
+    response_audio_url = models.TextField(
         null=True,
         blank=True,
         help_text="URL to generated audio response"
@@ -645,7 +949,7 @@ class VoiceInteraction(models.Model):
         blank=True,
         help_text="Action that was taken based on voice command"
     )
-    action_result = models.JSONField(
+    action_result = OrjsonField(
         null=True,
         blank=True,
         help_text="Result of the action taken"
@@ -661,17 +965,23 @@ class VoiceInteraction(models.Model):
         blank=True,
         help_text="Question to ask for clarification"
     )
-    suggested_follow_ups = models.JSONField(
+    suggested_follow_ups = OrjsonField(
         null=True,
         blank=True,
         help_text="Suggested follow-up actions or questions"
     )
 
+    objects = AnalysisManager()
+
     class Meta:
         indexes = [
             models.Index(fields=['interaction_type', 'detected_intent']),
             models.Index(fields=['needs_clarification']),
         ]
+        constraints = [
+            _audio_url_check('audio_file_url', 'ai_voice_audio_url_check'),
+            _audio_url_check('response_audio_url', 'ai_voice_response_url_check'),
+        ]
 
 
 class VoiceReport(models.Model):
@@ -686,22 +996,17 @@ class VoiceReport(models.Model):
     # Report details
     report_type = models.CharField(
         max_length=50,
-        choices=[
-            ('property_status', 'Property Status Report'),
-            ('financial_summary', 'Financial Summary'),
-            ('maintenance_overview', 'Maintenance Overview'),
-            ('occupancy_update', 'Occupancy Update'),
-            ('urgent_alerts', 'Urgent Alerts'),
-        ],
+        choices=VoiceReportType.choices,
         help_text="Type of voice report generated"
     )
 
-    # Associated entity
+    # Associated entity; indexed by the (property_obj, report_type) index in Meta
     property_obj = models.ForeignKey(
         'properties.Property',
         on_delete=models.CASCADE,
         null=True,
         blank=True,
+        db_index=False,
         related_name='voice_reports'
     )
 
@@ -709,7 +1014,7 @@ class VoiceReport(models.Model):
     report_text = models.TextField(
         help_text="Full text content of the voice report"
     )
-    report_audio_url = models.URLField(
+    report_audio_url = models.TextField(
         null=True,
         blank=True,
         help_text="URL to the generated audio report"
@@ -721,23 +1026,28 @@ class VoiceReport(models.Model):
     )
 
     # Report metadata
-    key_highlights = models.JSONField(
+    key_highlights = OrjsonField(
         null=True,
         blank=True,
         help_text="Key highlights or summary points"
     )
-    urgent_items = models.JSONField(
+    urgent_items = OrjsonField(
         null=True,
         blank=True,
         help_text="Urgent items mentioned in the report"
     )
-    recommended_actions = models.JSONField(
+    recommended_actions = OrjsonField(
         null=True,
         blank=True,
         help_text="Recommended actions from the report"
     )
 
+    objects = AnalysisManager()
+
     class Meta:
         indexes = [
-            models.Index(fields=['report_type', 'property_obj']),
-        ]
\ No newline at end of file
+            models.Index(fields=['property_obj', 'report_type']),
+        ]
+        constraints = [
+            _audio_url_check('report_audio_url', 'ai_report_audio_url_check'),
+        ]
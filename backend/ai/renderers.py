@@ -0,0 +1,70 @@
+"""
+orjson-based renderer and parser for the AI endpoints.
+
+AI responses carry large nested structured_output documents, so encoding
+them with orjson instead of the stdlib json module is a cheap win. Where
+orjson isn't installed the AI views fall back to DRF's stock JSON classes.
+"""
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, FormParser, JSONParser, MultiPartParser
+from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Types orjson can't encode (Decimal, lazy translations, querysets...) and
+# datetimes, which DRF formats as ECMA-262 strings, go through DRF's encoder
+# so responses look exactly as they did with the stock JSONRenderer.
+_drf_encoder = JSONEncoder()
+
+RENDER_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME if orjson else 0
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Renderer which serializes to JSON with orjson."""
+
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        options = RENDER_OPTIONS
+        # The browsable API asks for indented output; orjson only indents by two
+        if accepted_media_type and 'indent' in accepted_media_type:
+            options |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=_drf_encoder.default, option=options)
+
+
+class ORJSONParser(BaseParser):
+    """Parses JSON-serialized data with orjson."""
+
+    media_type = 'application/json'
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
+
+
+# JSON renderer/parser for the AI views: orjson when available, else DRF's own
+if orjson is not None:
+    AIJSONRenderer, AIJSONParser = ORJSONRenderer, ORJSONParser
+else:
+    AIJSONRenderer, AIJSONParser = JSONRenderer, JSONParser
+
+
+class ORJSONViewMixin:
+    """Use the AI JSON renderer/parser, keeping the browsable API and form uploads."""
+
+    renderer_classes = [AIJSONRenderer, BrowsableAPIRenderer]
+    parser_classes = [AIJSONParser, FormParser, MultiPartParser]
@@ -0,0 +1,85 @@
+"""
+Response schemas for the structured Gemini extractions.
+
+Each model is sent as the call's response_schema, so Gemini returns
+exactly these keys; the field descriptions take the place of the JSON
+example the prompts used to spell out. Replies are validated against the
+same model, typed the way the matching AI model stores each field, so a
+reply that can't be saved is caught (and re-prompted) in the service
+rather than at save time. Every field is optional because the model is
+asked for null when a value isn't in the input.
+"""
+
+from datetime import date
+from typing import List, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class StructuredExtraction(BaseModel):
+    """Base for the extraction schemas."""
+
+    # Numbers given for text fields (phone numbers, cost estimates) are kept as text
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+    confidence_score: Optional[float] = Field(
+        default=None, ge=0.0, le=1.0, description="Confidence in the result (0.0 to 1.0)"
+    )
+
+
+class LeaseExtraction(StructuredExtraction):
+    """Lease fields from DocumentProcessingService.extract_lease_data()."""
+
+    tenant_name: Optional[str] = Field(default=None, description="Full name of the tenant(s)")
+    property_address: Optional[str] = Field(default=None, description="Complete property address")
+    monthly_rent: Optional[float] = Field(default=None, description="Monthly rent amount, without currency symbols")
+    lease_start_date: Optional[date] = Field(default=None, description="Lease start date")
+    lease_end_date: Optional[date] = Field(default=None, description="Lease end date")
+    security_deposit: Optional[float] = Field(default=None, description="Security deposit amount")
+    pet_deposit: Optional[float] = Field(default=None, description="Pet deposit, if mentioned")
+    utilities_included: Optional[Union[List[str], str]] = Field(
+        default=None, description="Utilities included in rent"
+    )
+    special_terms: Optional[str] = Field(default=None, description="Any special terms or conditions")
+
+
+class ApplicationExtraction(StructuredExtraction):
+    """Application fields from DocumentProcessingService.analyze_tenant_application()."""
+
+    applicant_name: Optional[str] = Field(default=None, description="Full name of the applicant")
+    current_address: Optional[str] = Field(default=None, description="Current residential address")
+    phone_number: Optional[str] = Field(default=None, description="Phone number")
+    email: Optional[str] = Field(default=None, description="Email address")
+    employment_status: Optional[str] = Field(
+        default=None, description="Employment status (employed, self-employed, student, retired, etc.)"
+    )
+    monthly_income: Optional[float] = Field(default=None, description="Monthly income")
+    credit_score_mentioned: Optional[int] = Field(default=None, description="Credit score, if mentioned")
+    previous_landlord_info: Optional[str] = Field(
+        default=None, description="Information about previous landlord/references"
+    )
+    pets: Optional[str] = Field(default=None, description="Information about pets (type, breed, size)")
+    move_in_timeline: Optional[str] = Field(default=None, description="Desired move-in timeline")
+    rental_history: Optional[str] = Field(default=None, description="Summary of rental history")
+    risk_assessment: Optional[str] = Field(default=None, description="Overall risk assessment (low/medium/high)")
+    recommendations: Optional[str] = Field(default=None, description="Any recommendations or concerns")
+
+
+class MaintenanceExtraction(StructuredExtraction):
+    """Analysis fields from MaintenanceAnalysisService.analyze_maintenance_request()."""
+
+    priority_assessment: Optional[str] = Field(
+        default=None, description="Assessed priority level (low/medium/high/emergency)"
+    )
+    estimated_cost: Optional[str] = Field(default=None, description="Estimated cost range, e.g. '$100-500'")
+    required_skills: Optional[Union[List[str], str]] = Field(
+        default=None, description="Skills needed (plumbing, electrical, general, etc.)"
+    )
+    parts_needed: Optional[Union[List[str], str]] = Field(
+        default=None, description="Likely parts or materials required"
+    )
+    safety_concerns: Optional[str] = Field(default=None, description="Any safety issues or hazards")
+    recommendations: Optional[str] = Field(default=None, description="Suggested approach")
+    timeline_estimate: Optional[str] = Field(default=None, description="Expected time to resolve")
+    vendor_needed: bool = Field(default=False, description="Whether a specialized vendor is required")
+    follow_up_required: bool = Field(default=False, description="Whether a follow-up inspection is needed")
@@ -3,7 +3,14 @@ AI Serializers for TenantBase
 API serializers for AI processing results and analysis data.
 """
 
+import copy
+from decimal import Decimal
+
+from django.db import models
+from django.utils.functional import cached_property
 from rest_framework import serializers
+from rest_framework.fields import get_attribute
+from rest_framework.settings import api_settings
 from .models import (
     AIProcessingResult,
     LeaseAnalysis,
@@ -15,32 +22,156 @@ from .models import (
     VoiceInteraction,
     VoiceReport
 )
+from .enums import (
+    AnalysisPeriod,
+    FinancialReportType,
+    InspectionType,
+    PriorityLevel,
+    VoiceReportType,
+)
 
-
-class AIProcessingResultSerializer(serializers.ModelSerializer):
+# Choice sets for the request serializers, built once at import
+DOCUMENT_TYPES = (
+    ('lease', 'Lease Agreement'),
+    ('application', 'Tenant Application'),
+    ('contract', 'Other Contract'),
+)
+COMMUNICATION_TYPES = (
+    ('welcome_email', 'Tenant Welcome Email'),
+    ('maintenance_response', 'Maintenance Response'),
+    ('lease_reminder', 'Lease Renewal Reminder'),
+    ('payment_reminder', 'Payment Reminder'),
+)
+# Custom periods and investment reports have their own endpoints
+FINANCIAL_ANALYSIS_PERIODS = tuple(
+    choice for choice in AnalysisPeriod.choices if choice[0] != AnalysisPeriod.CUSTOM
+)
+FINANCIAL_REPORT_TYPES = tuple(
+    choice for choice in FinancialReportType.choices if choice[0] != FinancialReportType.INVESTMENT
+)
+# Documents per batch analysis request, each one a concurrent Gemini call
+MAX_BATCH_DOCUMENTS = 20
+BATCH_DOCUMENT_TYPES = ('lease', 'application')
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer's fields once per class and give each instance
+    shallow copies, instead of re-introspecting the model and deep-copying
+    every declared field (choice maps and the like) per instance. Plain
+    fields are rebound to the new instance by .fields, so sharing the
+    unbound templates is safe. Nested serializers are still deep-copied:
+    a shallow copy of a many=True field would share its child, which is
+    bound to the template and so never sees the request's context.
+    """
+
+    _serializer_classes = []
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        CachedFieldsMixin._serializer_classes.append(cls)
+
+    def get_fields(self):
+        cls = type(self)
+        template = cls.__dict__.get('_cached_fields_template')
+        if template is None:
+            template = super().get_fields()
+            cls._cached_fields_template = template
+        return {
+            name: copy.deepcopy(field) if isinstance(field, serializers.BaseSerializer) else copy.copy(field)
+            for name, field in template.items()
+        }
+
+    @cached_property
+    def _readable_fields(self):
+        # DRF re-filters .fields on every to_representation call, i.e. once
+        # per row in a list; resolve the readable fields once per instance
+        # (and their names once per class) instead.
+        cls = type(self)
+        names = cls.__dict__.get('_readable_field_names')
+        if names is None:
+            names = tuple(name for name, field in self.fields.items() if not field.write_only)
+            cls._readable_field_names = names
+        fields = self.fields
+        return [fields[name] for name in names]
+
+
+def prebuild_serializer_fields():
+    """
+    Build every cached field template up front, so the first request to
+    each endpoint doesn't pay for model introspection. Called from
+    AiConfig.ready(), once the app registry can resolve related models.
+    """
+    for serializer_class in CachedFieldsMixin._serializer_classes:
+        if issubclass(serializer_class, serializers.ModelSerializer) and not hasattr(serializer_class, 'Meta'):
+            continue
+        serializer_class().get_fields()
+
+
+class AnnotatedField(serializers.ReadOnlyField):
+    """
+    Read-only value from the queryset annotation of the same name, falling
+    back to walking the dotted ``fallback`` path for instances fetched
+    without it (e.g. results nested under an analysis).
+    """
+
+    def __init__(self, fallback, **kwargs):
+        self.fallback_attrs = fallback.split('.')
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        if self.field_name in instance.__dict__:
+            return instance.__dict__[self.field_name]
+        try:
+            return get_attribute(instance, self.fallback_attrs)
+        except AttributeError:
+            # A relation along the path is unset
+            return None
+
+
+class StoredDecimalField(serializers.DecimalField):
+    """
+    DecimalField that returns values already at the field's scale (which is
+    what the database hands back for a DecimalField column) as-is, instead
+    of building a decimal context and re-quantizing every value.
+    """
+
+    def to_representation(self, value):
+        if (
+            isinstance(value, Decimal)
+            and getattr(self, 'coerce_to_string', api_settings.COERCE_DECIMAL_TO_STRING)
+            and not (self.localize or self.normalize_output)
+            and self.decimal_places is not None
+            and value.as_tuple().exponent == -self.decimal_places
+        ):
+            return f'{value:f}'
+        return super().to_representation(value)
+
+
+# ModelSerializer field mapping with model DecimalFields rendered by StoredDecimalField
+AI_SERIALIZER_FIELD_MAPPING = {
+    **serializers.ModelSerializer.serializer_field_mapping,
+    models.DecimalField: StoredDecimalField,
+}
+
+
+class AIProcessingResultSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for AI processing results."""
 
+    serializer_field_mapping = AI_SERIALIZER_FIELD_MAPPING
+
     # Related object names for better UX
-    property_name = serializers.CharField(
-        source='property_obj.name',
-        read_only=True
-    )
-    tenant_name = serializers.CharField(
-        source='tenant.full_name',
-        read_only=True
-    )
-    lease_identifier = serializers.SerializerMethodField()
-    maintenance_title = serializers.CharField(
-        source='maintenance_request.title',
-        read_only=True
-    )
+    property_name = AnnotatedField(fallback='property_obj.property_name')
+    tenant_name = AnnotatedField(fallback='tenant.full_name')
+    lease_tenant_name = AnnotatedField(fallback='lease.tenant.full_name')
+    maintenance_title = AnnotatedField(fallback='maintenance_request.title')
 
     class Meta:
         model = AIProcessingResult
         fields = [
             'id', 'processing_type', 'ai_model_used', 'confidence_score',
             'property_obj', 'property_name', 'tenant', 'tenant_name',
-            'lease', 'lease_identifier', 'maintenance_request', 'maintenance_title',
+            'lease', 'lease_tenant_name', 'maintenance_request', 'maintenance_title',
             'structured_output', 'generated_content', 'status', 'error_message',
             'processing_time_ms', 'tokens_used', 'cost_estimate',
             'created_by', 'created_at', 'updated_at'
@@ -50,14 +181,39 @@ class AIProcessingResultSerializer(serializers.ModelSerializer):
             'processing_time_ms', 'tokens_used', 'cost_estimate'
         ]
 
-    def get_lease_identifier(self, obj):
-        """Get a readable identifier for the lease."""
-        if obj.lease:
-            return f"Lease {obj.lease.id} - {obj.lease.tenant.full_name}"
-        return None
 
+class AIResultSummarySerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """Compact AI result rows nested under their property."""
 
-class LeaseAnalysisSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AIProcessingResult
+        fields = ['id', 'processing_type', 'confidence_score', 'created_at']
+        read_only_fields = fields
+
+
+class AIAnalysisSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Base serializer for the per-type analysis models. Subclasses that set
+    is_nested (the list views) return ai_result_id instead of the full
+    nested AI result.
+    """
+
+    is_nested = False
+    serializer_field_mapping = AI_SERIALIZER_FIELD_MAPPING
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if self.is_nested and 'ai_result' in fields:
+            # Swap in place so the id keeps the nested field's position
+            fields = {
+                ('ai_result_id' if name == 'ai_result' else name): field
+                for name, field in fields.items()
+            }
+            fields['ai_result_id'] = serializers.IntegerField(read_only=True)
+        return fields
+
+
+class LeaseAnalysisSerializer(AIAnalysisSerializer):
     """Serializer for lease analysis results."""
 
     ai_result = AIProcessingResultSerializer(read_only=True)
@@ -73,7 +229,13 @@ class LeaseAnalysisSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
-class TenantApplicationAnalysisSerializer(serializers.ModelSerializer):
+class LeaseAnalysisSummarySerializer(LeaseAnalysisSerializer):
+    """Lease analysis rows for list views, without the nested AI result."""
+
+    is_nested = True
+
+
+class TenantApplicationAnalysisSerializer(AIAnalysisSerializer):
     """Serializer for tenant application analysis results."""
 
     ai_result = AIProcessingResultSerializer(read_only=True)
@@ -89,11 +251,17 @@ class TenantApplicationAnalysisSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
-class MaintenanceAnalysisSerializer(serializers.ModelSerializer):
+class TenantApplicationAnalysisSummarySerializer(TenantApplicationAnalysisSerializer):
+    """Tenant application analysis rows for list views, without the nested AI result."""
+
+    is_nested = True
+
+
+class MaintenanceAnalysisSerializer(AIAnalysisSerializer):
     """Serializer for maintenance analysis results."""
 
     ai_result = AIProcessingResultSerializer(read_only=True)
-    estimated_cost_range = serializers.SerializerMethodField()
+    estimated_cost_range = serializers.ReadOnlyField()
 
     class Meta:
         model = MaintenanceAnalysis
@@ -105,18 +273,14 @@ class MaintenanceAnalysisSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id']
 
-    def get_estimated_cost_range(self, obj):
-        """Format cost range for display."""
-        if obj.estimated_cost_min and obj.estimated_cost_max:
-            return f"${obj.estimated_cost_min:.2f} - ${obj.estimated_cost_max:.2f}"
-        elif obj.estimated_cost_min:
-            return f"From ${obj.estimated_cost_min:.2f}"
-        elif obj.estimated_cost_max:
-            return f"Up to ${obj.estimated_cost_max:.2f}"
-        return None
 
+class MaintenanceAnalysisSummarySerializer(MaintenanceAnalysisSerializer):
+    """Maintenance analysis rows for list views, without the nested AI result."""
+
+    is_nested = True
 
-class PropertyInspectionSerializer(serializers.ModelSerializer):
+
+class PropertyInspectionSerializer(AIAnalysisSerializer):
     """Serializer for property inspection analysis results."""
 
     ai_result = AIProcessingResultSerializer(read_only=True)
@@ -132,10 +296,20 @@ class PropertyInspectionSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
-class WorkCompletionAnalysisSerializer(serializers.ModelSerializer):
+class PropertyInspectionSummarySerializer(PropertyInspectionSerializer):
+    """Property inspection rows for list views, without the nested AI result."""
+
+    is_nested = True
+
+
+class WorkCompletionAnalysisSerializer(AIAnalysisSerializer):
     """Serializer for work completion analysis results."""
 
     ai_result = AIProcessingResultSerializer(read_only=True)
+    maintenance_request = serializers.IntegerField(
+        source='ai_result.maintenance_request_id',
+        read_only=True
+    )
 
     class Meta:
         model = WorkCompletionAnalysis
@@ -148,9 +322,15 @@ class WorkCompletionAnalysisSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
+class WorkCompletionAnalysisSummarySerializer(WorkCompletionAnalysisSerializer):
+    """Work completion analysis rows for list views, without the nested AI result."""
+
+    is_nested = True
+
+
 # Input serializers for AI processing requests
 
-class DocumentAnalysisRequestSerializer(serializers.Serializer):
+class DocumentAnalysisRequestSerializer(CachedFieldsMixin, serializers.Serializer):
     """Serializer for document analysis requests."""
 
     document_content = serializers.CharField(
@@ -158,11 +338,7 @@ class DocumentAnalysisRequestSerializer(serializers.Serializer):
         help_text="Text content extracted from the document"
     )
     document_type = serializers.ChoiceField(
-        choices=[
-            ('lease', 'Lease Agreement'),
-            ('application', 'Tenant Application'),
-            ('contract', 'Other Contract'),
-        ],
+        choices=DOCUMENT_TYPES,
         required=True
     )
     property_id = serializers.IntegerField(
@@ -175,7 +351,27 @@ class DocumentAnalysisRequestSerializer(serializers.Serializer):
     )
 
 
-class MaintenanceAnalysisRequestSerializer(serializers.Serializer):
+class DocumentBatchAnalysisRequestSerializer(CachedFieldsMixin, serializers.Serializer):
+    """Serializer for analyzing several documents in one request."""
+
+    documents = DocumentAnalysisRequestSerializer(
+        many=True,
+        min_length=1,
+        max_length=MAX_BATCH_DOCUMENTS,
+        help_text="Documents to analyze concurrently"
+    )
+
+    def validate_documents(self, documents):
+        """Only leases and applications have an extraction prompt."""
+        unsupported = sorted({document['document_type'] for document in documents} - set(BATCH_DOCUMENT_TYPES))
+        if unsupported:
+            raise serializers.ValidationError(
+                f"Batch analysis does not support document type(s): {', '.join(unsupported)}"
+            )
+        return documents
+
+
+class MaintenanceAnalysisRequestSerializer(CachedFieldsMixin, serializers.Serializer):
     """Serializer for maintenance request analysis."""
 
     description = serializers.CharField(
@@ -183,12 +379,7 @@ class MaintenanceAnalysisRequestSerializer(serializers.Serializer):
         help_text="Description of the maintenance issue"
     )
     urgency = serializers.ChoiceField(
-        choices=[
-            ('low', 'Low'),
-            ('medium', 'Medium'),
-            ('high', 'High'),
-            ('emergency', 'Emergency'),
-        ],
+        choices=PriorityLevel.choices,
         required=True
     )
     property_type = serializers.CharField(
@@ -202,16 +393,11 @@ class MaintenanceAnalysisRequestSerializer(serializers.Serializer):
     )
 
 
-class CommunicationRequestSerializer(serializers.Serializer):
+class CommunicationRequestSerializer(CachedFieldsMixin, serializers.Serializer):
     """Serializer for communication generation requests."""
 
     communication_type = serializers.ChoiceField(
-        choices=[
-            ('welcome_email', 'Tenant Welcome Email'),
-            ('maintenance_response', 'Maintenance Response'),
-            ('lease_reminder', 'Lease Renewal Reminder'),
-            ('payment_reminder', 'Payment Reminder'),
-        ],
+        choices=COMMUNICATION_TYPES,
         required=True
     )
 
@@ -227,7 +413,7 @@ class CommunicationRequestSerializer(serializers.Serializer):
     due_date = serializers.DateField(required=False)
 
 
-class PropertyImageAnalysisSerializer(serializers.Serializer):
+class PropertyImageAnalysisSerializer(CachedFieldsMixin, serializers.Serializer):
     """Serializer for property image analysis requests."""
 
     image_description = serializers.CharField(
@@ -235,14 +421,7 @@ class PropertyImageAnalysisSerializer(serializers.Serializer):
         help_text="Detailed description of what's visible in the property image"
     )
     inspection_type = serializers.ChoiceField(
-        choices=[
-            ('initial', 'Initial Inspection'),
-            ('move_in', 'Move-in Inspection'),
-            ('move_out', 'Move-out Inspection'),
-            ('maintenance', 'Maintenance Inspection'),
-            ('annual', 'Annual Inspection'),
-            ('damage_assessment', 'Damage Assessment'),
-        ],
+        choices=InspectionType.choices,
         default='general',
         required=False
     )
@@ -265,7 +444,7 @@ class PropertyImageAnalysisSerializer(serializers.Serializer):
     )
 
 
-class FinancialAnalysisSerializer(serializers.ModelSerializer):
+class FinancialAnalysisSerializer(AIAnalysisSerializer):
     """Serializer for financial analysis results."""
 
     ai_result = AIProcessingResultSerializer(read_only=True)
@@ -282,7 +461,13 @@ class FinancialAnalysisSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
-class WorkCompletionAnalysisSerializer(serializers.Serializer):
+class FinancialAnalysisSummarySerializer(FinancialAnalysisSerializer):
+    """Financial analysis rows for list views, without the nested AI result."""
+
+    is_nested = True
+
+
+class WorkCompletionAnalysisRequestSerializer(CachedFieldsMixin, serializers.Serializer):
     """Serializer for work completion analysis requests."""
 
     before_image_description = serializers.CharField(
@@ -313,7 +498,7 @@ class WorkCompletionAnalysisSerializer(serializers.Serializer):
     )
 
 
-class FinancialAnalysisRequestSerializer(serializers.Serializer):
+class FinancialAnalysisRequestSerializer(CachedFieldsMixin, serializers.Serializer):
     """Serializer for financial analysis requests."""
 
     property_id = serializers.IntegerField(
@@ -321,23 +506,13 @@ class FinancialAnalysisRequestSerializer(serializers.Serializer):
         help_text="ID of the property to analyze"
     )
     analysis_period = serializers.ChoiceField(
-        choices=[
-            ('3_months', '3 Months'),
-            ('6_months', '6 Months'),
-            ('12_months', '12 Months'),
-            ('24_months', '24 Months'),
-        ],
+        choices=FINANCIAL_ANALYSIS_PERIODS,
         default='12_months',
         required=False,
         help_text="Period for financial analysis"
     )
     report_type = serializers.ChoiceField(
-        choices=[
-            ('monthly', 'Monthly Report'),
-            ('quarterly', 'Quarterly Report'),
-            ('annual', 'Annual Report'),
-            ('forecast', 'Financial Forecast'),
-        ],
+        choices=FINANCIAL_REPORT_TYPES,
         default='monthly',
         required=False,
         help_text="Type of financial report to generate"
@@ -348,7 +523,7 @@ class FinancialAnalysisRequestSerializer(serializers.Serializer):
     )
 
 
-class InvestmentAnalysisRequestSerializer(serializers.Serializer):
+class InvestmentAnalysisRequestSerializer(CachedFieldsMixin, serializers.Serializer):
     """Serializer for investment analysis requests."""
 
     property_id = serializers.IntegerField(
@@ -380,7 +555,7 @@ class InvestmentAnalysisRequestSerializer(serializers.Serializer):
     )
 
 
-class VoiceCommandSerializer(serializers.Serializer):
+class VoiceCommandSerializer(CachedFieldsMixin, serializers.Serializer):
     """Serializer for voice command processing."""
 
     audio_transcript = serializers.CharField(
@@ -398,17 +573,11 @@ class VoiceCommandSerializer(serializers.Serializer):
     )
 
 
-class VoiceReportRequestSerializer(serializers.Serializer):
+class VoiceReportRequestSerializer(CachedFieldsMixin, serializers.Serializer):
     """Serializer for voice report generation."""
 
     report_type = serializers.ChoiceField(
-        choices=[
-            ('property_status', 'Property Status Report'),
-            ('financial_summary', 'Financial Summary'),
-            ('maintenance_overview', 'Maintenance Overview'),
-            ('occupancy_update', 'Occupancy Update'),
-            ('urgent_alerts', 'Urgent Alerts'),
-        ],
+        choices=VoiceReportType.choices,
         required=True,
         help_text="Type of voice report to generate"
     )
@@ -418,7 +587,7 @@ class VoiceReportRequestSerializer(serializers.Serializer):
     )
 
 
-class VoiceInteractionSerializer(serializers.ModelSerializer):
+class VoiceInteractionSerializer(AIAnalysisSerializer):
     """Serializer for voice interactions."""
 
     ai_result = AIProcessingResultSerializer(read_only=True)
@@ -435,7 +604,13 @@ class VoiceInteractionSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
-class VoiceReportSerializer(serializers.ModelSerializer):
+class VoiceInteractionSummarySerializer(VoiceInteractionSerializer):
+    """Voice interaction rows for list views, without the nested AI result."""
+
+    is_nested = True
+
+
+class VoiceReportSerializer(AIAnalysisSerializer):
     """Serializer for voice reports."""
 
     ai_result = AIProcessingResultSerializer(read_only=True)
@@ -447,4 +622,10 @@ class VoiceReportSerializer(serializers.ModelSerializer):
             'report_audio_url', 'audio_duration_seconds', 'key_highlights',
             'urgent_items', 'recommended_actions'
         ]
-        read_only_fields = ['id']
\ No newline at end of file
+        read_only_fields = ['id']
+
+
+class VoiceReportSummarySerializer(VoiceReportSerializer):
+    """Voice report rows for list views, without the nested AI result."""
+
+    is_nested = True
@@ -5,17 +5,549 @@ Integrates Google Gemini API for document processing, text generation, and intel
 
 import os
 import json
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any, Union
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple, Type, Union
 from pathlib import Path
 
+import httpx
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.base import File
 from google import genai
 from google.genai import types
+from pydantic import BaseModel, ValidationError
+
+from .schemas import ApplicationExtraction, LeaseExtraction, MaintenanceExtraction
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import h2  # enables httpx's HTTP/2 support
+except ImportError:
+    h2 = None
 
 logger = logging.getLogger(__name__)
 
+# Responses are only cached for near-deterministic calls; at higher
+# temperatures callers expect a fresh generation each time.
+RESPONSE_CACHE_MAX_TEMPERATURE = 0.2
+
+# Part of every response cache key; bump it when a change to prompts or
+# response handling should stop old cached responses being served.
+PROMPT_VERSION = 'v1'
+
+# Structured extractions run on flash first and are retried on the fallback
+# model when flash fails or reports a confidence_score below this.
+FALLBACK_CONFIDENCE_THRESHOLD = 0.7
+
+# Inputs shorter than this go to flash-lite first instead of flash; the pro
+# fallback above still catches a poor result.
+SHORT_INPUT_CHARS = 2000
+
+# Appended to the prompt when a reply fails its schema, for the one re-prompt
+SCHEMA_RETRY_PROMPT = "\n\nYour output had error: {error}. Fix and retry."
+
+# Fixed instructions for each prompt, sent as the system instruction so the
+# per-call contents only carry the variable payload. Keeping this prefix
+# identical across calls also lets Gemini's implicit prompt caching apply.
+# Prompts with a response schema in ai.schemas leave the JSON layout to it.
+LEASE_EXTRACT_SYSTEM = """
+Analyze the lease agreement you are given and extract the tenant, property,
+rent, deposit, date and utility terms it states.
+
+If information is not available, use null values.
+"""
+
+TENANT_APP_SYSTEM = """
+Analyze the tenant rental application you are given: extract the applicant's
+contact, employment, income, rental history and pet details, and assess the
+application's overall risk.
+
+Use null for unavailable information.
+"""
+
+LEASE_SUMMARY_SYSTEM = """
+Create a concise summary of the lease agreement you are given, highlighting the most important terms for a property manager:
+
+Focus on:
+- Tenant information
+- Property details
+- Financial terms (rent, deposits, fees)
+- Lease duration and renewal terms
+- Key responsibilities of tenant and landlord
+- Any special conditions or restrictions
+
+Keep the summary under 300 words and use clear, professional language.
+"""
+
+WELCOME_EMAIL_SYSTEM = """
+Write a professional welcome email for a new tenant moving into a rental property.
+
+Include:
+- Warm welcome and excitement about their move
+- Key move-in information and reminders
+- Contact information for questions
+- Brief overview of community rules
+- Professional and friendly tone
+
+Format as a complete email with subject line.
+"""
+
+MAINTENANCE_RESPONSE_SYSTEM = """
+Write a professional response to a tenant's maintenance request.
+
+Include:
+- Acknowledgment of the issue
+- Timeline for resolution
+- Next steps in the process
+- Contact information for follow-up
+- Reassurance about the resolution process
+
+Keep it concise and professional.
+"""
+
+INSPECTION_IMAGE_SYSTEM = """
+Analyze the property inspection image you are given and provide a detailed assessment in JSON format:
+
+{
+    "overall_condition": "excellent/good/fair/poor/critical",
+    "damage_assessment": "Description of any visible damage or issues",
+    "maintenance_needed": "List of maintenance items identified",
+    "safety_concerns": "Any safety issues or hazards detected",
+    "estimated_costs": "Rough cost estimates for any repairs needed",
+    "urgency_level": "low/medium/high/emergency",
+    "recommendations": "Specific recommendations for property manager",
+    "compliance_notes": "Any code compliance or regulatory concerns",
+    "confidence_score": "Confidence in assessment (0.0 to 1.0)"
+}
+
+Focus on structural integrity, habitability, safety, and maintenance needs.
+Be specific about locations, severity, and recommended actions.
+Return only valid JSON.
+"""
+
+BEFORE_AFTER_SYSTEM = """
+Compare the before and after images of property maintenance/repair work you are given and provide assessment in JSON format:
+
+{
+    "work_completion_quality": "excellent/good/satisfactory/poor/incomplete",
+    "issues_resolved": "List of issues that appear to be fixed",
+    "remaining_issues": "Any remaining problems or incomplete work",
+    "quality_assessment": "Assessment of workmanship quality",
+    "compliance_check": "Whether work appears to meet standards",
+    "recommendations": "Any follow-up work or monitoring needed",
+    "cost_accuracy": "Assessment of whether work matches described scope",
+    "safety_improvement": "Safety improvements achieved",
+    "confidence_score": "Confidence in assessment (0.0 to 1.0)"
+}
+
+Be thorough and objective in your assessment.
+Return only valid JSON.
+"""
+
+FINANCIAL_ANALYSIS_SYSTEM = """
+Analyze the property's financial performance you are given and provide insights in JSON format:
+
+{
+    "profitability_assessment": "excellent/good/fair/poor",
+    "key_financial_ratios": {
+        "occupancy_rate": "Current occupancy percentage",
+        "noi_margin": "Net Operating Income margin",
+        "cap_rate": "Capitalization rate if available",
+        "cash_flow_stability": "Assessment of cash flow consistency"
+    },
+    "trend_analysis": {
+        "revenue_trend": "increasing/stable/declining",
+        "expense_trend": "increasing/stable/declining",
+        "profit_trend": "increasing/stable/declining",
+        "concerning_trends": "List of concerning financial trends"
+    },
+    "forecast_12_months": {
+        "expected_revenue": "Projected annual revenue",
+        "expected_expenses": "Projected annual expenses",
+        "expected_profit": "Projected annual profit",
+        "confidence_level": "high/medium/low"
+    },
+    "recommendations": [
+        "Specific recommendations for improving financial performance"
+    ],
+    "risk_assessment": {
+        "financial_risks": "Identified financial risks",
+        "mitigation_strategies": "Strategies to address risks",
+        "opportunity_areas": "Areas for financial improvement"
+    },
+    "benchmarking_insights": "How this property compares to market averages",
+    "confidence_score": "Confidence in analysis (0.0 to 1.0)"
+}
+
+Provide data-driven insights based on standard real estate financial analysis principles.
+Return only valid JSON.
+"""
+
+INVESTMENT_ANALYSIS_SYSTEM = """
+Perform a comprehensive investment analysis for the property you are given in JSON format:
+
+{
+    "investment_rating": "excellent/good/fair/poor/high_risk",
+    "financial_projections": {
+        "year_1_noi": "Projected Net Operating Income",
+        "year_3_noi": "3-year NOI projection",
+        "cap_rate": "Current capitalization rate",
+        "irr": "Internal Rate of Return estimate",
+        "cash_on_cash": "Cash-on-cash return percentage"
+    },
+    "market_analysis": {
+        "location_rating": "excellent/good/fair/poor",
+        "market_trends": "Current market conditions and trends",
+        "competitive_position": "How this property compares to competition",
+        "growth_potential": "Future appreciation potential"
+    },
+    "risk_assessment": {
+        "overall_risk": "low/medium/high",
+        "specific_risks": ["List of specific investment risks"],
+        "risk_mitigation": ["Strategies to mitigate identified risks"]
+    },
+    "acquisition_strategy": {
+        "recommended_price_range": "Suggested acquisition price range",
+        "negotiation_points": ["Key negotiation points"],
+        "due_diligence_priorities": ["Critical due diligence items"]
+    },
+    "value_add_opportunities": [
+        "Potential improvements to increase property value"
+    ],
+    "exit_strategy": {
+        "hold_period": "Recommended holding period",
+        "exit_options": ["Potential exit strategies"],
+        "expected_returns": "Projected returns at exit"
+    },
+    "confidence_score": "Confidence in analysis (0.0 to 1.0)"
+}
+
+Base analysis on real estate investment principles and current market conditions.
+Return only valid JSON.
+"""
+
+MAINTENANCE_ANALYSIS_SYSTEM = """
+Analyze the maintenance request you are given: assess its priority, estimate
+the cost, skills, parts and time needed, flag any safety concerns, and
+recommend an approach.
+"""
+
+# Report sections, joined once into the report's system instruction
+FINANCIAL_REPORT_SECTIONS = [
+    "Generate a comprehensive financial report of the requested type for the property you are given. Include:",
+    """1. EXECUTIVE SUMMARY
+   - Overall financial performance
+   - Key highlights and concerns
+   - Recommendations for action""",
+    """2. REVENUE ANALYSIS
+   - Rental income breakdown
+   - Occupancy trends
+   - Revenue projections""",
+    """3. EXPENSE ANALYSIS
+   - Major expense categories
+   - Cost trends and variances
+   - Budget vs actual performance""",
+    """4. PROFITABILITY METRICS
+   - Net Operating Income (NOI)
+   - Cash flow analysis
+   - Return on investment metrics""",
+    """5. KEY PERFORMANCE INDICATORS
+   - Occupancy rates
+   - Collection rates
+   - Expense ratios
+   - Cash-on-cash returns""",
+    """6. FORECASTS AND PROJECTIONS
+   - Short-term financial outlook
+   - Market condition impact
+   - Recommended adjustments""",
+    """7. RISK ASSESSMENT
+   - Financial vulnerabilities
+   - Market risks
+   - Mitigation strategies""",
+    """8. RECOMMENDATIONS
+   - Immediate actions needed
+   - Long-term strategic improvements
+   - Operational efficiencies""",
+    "Format as a professional financial report with clear sections and actionable insights.",
+]
+FINANCIAL_REPORT_SYSTEM = "\n\n".join(FINANCIAL_REPORT_SECTIONS)
+
+VOICE_COMMAND_SYSTEM = """
+You are TenantBase Assistant, an AI voice assistant for property managers.
+Process the voice command you are given and determine the appropriate action.
+
+Analyze the command and provide:
+1. The intent/action the user wants to perform
+2. Required parameters or data needed
+3. A natural voice response to confirm/ask for clarification
+4. Any follow-up actions or questions
+
+Available Actions:
+- property_info: Get information about a specific property
+- tenant_info: Get information about a tenant
+- maintenance_status: Check maintenance request status
+- financial_summary: Get financial summary
+- schedule_inspection: Schedule a property inspection
+- create_task: Create a new task or reminder
+- occupancy_report: Get occupancy report
+- rent_due: Check upcoming rent payments
+
+Return in JSON format:
+{
+    "intent": "detected_action",
+    "confidence": 0.0-1.0,
+    "parameters": {"key": "value"},
+    "response_text": "Natural voice response",
+    "needs_clarification": false,
+    "clarification_question": "if needed",
+    "suggested_actions": ["follow_up_actions"]
+}
+"""
+
+VOICE_REPORT_SYSTEM = """
+Generate a concise voice property report for property manager. Keep it under 200 words.
+
+Cover:
+1. Current occupancy status
+2. Financial highlights (rent collected, expenses)
+3. Active maintenance requests
+4. Upcoming events (lease renewals, inspections)
+5. Any urgent issues requiring attention
+
+Make it conversational and actionable, suitable for voice playback.
+Focus on key metrics and actionable insights.
+"""
+
+# Characters of each document sent to the model
+LEASE_DOC_LIMIT = 10000
+APPLICATION_DOC_LIMIT = 8000
+LEASE_SUMMARY_DOC_LIMIT = 5000
+
+# Per-call payloads, filled with str.format_map and sent as the contents
+LEASE_EXTRACT_PROMPT = "Lease document text:\n{document_excerpt}"
+TENANT_APP_PROMPT = "Application text:\n{application_excerpt}"
+LEASE_SUMMARY_PROMPT = "Lease text:\n{lease_excerpt}"
+WELCOME_EMAIL_PROMPT = "Tenant Name: {tenant_name}\nProperty Address: {property_address}\nMove-in Date: {move_in_date}"
+MAINTENANCE_RESPONSE_PROMPT = (
+    "Issue: {issue_description}\nPriority: {priority}\nEstimated Resolution Time: {estimated_time}"
+)
+INSPECTION_IMAGE_PROMPT = "Image Description: {image_description}\nInspection Context: {inspection_context}"
+BEFORE_AFTER_PROMPT = (
+    "Before Image: {before_description}\nAfter Image: {after_description}\nWork Description: {work_description}"
+)
+VOICE_COMMAND_PROMPT = (
+    "User Context:\n"
+    "- Managed Properties: {properties}\n"
+    "- Recent Activities: {recent_activities}\n"
+    "- Current Time: {current_time}\n"
+    "\n"
+    'Voice Command: "{transcript}"'
+)
+VOICE_REPORT_PROMPT = "Property ID: {property_id}\nUser Context: {user_context}"
+FINANCIAL_ANALYSIS_PROMPT = "Financial Data for {analysis_period}:\n{financial_data}"
+INVESTMENT_ANALYSIS_PROMPT = "Property Data:\n{property_data}\n\nMarket Data:\n{market_data}"
+FINANCIAL_REPORT_PROMPT = "Report type: {report_type}\n\nProperty Data:\n{property_data}"
+MAINTENANCE_ANALYSIS_PROMPT = (
+    "Maintenance Request: {description}\nReported Urgency: {urgency}\nProperty Type: {property_type}"
+)
+
+# Added to the system instruction when generating a reusable template, whose
+# per-recipient values are sent as placeholders (see _generate_templated)
+TEMPLATE_SYSTEM_SUFFIX = """
+Some values are given as placeholders in double square brackets, such as
+[[TENANT_NAME]]. Copy each placeholder into your reply exactly where its value
+belongs, and never replace it with an invented value.
+"""
+
+# Placeholder for a masked field, named after it: tenant_name -> [[TENANT_NAME]]
+TEMPLATE_PLACEHOLDER = "[[{name}]]"
+
+_json_decoder = json.JSONDecoder()
+
+
+def extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Decode the first JSON object in a model response.
+
+    Decoding starts at the first "{" and stops at its matching "}", so
+    surrounding prose and ```json fences are ignored without a second scan
+    for the closing brace. Returns None when the text holds no object and
+    raises json.JSONDecodeError when the object is malformed.
+    """
+    start = text.find('{')
+    if start < 0:
+        logger.error("Could not find JSON in AI response")
+        return None
+    if orjson is not None:
+        # Usual case: the object runs to the end, bar a closing fence
+        body = text[start:].rstrip().removesuffix('```')
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
+    return _json_decoder.raw_decode(text, start)[0]
+
+
+def pick_extraction_model(text: str) -> str:
+    """First-try model for a structured extraction over text."""
+    return "gemini-2.5-flash-lite" if len(text) < SHORT_INPUT_CHARS else "gemini-2.5-flash"
+
+
+def _confidence(result: Optional[Dict[str, Any]]) -> float:
+    """A result's self-reported confidence_score; 1.0 when absent, -1.0 with no result."""
+    if result is None:
+        return -1.0
+    try:
+        return float(result.get('confidence_score', 1.0))
+    except (TypeError, ValueError):
+        return 1.0
+
+
+def _closed_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """The first JSON object in text, or None while it hasn't closed yet."""
+    start = text.find('{')
+    if start < 0:
+        return None
+    try:
+        return _json_decoder.raw_decode(text, start)[0]
+    except json.JSONDecodeError:
+        return None
+
+
+def _validate_structured(result: Dict[str, Any], schema: Type[BaseModel]) -> Dict[str, Any]:
+    """Validate a decoded reply against schema, returning it normalized (dates as ISO strings)."""
+    return schema.model_validate(result).model_dump(mode='json', exclude_unset=True)
+
+
+# Shared by the sync and async structured generation paths, which differ
+# only in how they call Gemini and the cache.
+
+def _check_structured(
+    result: Optional[Dict[str, Any]], schema: Optional[Type[BaseModel]], prompt: str, label: str, model: str
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Validate a first reply against schema. Returns the normalized result
+    and None, or None and the prompt to re-send with the validation errors.
+    """
+    if schema is None or result is None:
+        return result, None
+    try:
+        return _validate_structured(result, schema), None
+    except ValidationError as e:
+        logger.warning(f"Invalid {label} from {model}, re-prompting: {e}")
+        return None, prompt + SCHEMA_RETRY_PROMPT.format(error=e)
+
+
+def _validate_retry(
+    result: Optional[Dict[str, Any]], schema: Type[BaseModel], label: str
+) -> Optional[Dict[str, Any]]:
+    """Validate a re-prompted result; a second failure gives None."""
+    if result is None:
+        return None
+    try:
+        return _validate_structured(result, schema)
+    except ValidationError as e:
+        logger.error(f"Invalid {label} after re-prompt: {e}")
+        return None
+
+
+def _needs_fallback(result: Optional[Dict[str, Any]], model: str, fallback_model: Optional[str], label: str) -> bool:
+    """Whether a failed or low-confidence result should be retried on fallback_model."""
+    if not fallback_model:
+        return False
+    confidence = _confidence(result)
+    if confidence >= FALLBACK_CONFIDENCE_THRESHOLD:
+        return False
+    logger.info(f"Retrying {label} on {fallback_model}: {model} confidence {confidence}")
+    return True
+
+
+def _more_confident(
+    result: Optional[Dict[str, Any]], retry: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """The fallback retry when it is at least as confident as the first result."""
+    return retry if _confidence(retry) >= _confidence(result) else result
+
+
+def _add_stream_chunk(parts: List[str], chunk: Any) -> Optional[Dict[str, Any]]:
+    """Add a streamed chunk's text to parts; returns the JSON object once it has closed."""
+    chunk_text = chunk.text or ''
+    parts.append(chunk_text)
+    # An object can only have closed in a chunk holding a '}'
+    if '}' not in chunk_text:
+        return None
+    return _closed_json_object(''.join(parts))
+
+
+def _response_format(json_output: bool, response_schema: Optional[Any]) -> str:
+    """Cache key field for the reply format, so text, JSON and each schema get their own entries."""
+    if response_schema is not None:
+        name = response_schema.__name__ if isinstance(response_schema, type) else repr(response_schema)
+        return f"schema:{name}"
+    return 'json' if json_output else 'text'
+
+
+def dump_prompt_data(data: Any) -> str:
+    """Indented JSON for embedding data in a prompt."""
+    if orjson is None:
+        return json.dumps(data, indent=2)
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+
+_CLIENT_UNSET = object()
+
+
+# Connection pool for the shared client. Concurrent calls (analyze_documents)
+# reuse warm connections instead of paying a TLS handshake each, and with h2
+# installed they are multiplexed over HTTP/2. The async pool's connections
+# belong to the loop that opened them, so async calls on the shared client
+# only run on the Gemini loop (see run_on_gemini_loop).
+GEMINI_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+def gemini_http_options() -> types.HttpOptions:
+    """HTTP options for the shared client's sync and async httpx pools."""
+    client_args = {'http2': h2 is not None, 'limits': GEMINI_HTTP_LIMITS}
+    return types.HttpOptions(client_args=client_args, async_client_args=dict(client_args))
+
+
+@lru_cache(maxsize=None)
+def get_gemini_client(api_key: str) -> genai.Client:
+    """Shared Gemini client per API key, so every service reuses one connection pool."""
+    client = genai.Client(api_key=api_key, http_options=gemini_http_options())
+    logger.info("Gemini AI client initialized successfully")
+    return client
+
+
+_gemini_loop: Optional[asyncio.AbstractEventLoop] = None
+_gemini_loop_lock = threading.Lock()
+
+
+def run_on_gemini_loop(coro: Any) -> Any:
+    """
+    Run a coroutine on the long-lived Gemini event loop and wait for its result.
+
+    The shared client's async connection pool is bound to the loop that
+    opened its connections, so every async Gemini call runs on this one
+    loop (started in a daemon thread on first use) instead of a new loop
+    per request, which would leave the pool holding a closed loop.
+    """
+    global _gemini_loop
+    with _gemini_loop_lock:
+        if _gemini_loop is None:
+            _gemini_loop = asyncio.new_event_loop()
+            threading.Thread(target=_gemini_loop.run_forever, name="gemini-loop", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _gemini_loop).result()
+
 
 class GeminiAIService:
     """Base service for Google Gemini AI integration."""
@@ -24,14 +556,24 @@ class GeminiAIService:
         self.api_key = settings.GEMINI_API_KEY
         if not self.api_key:
             logger.warning("GEMINI_API_KEY not configured. AI features will be disabled.")
-            self.client = None
-        else:
-            try:
-                self.client = genai.Client(api_key=self.api_key)
-                logger.info("Gemini AI service initialized successfully")
-            except Exception as e:
-                logger.error(f"Failed to initialize Gemini AI service: {e}")
-                self.client = None
+        # Created on first use, so importing the module-level services is cheap
+        self._client = _CLIENT_UNSET
+
+    @property
+    def client(self) -> Optional[genai.Client]:
+        """The shared Gemini client, or None when AI is disabled or it failed to initialize."""
+        if self._client is _CLIENT_UNSET:
+            self._client = None
+            if self.api_key:
+                try:
+                    self._client = get_gemini_client(self.api_key)
+                except Exception as e:
+                    logger.error(f"Failed to initialize Gemini AI service: {e}")
+        return self._client
+
+    @client.setter
+    def client(self, value: Optional[genai.Client]) -> None:
+        self._client = value
 
     def is_available(self) -> bool:
         """Check if AI service is available."""
@@ -43,25 +585,459 @@ class GeminiAIService:
         model: str = "gemini-2.5-flash",
         temperature: float = 0.7,
         max_tokens: int = 1000,
+        system_instruction: Optional[str] = None,
+        json_output: bool = False,
+        use_cache: bool = True,
+        response_schema: Optional[Any] = None,
     ) -> Optional[str]:
-        """Generate content using Gemini AI."""
+        """
+        Generate content using Gemini AI, with fixed instructions in
+        system_instruction. json_output asks for a bare JSON reply, and a
+        response_schema constrains it to that schema (implying json_output);
+        use_cache=False always calls the API and leaves the cache untouched.
+        """
         if not self.is_available():
             logger.warning("AI service not available - skipping content generation")
             return None
 
+        cache_key = self._cacheable_key(
+            prompt, model, temperature, max_tokens, system_instruction, _response_format(json_output, response_schema)
+        ) if use_cache else None
+        if cache_key:
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             response = self.client.models.generate_content(
                 model=model,
                 contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=temperature,
-                    max_output_tokens=max_tokens,
-                )
+                config=self._content_config(
+                    temperature, max_tokens, system_instruction, json_output, response_schema
+                ),
+            )
+        except Exception as e:
+            logger.error(f"Error generating content with Gemini AI: {e}")
+            return None
+
+        text = response.text
+        if cache_key and text:
+            self._set_cached_response(cache_key, text)
+        return text
+
+    async def generate_content_async(
+        self,
+        prompt: str,
+        model: str = "gemini-2.5-flash",
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        system_instruction: Optional[str] = None,
+        json_output: bool = False,
+        use_cache: bool = True,
+        response_schema: Optional[Any] = None,
+    ) -> Optional[str]:
+        """
+        Async generate_content on the client's aio API, so several calls can
+        be awaited together. Run it through run_on_gemini_loop(), since the
+        client's async pool can't be shared with another event loop.
+        """
+        if not self.is_available():
+            logger.warning("AI service not available - skipping content generation")
+            return None
+
+        cache_key = self._cacheable_key(
+            prompt, model, temperature, max_tokens, system_instruction, _response_format(json_output, response_schema)
+        ) if use_cache else None
+        if cache_key:
+            cached = await sync_to_async(self._get_cached_response)(cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=model,
+                contents=prompt,
+                config=self._content_config(
+                    temperature, max_tokens, system_instruction, json_output, response_schema
+                ),
+            )
+        except Exception as e:
+            logger.error(f"Error generating content with Gemini AI: {e}")
+            return None
+
+        text = response.text
+        if cache_key and text:
+            await sync_to_async(self._set_cached_response)(cache_key, text)
+        return text
+
+    def generate_json_streaming(
+        self,
+        prompt: str,
+        model: str = "gemini-2.5-flash",
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        system_instruction: Optional[str] = None,
+        label: str = "AI response",
+        fallback_model: Optional[str] = None,
+        use_cache: bool = True,
+        schema: Optional[Type[BaseModel]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Stream a response and return its first JSON object.
+
+        Chunks are decoded as they arrive and the stream is closed as soon
+        as the object is complete, so trailing commentary isn't waited for.
+        Returns None (and logs, using label) when no object can be decoded.
+        With a schema, the object is validated and normalized against it,
+        and a reply that fails is re-prompted once with the errors.
+        With a fallback_model, a failed or low-confidence result is retried
+        once on that model and the more confident of the two is returned.
+        """
+        result = self._generate_structured(
+            prompt, model, temperature, max_tokens, system_instruction, label, use_cache, schema
+        )
+        if not _needs_fallback(result, model, fallback_model, label):
+            return result
+        retry = self._generate_structured(
+            prompt, fallback_model, temperature, max_tokens, system_instruction, label, use_cache, schema
+        )
+        return _more_confident(result, retry)
+
+    async def generate_json_async(
+        self,
+        prompt: str,
+        model: str = "gemini-2.5-flash",
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        system_instruction: Optional[str] = None,
+        label: str = "AI response",
+        fallback_model: Optional[str] = None,
+        use_cache: bool = True,
+        schema: Optional[Type[BaseModel]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Async generate_json_streaming, for running several extractions
+        together. Like generate_content_async(), run it on the Gemini loop.
+        """
+        result = await self._generate_structured_async(
+            prompt, model, temperature, max_tokens, system_instruction, label, use_cache, schema
+        )
+        if not _needs_fallback(result, model, fallback_model, label):
+            return result
+        retry = await self._generate_structured_async(
+            prompt, fallback_model, temperature, max_tokens, system_instruction, label, use_cache, schema
+        )
+        return _more_confident(result, retry)
+
+    def _generate_structured(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system_instruction: Optional[str],
+        label: str,
+        use_cache: bool,
+        schema: Optional[Type[BaseModel]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        _generate_json_streaming, validated against schema with one re-prompt
+        on failure. Only a result that parsed and validated is cached (under
+        the original prompt), so a cache hit never needs the re-prompt.
+        """
+        cache_key = self._cacheable_key(
+            prompt, model, temperature, max_tokens, system_instruction, _response_format(True, schema)
+        ) if use_cache else None
+        cached = self._get_cached_response(cache_key) if cache_key else None
+        if cached is not None:
+            return self._parse_json_response(cached, label)
+
+        result, retry_prompt = _check_structured(
+            self._generate_json_streaming(prompt, model, temperature, max_tokens, system_instruction, label, schema),
+            schema, prompt, label, model,
+        )
+        if retry_prompt is not None:
+            result = _validate_retry(
+                self._generate_json_streaming(
+                    retry_prompt, model, temperature, max_tokens, system_instruction, label, schema
+                ),
+                schema, label,
+            )
+        if cache_key and result is not None:
+            self._set_cached_response(cache_key, json.dumps(result))
+        return result
+
+    async def _generate_structured_async(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system_instruction: Optional[str],
+        label: str,
+        use_cache: bool,
+        schema: Optional[Type[BaseModel]],
+    ) -> Optional[Dict[str, Any]]:
+        """Async _generate_structured."""
+        cache_key = self._cacheable_key(
+            prompt, model, temperature, max_tokens, system_instruction, _response_format(True, schema)
+        ) if use_cache else None
+        cached = await sync_to_async(self._get_cached_response)(cache_key) if cache_key else None
+        if cached is not None:
+            return self._parse_json_response(cached, label)
+
+        result, retry_prompt = _check_structured(
+            await self._generate_json_streaming_async(
+                prompt, model, temperature, max_tokens, system_instruction, label, schema
+            ),
+            schema, prompt, label, model,
+        )
+        if retry_prompt is not None:
+            result = _validate_retry(
+                await self._generate_json_streaming_async(
+                    retry_prompt, model, temperature, max_tokens, system_instruction, label, schema
+                ),
+                schema, label,
+            )
+        if cache_key and result is not None:
+            await sync_to_async(self._set_cached_response)(cache_key, json.dumps(result))
+        return result
+
+    def _generate_json_streaming(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system_instruction: Optional[str],
+        label: str,
+        schema: Optional[Type[BaseModel]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        if not self.is_available():
+            logger.warning("AI service not available - skipping content generation")
+            return None
+
+        try:
+            text, result = self._stream_until_json(prompt, model, temperature, max_tokens, system_instruction, schema)
+        except Exception as e:
+            logger.error(f"Error generating content with Gemini AI: {e}")
+            return None
+        return result if result is not None else self._parse_json_response(text, label)
+
+    async def _generate_json_streaming_async(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system_instruction: Optional[str],
+        label: str,
+        schema: Optional[Type[BaseModel]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Async _generate_json_streaming, on the client's aio API."""
+        if not self.is_available():
+            logger.warning("AI service not available - skipping content generation")
+            return None
+
+        try:
+            text, result = await self._stream_until_json_async(
+                prompt, model, temperature, max_tokens, system_instruction, schema
             )
-            return response.text
         except Exception as e:
             logger.error(f"Error generating content with Gemini AI: {e}")
             return None
+        return result if result is not None else self._parse_json_response(text, label)
+
+    def _stream_until_json(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system_instruction: Optional[str],
+        schema: Optional[Type[BaseModel]] = None,
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Read the stream until its first JSON object closes; returns the text read and the object."""
+        stream = self.client.models.generate_content_stream(
+            model=model,
+            contents=prompt,
+            config=self._content_config(
+                temperature, max_tokens, system_instruction, json_output=True, response_schema=schema
+            ),
+        )
+        parts = []
+        try:
+            for chunk in stream:
+                result = _add_stream_chunk(parts, chunk)
+                if result is not None:
+                    return ''.join(parts), result
+        finally:
+            # Stop the rest of the generation once we have what we need
+            close = getattr(stream, 'close', None)
+            if close is not None:
+                close()
+        return ''.join(parts), None
+
+    async def _stream_until_json_async(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system_instruction: Optional[str],
+        schema: Optional[Type[BaseModel]] = None,
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Async _stream_until_json."""
+        stream = await self.client.aio.models.generate_content_stream(
+            model=model,
+            contents=prompt,
+            config=self._content_config(
+                temperature, max_tokens, system_instruction, json_output=True, response_schema=schema
+            ),
+        )
+        parts = []
+        try:
+            async for chunk in stream:
+                result = _add_stream_chunk(parts, chunk)
+                if result is not None:
+                    return ''.join(parts), result
+        finally:
+            aclose = getattr(stream, 'aclose', None)
+            if aclose is not None:
+                await aclose()
+        return ''.join(parts), None
+
+    @staticmethod
+    def _content_config(
+        temperature: float,
+        max_tokens: int,
+        system_instruction: Optional[str],
+        json_output: bool = False,
+        response_schema: Optional[Any] = None,
+    ) -> types.GenerateContentConfig:
+        return types.GenerateContentConfig(
+            temperature=temperature,
+            max_output_tokens=max_tokens,
+            system_instruction=system_instruction,
+            # JSON mode: the reply is bare JSON, with no fences or commentary
+            response_mime_type='application/json' if json_output or response_schema is not None else None,
+            # Constrained decoding: the reply always has exactly the schema's keys
+            response_schema=response_schema,
+        )
+
+    @classmethod
+    def _cacheable_key(
+        cls,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system_instruction: Optional[str],
+        response_format: str = 'text',
+    ) -> Optional[str]:
+        """Response cache key, or None when the call is too random to reuse."""
+        if temperature > RESPONSE_CACHE_MAX_TEMPERATURE:
+            return None
+        return cls._response_cache_key(prompt, model, temperature, max_tokens, system_instruction, response_format)
+
+    def _generate_templated(
+        self,
+        prompt_template: str,
+        fields: Dict[str, Any],
+        masked: Tuple[str, ...],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system_instruction: str,
+    ) -> Optional[str]:
+        """
+        Generate text that differs between calls only in the masked fields.
+
+        The prompt is sent with a placeholder for each masked field and the
+        reply is cached as a template, so later calls with different values
+        for those fields reuse it and just fill in their own. A reply that
+        drops a placeholder can't be reused, so that call is sent again
+        with the real values instead.
+
+        Unlike other responses, templates are cached whatever the
+        temperature: within AI_TEMPLATE_CACHE_TIMEOUT every recipient gets
+        the same wording, and the variation between generations is lost on
+        purpose. The timeout is kept short so the wording still changes.
+        """
+        placeholders = {name: TEMPLATE_PLACEHOLDER.format(name=name.upper()) for name in masked}
+        skeleton = prompt_template.format_map({**fields, **placeholders})
+        template_instruction = system_instruction + TEMPLATE_SYSTEM_SUFFIX
+
+        cache_key = self._response_cache_key(skeleton, model, temperature, max_tokens, template_instruction)
+        template = self._get_cached_response(cache_key)
+        if template is None:
+            template = self.generate_content(
+                skeleton, model, temperature, max_tokens, template_instruction, use_cache=False
+            )
+            if not template:
+                return None
+            if not all(placeholder in template for placeholder in placeholders.values()):
+                logger.info("Generated template dropped a placeholder; generating directly")
+                return self.generate_content(
+                    prompt_template.format_map(fields), model, temperature, max_tokens, system_instruction
+                )
+            self._set_cached_response(cache_key, template, settings.AI_TEMPLATE_CACHE_TIMEOUT)
+
+        for name, placeholder in placeholders.items():
+            template = template.replace(placeholder, str(fields[name]))
+        return template
+
+    @staticmethod
+    def _parse_json_response(
+        response: Optional[str], context: str
+    ) -> Optional[Dict[str, Any]]:
+        """Decode the JSON object in a model response, logging and returning None on failure."""
+        if not response:
+            return None
+        try:
+            return extract_json_object(response)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse {context}: {e}")
+            return None
+
+    @staticmethod
+    def _response_cache_key(
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system_instruction: Optional[str] = None,
+        response_format: str = 'text',
+    ) -> str:
+        # Collapse whitespace so reformatted copies of the same document share an entry
+        prompt = " ".join(prompt.split())
+        digest = hashlib.sha256()
+        fields = (
+            PROMPT_VERSION, 'gemini', model, f"{temperature:.3f}", str(max_tokens), system_instruction or '',
+            response_format, prompt,
+        )
+        for field in fields:
+            # Length-prefix each field so no two field sequences hash the same bytes
+            data = field.encode()
+            digest.update(len(data).to_bytes(8, 'big'))
+            digest.update(data)
+        return f"ai:response:{digest.hexdigest()}"
+
+    @staticmethod
+    def _get_cached_response(cache_key: str) -> Optional[str]:
+        # A cache outage should cost a Gemini call, not the whole request
+        try:
+            return cache.get(cache_key)
+        except Exception as e:
+            logger.warning(f"AI response cache unavailable: {e}")
+            return None
+
+    @staticmethod
+    def _set_cached_response(cache_key: str, text: str, timeout: Optional[int] = None) -> None:
+        try:
+            cache.set(cache_key, text, timeout or settings.AI_RESPONSE_CACHE_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"AI response cache unavailable: {e}")
 
 
 class DocumentProcessingService(GeminiAIService):
@@ -77,54 +1053,19 @@ class DocumentProcessingService(GeminiAIService):
         Returns:
             Dictionary with extracted lease data or None if extraction fails
         """
-        prompt = f"""
-        Analyze this lease agreement and extract the following information in JSON format:
-
-        {{
-            "tenant_name": "Full name of the tenant(s)",
-            "property_address": "Complete property address",
-            "monthly_rent": "Monthly rent amount as a number (remove currency symbols)",
-            "lease_start_date": "Start date in YYYY-MM-DD format",
-            "lease_end_date": "End date in YYYY-MM-DD format",
-            "security_deposit": "Security deposit amount as a number",
-            "pet_deposit": "Pet deposit if mentioned, otherwise null",
-            "utilities_included": "List of utilities included in rent",
-            "special_terms": "Any special terms or conditions",
-            "confidence_score": "Confidence in extraction accuracy (0.0 to 1.0)"
-        }}
+        prompt = LEASE_EXTRACT_PROMPT.format_map({'document_excerpt': document_content[:LEASE_DOC_LIMIT]})
 
-        Lease document text:
-        {document_content[:10000]}  # Limit to first 10k chars for API limits
-
-        Return only valid JSON. If information is not available, use null values.
-        """
-
-        response = self.generate_content(
+        return self.generate_json_streaming(
             prompt=prompt,
-            model="gemini-2.5-pro",
+            model=pick_extraction_model(document_content),
             temperature=0.1,  # Low temperature for structured output
-            max_tokens=2000
+            max_tokens=2000,
+            system_instruction=LEASE_EXTRACT_SYSTEM,
+            label="lease data",
+            fallback_model="gemini-2.5-pro",
+            schema=LeaseExtraction,
         )
 
-        if not response:
-            return None
-
-        try:
-            # Parse the JSON response
-            import json
-            # Clean the response to extract JSON
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start >= 0 and json_end > json_start:
-                json_str = response[json_start:json_end]
-                return json.loads(json_str)
-            else:
-                logger.error("Could not find JSON in AI response")
-                return None
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse AI response as JSON: {e}")
-            return None
-
     def analyze_tenant_application(self, application_content: str) -> Optional[Dict[str, Any]]:
         """
         Analyze tenant application and extract key information.
@@ -135,52 +1076,62 @@ class DocumentProcessingService(GeminiAIService):
         Returns:
             Dictionary with application analysis or None if analysis fails
         """
-        prompt = f"""
-        Analyze this tenant rental application and extract key information in JSON format:
-
-        {{
-            "applicant_name": "Full name of the applicant",
-            "current_address": "Current residential address",
-            "phone_number": "Phone number",
-            "email": "Email address",
-            "employment_status": "Employment status (employed, self-employed, student, retired, etc.)",
-            "monthly_income": "Monthly income as a number",
-            "credit_score_mentioned": "Credit score if mentioned, otherwise null",
-            "previous_landlord_info": "Information about previous landlord/references",
-            "pets": "Information about pets (type, breed, size)",
-            "move_in_timeline": "Desired move-in timeline",
-            "rental_history": "Summary of rental history",
-            "risk_assessment": "Overall risk assessment (low/medium/high)",
-            "recommendations": "Any recommendations or concerns",
-            "confidence_score": "Confidence in analysis (0.0 to 1.0)"
-        }}
-
-        Application text:
-        {application_content[:8000]}
-
-        Return only valid JSON. Use null for unavailable information.
-        """
-
-        response = self.generate_content(
+        prompt = TENANT_APP_PROMPT.format_map({'application_excerpt': application_content[:APPLICATION_DOC_LIMIT]})
+
+        return self.generate_json_streaming(
             prompt=prompt,
-            model="gemini-2.5-pro",
+            model=pick_extraction_model(application_content),
             temperature=0.2,
-            max_tokens=1500
+            max_tokens=1500,
+            system_instruction=TENANT_APP_SYSTEM,
+            label="tenant application analysis",
+            fallback_model="gemini-2.5-pro",
+            schema=ApplicationExtraction,
         )
 
-        if not response:
-            return None
+    def analyze_documents(self, documents: List[Tuple[str, str]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Analyze several documents concurrently, one Gemini call each.
 
-        try:
-            import json
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start >= 0 and json_end > json_start:
-                json_str = response[json_start:json_end]
-                return json.loads(json_str)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse tenant application analysis: {e}")
-            return None
+        Args:
+            documents: (document_type, document_content) pairs, where the
+                type is 'lease' or 'application'
+
+        Returns:
+            One result (or None) per document, in order
+        """
+        return run_on_gemini_loop(self._analyze_documents(documents))
+
+    async def _analyze_documents(self, documents: List[Tuple[str, str]]) -> List[Optional[Dict[str, Any]]]:
+        return await asyncio.gather(*(
+            self.generate_json_async(
+                **self._document_request(document_type, document_content),
+                model=pick_extraction_model(document_content),
+                fallback_model="gemini-2.5-pro",
+            )
+            for document_type, document_content in documents
+        ))
+
+    @staticmethod
+    def _document_request(document_type: str, document_content: str) -> Dict[str, Any]:
+        """Prompt settings for one document in analyze_documents()."""
+        if document_type == 'lease':
+            return {
+                'prompt': LEASE_EXTRACT_PROMPT.format_map({'document_excerpt': document_content[:LEASE_DOC_LIMIT]}),
+                'system_instruction': LEASE_EXTRACT_SYSTEM,
+                'temperature': 0.1,
+                'max_tokens': 2000,
+                'label': "lease data",
+                'schema': LeaseExtraction,
+            }
+        return {
+            'prompt': TENANT_APP_PROMPT.format_map({'application_excerpt': document_content[:APPLICATION_DOC_LIMIT]}),
+            'system_instruction': TENANT_APP_SYSTEM,
+            'temperature': 0.2,
+            'max_tokens': 1500,
+            'label': "tenant application analysis",
+            'schema': ApplicationExtraction,
+        }
 
     def generate_lease_summary(self, lease_content: str) -> Optional[str]:
         """
@@ -192,28 +1143,14 @@ class DocumentProcessingService(GeminiAIService):
         Returns:
             Concise summary of key lease terms
         """
-        prompt = f"""
-        Create a concise summary of this lease agreement highlighting the most important terms for a property manager:
-
-        Focus on:
-        - Tenant information
-        - Property details
-        - Financial terms (rent, deposits, fees)
-        - Lease duration and renewal terms
-        - Key responsibilities of tenant and landlord
-        - Any special conditions or restrictions
-
-        Keep the summary under 300 words and use clear, professional language.
-
-        Lease text:
-        {lease_content[:5000]}
-        """
+        prompt = LEASE_SUMMARY_PROMPT.format_map({'lease_excerpt': lease_content[:LEASE_SUMMARY_DOC_LIMIT]})
 
         return self.generate_content(
             prompt=prompt,
             model="gemini-2.5-flash",
             temperature=0.3,
-            max_tokens=500
+            max_tokens=500,
+            system_instruction=LEASE_SUMMARY_SYSTEM
         )
 
 
@@ -222,54 +1159,38 @@ class CommunicationService(GeminiAIService):
 
     def generate_tenant_welcome_email(self, tenant_name: str, property_address: str, move_in_date: str) -> Optional[str]:
         """Generate a personalized welcome email for new tenants."""
-        prompt = f"""
-        Write a professional welcome email for a new tenant moving into a rental property.
-
-        Tenant Name: {tenant_name}
-        Property Address: {property_address}
-        Move-in Date: {move_in_date}
-
-        Include:
-        - Warm welcome and excitement about their move
-        - Key move-in information and reminders
-        - Contact information for questions
-        - Brief overview of community rules
-        - Professional and friendly tone
-
-        Format as a complete email with subject line.
-        """
-
-        return self.generate_content(
-            prompt=prompt,
+        # Only the tenant's details differ between welcome emails, so one
+        # generated email is reused with each tenant's details filled in
+        return self._generate_templated(
+            WELCOME_EMAIL_PROMPT,
+            {
+                'tenant_name': tenant_name,
+                'property_address': property_address,
+                'move_in_date': move_in_date,
+            },
+            masked=('tenant_name', 'property_address', 'move_in_date'),
             model="gemini-2.5-flash",
             temperature=0.7,
-            max_tokens=600
+            max_tokens=600,
+            system_instruction=WELCOME_EMAIL_SYSTEM,
         )
 
     def generate_maintenance_response(self, issue_description: str, priority: str, estimated_time: str) -> Optional[str]:
         """Generate a professional response to maintenance requests."""
-        prompt = f"""
-        Write a professional response to a tenant's maintenance request.
-
-        Issue: {issue_description}
-        Priority: {priority}
-        Estimated Resolution Time: {estimated_time}
-
-        Include:
-        - Acknowledgment of the issue
-        - Timeline for resolution
-        - Next steps in the process
-        - Contact information for follow-up
-        - Reassurance about the resolution process
-
-        Keep it concise and professional.
-        """
-
-        return self.generate_content(
-            prompt=prompt,
+        # The issue shapes the reply, but a repeated issue and priority can
+        # reuse one response with its own resolution time filled in
+        return self._generate_templated(
+            MAINTENANCE_RESPONSE_PROMPT,
+            {
+                'issue_description': issue_description,
+                'priority': priority,
+                'estimated_time': estimated_time,
+            },
+            masked=('estimated_time',),
             model="gemini-2.5-flash",
             temperature=0.6,
-            max_tokens=400
+            max_tokens=400,
+            system_instruction=MAINTENANCE_RESPONSE_SYSTEM,
         )
 
 
@@ -287,50 +1208,21 @@ class PropertyInspectionService(GeminiAIService):
         Returns:
             Dictionary with image analysis results
         """
-        prompt = f"""
-        Analyze this property inspection image and provide a detailed assessment in JSON format:
-
-        {{
-            "overall_condition": "excellent/good/fair/poor/critical",
-            "damage_assessment": "Description of any visible damage or issues",
-            "maintenance_needed": "List of maintenance items identified",
-            "safety_concerns": "Any safety issues or hazards detected",
-            "estimated_costs": "Rough cost estimates for any repairs needed",
-            "urgency_level": "low/medium/high/emergency",
-            "recommendations": "Specific recommendations for property manager",
-            "compliance_notes": "Any code compliance or regulatory concerns",
-            "confidence_score": "Confidence in assessment (0.0 to 1.0)"
-        }}
-
-        Image Description: {image_description}
-        Inspection Context: {inspection_context}
+        prompt = INSPECTION_IMAGE_PROMPT.format_map({
+            'image_description': image_description,
+            'inspection_context': inspection_context,
+        })
 
-        Focus on structural integrity, habitability, safety, and maintenance needs.
-        Be specific about locations, severity, and recommended actions.
-        Return only valid JSON.
-        """
-
-        response = self.generate_content(
+        return self.generate_json_streaming(
             prompt=prompt,
-            model="gemini-2.5-pro",
+            model="gemini-2.5-flash",
             temperature=0.2,
-            max_tokens=1000
+            max_tokens=1000,
+            system_instruction=INSPECTION_IMAGE_SYSTEM,
+            label="property inspection analysis",
+            fallback_model="gemini-2.5-pro",
         )
 
-        if not response:
-            return None
-
-        try:
-            import json
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start >= 0 and json_end > json_start:
-                json_str = response[json_start:json_end]
-                return json.loads(json_str)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse property inspection analysis: {e}")
-            return None
-
     def compare_before_after_images(self, before_description: str, after_description: str, work_description: str) -> Optional[Dict[str, Any]]:
         """
         Compare before and after images of property work.
@@ -343,50 +1235,22 @@ class PropertyInspectionService(GeminiAIService):
         Returns:
             Comparison analysis results
         """
-        prompt = f"""
-        Compare before and after images of property maintenance/repair work and provide assessment in JSON format:
+        prompt = BEFORE_AFTER_PROMPT.format_map({
+            'before_description': before_description,
+            'after_description': after_description,
+            'work_description': work_description,
+        })
 
-        {{
-            "work_completion_quality": "excellent/good/satisfactory/poor/incomplete",
-            "issues_resolved": "List of issues that appear to be fixed",
-            "remaining_issues": "Any remaining problems or incomplete work",
-            "quality_assessment": "Assessment of workmanship quality",
-            "compliance_check": "Whether work appears to meet standards",
-            "recommendations": "Any follow-up work or monitoring needed",
-            "cost_accuracy": "Assessment of whether work matches described scope",
-            "safety_improvement": "Safety improvements achieved",
-            "confidence_score": "Confidence in assessment (0.0 to 1.0)"
-        }}
-
-        Before Image: {before_description}
-        After Image: {after_description}
-        Work Description: {work_description}
-
-        Be thorough and objective in your assessment.
-        Return only valid JSON.
-        """
-
-        response = self.generate_content(
+        return self.generate_json_streaming(
             prompt=prompt,
-            model="gemini-2.5-pro",
+            model="gemini-2.5-flash",
             temperature=0.2,
-            max_tokens=800
+            max_tokens=800,
+            system_instruction=BEFORE_AFTER_SYSTEM,
+            label="before/after comparison",
+            fallback_model="gemini-2.5-pro",
         )
 
-        if not response:
-            return None
-
-        try:
-            import json
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start >= 0 and json_end > json_start:
-                json_str = response[json_start:json_end]
-                return json.loads(json_str)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse before/after comparison: {e}")
-            return None
-
 
 class VoiceAssistantService(GeminiAIService):
     """Service for voice-powered property management assistant using Live API."""
@@ -408,70 +1272,26 @@ class VoiceAssistantService(GeminiAIService):
         Returns:
             Response with action to take and voice response
         """
-        prompt = f"""
-        You are TenantBase Assistant, an AI voice assistant for property managers.
-        Process this voice command and determine the appropriate action.
-
-        User Context:
-        - Managed Properties: {user_context.get('properties', [])}
-        - Recent Activities: {user_context.get('recent_activities', [])}
-        - Current Time: {user_context.get('current_time', 'Unknown')}
-
-        Voice Command: "{audio_transcript}"
-
-        Analyze the command and provide:
-        1. The intent/action the user wants to perform
-        2. Required parameters or data needed
-        3. A natural voice response to confirm/ask for clarification
-        4. Any follow-up actions or questions
-
-        Available Actions:
-        - property_info: Get information about a specific property
-        - tenant_info: Get information about a tenant
-        - maintenance_status: Check maintenance request status
-        - financial_summary: Get financial summary
-        - schedule_inspection: Schedule a property inspection
-        - create_task: Create a new task or reminder
-        - occupancy_report: Get occupancy report
-        - rent_due: Check upcoming rent payments
-
-        Return in JSON format:
-        {{
-            "intent": "detected_action",
-            "confidence": 0.0-1.0,
-            "parameters": {{"key": "value"}},
-            "response_text": "Natural voice response",
-            "needs_clarification": false,
-            "clarification_question": "if needed",
-            "suggested_actions": ["follow_up_actions"]
-        }}
-        """
-
-        response = self.generate_content(
+        prompt = VOICE_COMMAND_PROMPT.format_map({
+            'properties': user_context.get('properties', []),
+            'recent_activities': user_context.get('recent_activities', []),
+            'current_time': user_context.get('current_time', 'Unknown'),
+            'transcript': audio_transcript,
+        })
+
+        result = self.generate_json_streaming(
             prompt=prompt,
             model="gemini-2.5-pro",
             temperature=0.3,
-            max_tokens=1000
+            max_tokens=1000,
+            system_instruction=VOICE_COMMAND_SYSTEM,
+            label="voice command analysis",
         )
 
-        if not response:
-            return None
-
-        try:
-            import json
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start >= 0 and json_end > json_start:
-                json_str = response[json_start:json_end]
-                result = json.loads(json_str)
-
-                # Add voice response audio generation (placeholder for now)
-                result['audio_response_url'] = self._generate_audio_response(result.get('response_text', ''))
-
-                return result
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse voice command analysis: {e}")
-            return None
+        if result is not None:
+            # Add voice response audio generation (placeholder for now)
+            result['audio_response_url'] = self._generate_audio_response(result.get('response_text', ''))
+        return result
 
     def generate_property_report_voice(self, property_id: int, user_context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -484,28 +1304,14 @@ class VoiceAssistantService(GeminiAIService):
         Returns:
             Voice report data with audio URL
         """
-        prompt = f"""
-        Generate a concise voice property report for property manager. Keep it under 200 words.
-
-        Property ID: {property_id}
-        User Context: {user_context}
-
-        Cover:
-        1. Current occupancy status
-        2. Financial highlights (rent collected, expenses)
-        3. Active maintenance requests
-        4. Upcoming events (lease renewals, inspections)
-        5. Any urgent issues requiring attention
-
-        Make it conversational and actionable, suitable for voice playback.
-        Focus on key metrics and actionable insights.
-        """
+        prompt = VOICE_REPORT_PROMPT.format_map({'property_id': property_id, 'user_context': user_context})
 
         report_text = self.generate_content(
             prompt=prompt,
             model="gemini-2.5-flash",
             temperature=0.4,
-            max_tokens=400
+            max_tokens=400,
+            system_instruction=VOICE_REPORT_SYSTEM
         )
 
         if report_text:
@@ -534,8 +1340,11 @@ class VoiceAssistantService(GeminiAIService):
             return None
 
         # For now, return a placeholder URL
-        # In production, this would generate and store actual audio
-        return f"/api/audio/generated/{hash(text)}.mp3"
+        # In production, this would generate and store actual audio.
+        # Keyed on a content digest (builtin hash() is salted per process), so
+        # the same text maps to the same URL on every worker.
+        digest = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+        return f"/api/audio/generated/{digest}.mp3"
 
 
 class FinancialAnalysisService(GeminiAIService):
@@ -552,69 +1361,21 @@ class FinancialAnalysisService(GeminiAIService):
         Returns:
             Dictionary with financial analysis and recommendations
         """
-        prompt = f"""
-        Analyze this property's financial performance and provide insights in JSON format:
-
-        {{
-            "profitability_assessment": "excellent/good/fair/poor",
-            "key_financial_ratios": {{
-                "occupancy_rate": "Current occupancy percentage",
-                "noi_margin": "Net Operating Income margin",
-                "cap_rate": "Capitalization rate if available",
-                "cash_flow_stability": "Assessment of cash flow consistency"
-            }},
-            "trend_analysis": {{
-                "revenue_trend": "increasing/stable/declining",
-                "expense_trend": "increasing/stable/declining",
-                "profit_trend": "increasing/stable/declining",
-                "concerning_trends": "List of concerning financial trends"
-            }},
-            "forecast_12_months": {{
-                "expected_revenue": "Projected annual revenue",
-                "expected_expenses": "Projected annual expenses",
-                "expected_profit": "Projected annual profit",
-                "confidence_level": "high/medium/low"
-            }},
-            "recommendations": [
-                "Specific recommendations for improving financial performance"
-            ],
-            "risk_assessment": {{
-                "financial_risks": "Identified financial risks",
-                "mitigation_strategies": "Strategies to address risks",
-                "opportunity_areas": "Areas for financial improvement"
-            }},
-            "benchmarking_insights": "How this property compares to market averages",
-            "confidence_score": "Confidence in analysis (0.0 to 1.0)"
-        }}
-
-        Financial Data for {analysis_period}:
-        {json.dumps(financial_data, indent=2)}
-
-        Provide data-driven insights based on standard real estate financial analysis principles.
-        Return only valid JSON.
-        """
-
-        response = self.generate_content(
+        prompt = FINANCIAL_ANALYSIS_PROMPT.format_map({
+            'analysis_period': analysis_period,
+            'financial_data': dump_prompt_data(financial_data),
+        })
+
+        return self.generate_json_streaming(
             prompt=prompt,
-            model="gemini-2.5-pro",
+            model="gemini-2.5-flash",
             temperature=0.2,
-            max_tokens=1500
+            max_tokens=1500,
+            system_instruction=FINANCIAL_ANALYSIS_SYSTEM,
+            label="financial analysis",
+            fallback_model="gemini-2.5-pro",
         )
 
-        if not response:
-            return None
-
-        try:
-            import json
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start >= 0 and json_end > json_start:
-                json_str = response[json_start:json_end]
-                return json.loads(json_str)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse financial analysis: {e}")
-            return None
-
     def generate_financial_report(self, property_data: Dict[str, Any], report_type: str = "monthly") -> Optional[str]:
         """
         Generate a comprehensive financial report using AI.
@@ -626,61 +1387,17 @@ class FinancialAnalysisService(GeminiAIService):
         Returns:
             Formatted financial report
         """
-        prompt = f"""
-        Generate a comprehensive {report_type} financial report for this property. Include:
-
-        1. EXECUTIVE SUMMARY
-           - Overall financial performance
-           - Key highlights and concerns
-           - Recommendations for action
-
-        2. REVENUE ANALYSIS
-           - Rental income breakdown
-           - Occupancy trends
-           - Revenue projections
-
-        3. EXPENSE ANALYSIS
-           - Major expense categories
-           - Cost trends and variances
-           - Budget vs actual performance
-
-        4. PROFITABILITY METRICS
-           - Net Operating Income (NOI)
-           - Cash flow analysis
-           - Return on investment metrics
-
-        5. KEY PERFORMANCE INDICATORS
-           - Occupancy rates
-           - Collection rates
-           - Expense ratios
-           - Cash-on-cash returns
-
-        6. FORECASTS AND PROJECTIONS
-           - Short-term financial outlook
-           - Market condition impact
-           - Recommended adjustments
-
-        7. RISK ASSESSMENT
-           - Financial vulnerabilities
-           - Market risks
-           - Mitigation strategies
-
-        8. RECOMMENDATIONS
-           - Immediate actions needed
-           - Long-term strategic improvements
-           - Operational efficiencies
-
-        Format as a professional financial report with clear sections and actionable insights.
-
-        Property Data:
-        {json.dumps(property_data, indent=2)}
-        """
+        prompt = FINANCIAL_REPORT_PROMPT.format_map({
+            'report_type': report_type,
+            'property_data': dump_prompt_data(property_data),
+        })
 
         return self.generate_content(
             prompt=prompt,
             model="gemini-2.5-pro",
             temperature=0.3,
-            max_tokens=2500
+            max_tokens=2500,
+            system_instruction=FINANCIAL_REPORT_SYSTEM
         )
 
     def analyze_investment_opportunity(self, property_data: Dict[str, Any], market_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -694,76 +1411,21 @@ class FinancialAnalysisService(GeminiAIService):
         Returns:
             Investment analysis and recommendations
         """
-        prompt = f"""
-        Perform a comprehensive investment analysis for this property in JSON format:
-
-        {{
-            "investment_rating": "excellent/good/fair/poor/high_risk",
-            "financial_projections": {{
-                "year_1_noi": "Projected Net Operating Income",
-                "year_3_noi": "3-year NOI projection",
-                "cap_rate": "Current capitalization rate",
-                "irr": "Internal Rate of Return estimate",
-                "cash_on_cash": "Cash-on-cash return percentage"
-            }},
-            "market_analysis": {{
-                "location_rating": "excellent/good/fair/poor",
-                "market_trends": "Current market conditions and trends",
-                "competitive_position": "How this property compares to competition",
-                "growth_potential": "Future appreciation potential"
-            }},
-            "risk_assessment": {{
-                "overall_risk": "low/medium/high",
-                "specific_risks": ["List of specific investment risks"],
-                "risk_mitigation": ["Strategies to mitigate identified risks"]
-            }},
-            "acquisition_strategy": {{
-                "recommended_price_range": "Suggested acquisition price range",
-                "negotiation_points": ["Key negotiation points"],
-                "due_diligence_priorities": ["Critical due diligence items"]
-            }},
-            "value_add_opportunities": [
-                "Potential improvements to increase property value"
-            ],
-            "exit_strategy": {{
-                "hold_period": "Recommended holding period",
-                "exit_options": ["Potential exit strategies"],
-                "expected_returns": "Projected returns at exit"
-            }},
-            "confidence_score": "Confidence in analysis (0.0 to 1.0)"
-        }}
-
-        Property Data:
-        {json.dumps(property_data, indent=2)}
-
-        Market Data:
-        {json.dumps(market_data, indent=2)}
-
-        Base analysis on real estate investment principles and current market conditions.
-        Return only valid JSON.
-        """
-
-        response = self.generate_content(
+        prompt = INVESTMENT_ANALYSIS_PROMPT.format_map({
+            'property_data': dump_prompt_data(property_data),
+            'market_data': dump_prompt_data(market_data),
+        })
+
+        return self.generate_json_streaming(
             prompt=prompt,
-            model="gemini-2.5-pro",
+            model="gemini-2.5-flash",
             temperature=0.2,
-            max_tokens=2000
+            max_tokens=2000,
+            system_instruction=INVESTMENT_ANALYSIS_SYSTEM,
+            label="investment analysis",
+            fallback_model="gemini-2.5-pro",
         )
 
-        if not response:
-            return None
-
-        try:
-            import json
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start >= 0 and json_end > json_start:
-                json_str = response[json_start:json_end]
-                return json.loads(json_str)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse investment analysis: {e}")
-            return None
-
 
 class MaintenanceAnalysisService(GeminiAIService):
     """Service for analyzing maintenance requests and prioritizing work."""
@@ -780,48 +1442,23 @@ class MaintenanceAnalysisService(GeminiAIService):
         Returns:
             Analysis with priority, cost estimate, and recommendations
         """
-        prompt = f"""
-        Analyze this maintenance request and provide recommendations in JSON format:
-
-        {{
-            "priority_assessment": "Assessed priority level (low/medium/high/emergency)",
-            "estimated_cost": "Estimated cost range (e.g., '$100-500')",
-            "required_skills": "Skills needed (plumbing, electrical, general, etc.)",
-            "parts_needed": "Likely parts or materials required",
-            "safety_concerns": "Any safety issues or hazards",
-            "recommendations": "Suggested approach and timeline",
-            "vendor_needed": "Whether specialized vendor is required",
-            "follow_up_required": "Whether follow-up inspection is needed"
-        }}
-
-        Maintenance Request: {description}
-        Reported Urgency: {urgency}
-        Property Type: {property_type}
+        prompt = MAINTENANCE_ANALYSIS_PROMPT.format_map({
+            'description': description,
+            'urgency': urgency,
+            'property_type': property_type,
+        })
 
-        Return only valid JSON.
-        """
-
-        response = self.generate_content(
+        return self.generate_json_streaming(
             prompt=prompt,
-            model="gemini-2.5-pro",
+            model=pick_extraction_model(description),
             temperature=0.2,
-            max_tokens=800
+            max_tokens=800,
+            system_instruction=MAINTENANCE_ANALYSIS_SYSTEM,
+            label="maintenance analysis",
+            fallback_model="gemini-2.5-pro",
+            schema=MaintenanceExtraction,
         )
 
-        if not response:
-            return None
-
-        try:
-            import json
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start >= 0 and json_end > json_start:
-                json_str = response[json_start:json_end]
-                return json.loads(json_str)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse maintenance analysis: {e}")
-            return None
-
 
 # Global service instances
 document_service = DocumentProcessingService()
@@ -829,4 +1466,4 @@ communication_service = CommunicationService()
 maintenance_service = MaintenanceAnalysisService()
 inspection_service = PropertyInspectionService()
 financial_service = FinancialAnalysisService()
-voice_service = VoiceAssistantService()
\ No newline at end of file
+voice_service = VoiceAssistantService()
@@ -1,3 +1,963 @@
-from django.test import TestCase
+import asyncio
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+from io import BytesIO, StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from google.genai import types
+import httpx
+from rest_framework import serializers
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from leases.models import Lease
+from maintenance.models import MaintenanceRequest
+from properties.models import Property
+from tenants.models import Tenant
+
+from .models import (
+    AIModel,
+    AIProcessingResult,
+    LeaseAnalysis,
+    TenantApplicationAnalysis,
+    MaintenanceAnalysis,
+    VoiceReport,
+    WorkCompletionAnalysis,
+)
+from .renderers import ORJSONParser, ORJSONRenderer
+from .schemas import MaintenanceExtraction
+from .services import (
+    CommunicationService,
+    DocumentProcessingService,
+    GeminiAIService,
+    MaintenanceAnalysisService,
+    VoiceAssistantService,
+    dump_prompt_data,
+    get_gemini_client,
+    extract_json_object,
+    run_on_gemini_loop,
+)
+from .serializers import (
+    AIAnalysisSerializer,
+    AIProcessingResultSerializer,
+    DocumentBatchAnalysisRequestSerializer,
+    FinancialAnalysisRequestSerializer,
+    LeaseAnalysisSerializer,
+    LeaseAnalysisSummarySerializer,
+    MaintenanceAnalysisSerializer,
+    StoredDecimalField,
+    VoiceReportSerializer,
+    VoiceReportSummarySerializer,
+)
+
+User = get_user_model()
+
+
+class AIProcessingResultModelTest(TestCase):
+    """Tests for AIProcessingResult persistence helpers"""
+
+    def build_result(self, input_text):
+        return AIProcessingResult(
+            processing_type="lease_analysis",
+            ai_model_used="gemini-2.5-pro",
+            input_text=input_text,
+            status="completed",
+        )
+
+    def test_str(self):
+        """Test string form shows type, status and creation day, even before saving"""
+        result = self.build_result("Lease A")
+        self.assertEqual(str(result), "lease_analysis - completed (unsaved)")
+
+        result.save()
+        self.assertEqual(str(result), f"lease_analysis - completed ({result.created_at.date()})")
+
+    def test_bulk_persist(self):
+        """Test results and their analyses are inserted in batches and linked"""
+        payloads = [
+            (self.build_result("Lease A"), LeaseAnalysis(tenant_name="Ann", monthly_rent=Decimal("1200.00"))),
+            (self.build_result("Lease B"), LeaseAnalysis(tenant_name="Ben", monthly_rent=Decimal("950.00"))),
+            (self.build_result("Lease C"), None),
+        ]
+
+        with self.assertNumQueries(4):  # savepoint, results, analyses, release
+            created = AIProcessingResult.bulk_persist(payloads, batch_size=10)
+
+        self.assertEqual(len(created), 3)
+        self.assertEqual(AIProcessingResult.objects.count(), 3)
+        analysis = LeaseAnalysis.objects.select_related("ai_result").get(tenant_name="Ben")
+        self.assertEqual(analysis.ai_result.input_text, "Lease B")
+
+        expected = AIProcessingResult.hash_input("Lease A", "gemini-2.5-pro", "lease_analysis")
+        self.assertEqual(AIProcessingResult.find_completed(expected).id, created[0].id)
+
+    def test_model_ids_cached_after_commit(self):
+        """Test model ids are cached only once committed, and every pickable model is seeded"""
+        AIModel.clear_cache()
+        self.assertTrue(AIModel.objects.filter(name="gemini-2.5-flash-lite").exists())
+
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            AIModel.id_for("gemini-test")
+            raise RuntimeError
+        self.assertNotIn("gemini-test", AIModel._ids_by_name)
+        AIModel.clear_cache()
+        self.assertEqual(AIModel._uncommitted, set())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            result = self.build_result("Lease A")
+            result.ai_model_used = "gemini-test"
+            result.save()
+        self.assertEqual(AIModel._ids_by_name["gemini-test"], result.ai_model_id)
+        self.assertEqual(AIProcessingResult.objects.get(id=result.id).ai_model_used, "gemini-test")
+
+    def test_with_subtypes(self):
+        """Test subtype analyses are joined instead of fetched per row"""
+        AIProcessingResult.bulk_persist(
+            (self.build_result(f"Lease {n}"), LeaseAnalysis(tenant_name=f"Tenant {n}")) for n in range(3)
+        )
+
+        with self.assertNumQueries(1):
+            results = AIProcessingResult.objects.with_subtypes(["lease_analysis"])
+            names = [result.lease_analysis.tenant_name for result in results]
+        self.assertEqual(sorted(names), ["Tenant 0", "Tenant 1", "Tenant 2"])
+
+    def test_prune_ai_results(self):
+        """Test old results and their analyses are pruned in batches"""
+        AIProcessingResult.bulk_persist(
+            (self.build_result(f"Lease {n}"), LeaseAnalysis(tenant_name=f"Tenant {n}")) for n in range(3)
+        )
+        recent = AIProcessingResult.objects.create(
+            processing_type="lease_analysis", ai_model_used="gemini-2.5-pro", input_text="Recent", status="completed"
+        )
+        AIProcessingResult.objects.exclude(id=recent.id).update(created_at=timezone.now() - timedelta(days=400))
+
+        call_command("prune_ai_results", "--batch-size", "2", stdout=StringIO())
+
+        self.assertEqual(list(AIProcessingResult.objects.values_list("id", flat=True)), [recent.id])
+        self.assertFalse(LeaseAnalysis.objects.exists())
+
+    def test_analysis_manager_joins_parent(self):
+        """Test analyses come with their parent result in the same query"""
+        AIProcessingResult.bulk_persist(
+            (self.build_result(f"Lease {n}"), LeaseAnalysis(tenant_name=f"Tenant {n}")) for n in range(3)
+        )
+
+        with self.assertNumQueries(1):
+            statuses = [analysis.ai_result.status for analysis in LeaseAnalysis.objects.all()]
+        self.assertEqual(statuses, ["completed"] * 3)
+
+    def test_claim_pending(self):
+        """Test workers claim the oldest pending results of a type"""
+        results = [
+            AIProcessingResult.objects.create(
+                processing_type=processing_type, ai_model_used="gemini-2.5-pro", input_text="Queued", status="pending"
+            )
+            for processing_type in ["lease_analysis", "lease_analysis", "lease_analysis", "communication"]
+        ]
+
+        claimed = AIProcessingResult.claim_pending("lease_analysis", limit=2)
+
+        self.assertEqual(claimed, [results[0].id, results[1].id])
+        self.assertEqual(
+            list(AIProcessingResult.objects.order_by("id").values_list("status", flat=True)),
+            ["processing", "processing", "pending", "pending"],
+        )
+
+    def test_work_completion_maintenance_request(self):
+        """Test work completion analyses read their maintenance request from the parent result"""
+        owner = User.objects.create_user(username="owner", email="owner@example.com", password="owner123")
+        property_obj = Property.objects.create(
+            owner=owner,
+            property_name="Test Property",
+            address="123 Test St",
+            city="Test City",
+            state="TS",
+            zip_code="12345",
+            property_type="apartment",
+            total_units=5,
+        )
+        request = MaintenanceRequest.objects.create(property_obj=property_obj, title="Leak", description="Sink leak")
+        result = AIProcessingResult.objects.create(
+            processing_type="work_completion",
+            ai_model_used="gemini-2.5-pro",
+            input_text="Done",
+            status="completed",
+            maintenance_request=request,
+        )
+        analysis = WorkCompletionAnalysis.objects.create(ai_result=result, completion_quality="good")
+
+        self.assertEqual(WorkCompletionAnalysis.objects.get(id=analysis.id).maintenance_request, request)
+
+    def test_structured_output_round_trip(self):
+        """Test JSON columns round-trip through the orjson-backed field"""
+        result = self.build_result("Lease A")
+        result.structured_output = {"rent": 1200.5, "clauses": ["pets", "parking"], "signed": True, "notes": None}
+        result.save()
+
+        result.refresh_from_db()
+        self.assertEqual(
+            result.structured_output,
+            {"rent": 1200.5, "clauses": ["pets", "parking"], "signed": True, "notes": None},
+        )
+        self.assertTrue(AIProcessingResult.objects.filter(structured_output__signed=True).exists())
+
+    def test_ai_model_lookup(self):
+        """Test model names are stored once in the lookup table and resolved without queries"""
+        first = self.build_result("Lease A")
+        first.save()
+        second = AIProcessingResult.objects.create(
+            processing_type="lease_analysis", ai_model_used="gemini-2.5-pro", input_text="Lease B", status="completed"
+        )
+
+        self.assertEqual(first.ai_model_id, second.ai_model_id)
+        self.assertEqual(AIModel.objects.filter(name="gemini-2.5-pro").count(), 1)
+        result = AIProcessingResult.objects.get(pk=second.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(result.ai_model_used, "gemini-2.5-pro")
+
+
+class ORJSONRendererTest(TestCase):
+    """Tests for the orjson renderer and parser used by the AI endpoints"""
+
+    def test_matches_stock_renderer(self):
+        """Test output decodes to the same document DRF's JSONRenderer produces"""
+        data = {
+            "cost": Decimal("0.001250"),
+            "created_at": timezone.now(),
+            "ratios": {1: 0.5, "cap_rate": 7.25},
+            "items": ["roof", None, True],
+        }
+        rendered = ORJSONRenderer().render(data)
+        self.assertEqual(json.loads(rendered), json.loads(JSONRenderer().render(data)))
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+    def test_parser(self):
+        """Test request bodies are parsed and malformed JSON is rejected"""
+        parser = ORJSONParser()
+        self.assertEqual(parser.parse(BytesIO(b'{"command": "status", "ids": [1, 2]}')), {"command": "status", "ids": [1, 2]})
+        with self.assertRaises(ParseError):
+            parser.parse(BytesIO(b"{not json"))
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class GeminiResponseCacheTest(TestCase):
+    """Tests for caching Gemini responses to repeated prompts"""
+
+    def setUp(self):
+        cache.clear()
+        self.service = GeminiAIService()
+        self.service.client = mock.Mock()
+        self.service.client.models.generate_content.return_value = mock.Mock(text='{"ok": true}')
+
+    def test_low_temperature_response_cached(self):
+        """Test identical low-temperature prompts reach Gemini once"""
+        first = self.service.generate_content("Extract lease", temperature=0.1)
+        second = self.service.generate_content("Extract lease", temperature=0.1)
+
+        self.assertEqual(first, '{"ok": true}')
+        self.assertEqual(second, first)
+        self.assertEqual(self.service.client.models.generate_content.call_count, 1)
+
+        self.service.generate_content("  Extract\n\tlease ", temperature=0.1)
+        self.assertEqual(self.service.client.models.generate_content.call_count, 1)
+
+        self.service.generate_content("Extract lease", temperature=0.1, max_tokens=2000)
+        self.assertEqual(self.service.client.models.generate_content.call_count, 2)
+
+    def test_use_cache_false_bypasses_cache(self):
+        """Test callers can force a fresh generation"""
+        self.service.generate_content("Extract lease", temperature=0.1)
+        self.service.generate_content("Extract lease", temperature=0.1, use_cache=False)
+        self.assertEqual(self.service.client.models.generate_content.call_count, 2)
+
+    def test_system_instruction_sent_and_keyed(self):
+        """Test fixed instructions go in the config and separate cache entries"""
+        self.service.generate_content("Issue: leak", temperature=0.1, system_instruction="Summarize")
+        self.service.generate_content("Issue: leak", temperature=0.1, system_instruction="Triage")
+
+        calls = self.service.client.models.generate_content.call_args_list
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(calls[0].kwargs["config"].system_instruction, "Summarize")
+        self.assertEqual(calls[0].kwargs["contents"], "Issue: leak")
+
+    def test_response_format_keyed(self):
+        """Test text, JSON and schema-constrained replies to one prompt get separate entries"""
+        self.service.generate_content("Extract lease", temperature=0.1)
+        self.service.generate_content("Extract lease", temperature=0.1, json_output=True)
+        self.service.generate_content("Extract lease", temperature=0.1, response_schema=MaintenanceExtraction)
+        self.service.generate_content("Extract lease", temperature=0.1, json_output=True)
+
+        self.assertEqual(self.service.client.models.generate_content.call_count, 3)
+
+    def test_async_shares_cache(self):
+        """Test the async variant calls the aio client and reuses cached responses"""
+        self.service.client.aio.models.generate_content = mock.AsyncMock(return_value=mock.Mock(text="summary"))
+
+        async def run():
+            return await asyncio.gather(
+                self.service.generate_content_async("Lease A", temperature=0.1),
+                self.service.generate_content_async("Lease B", temperature=0.1),
+            )
+
+        self.assertEqual(run_on_gemini_loop(run()), ["summary", "summary"])
+        self.assertEqual(self.service.client.aio.models.generate_content.await_count, 2)
+        self.assertEqual(self.service.generate_content("Lease A", temperature=0.1), "summary")
+        self.service.client.models.generate_content.assert_not_called()
+
+    def test_high_temperature_not_cached(self):
+        """Test creative prompts are regenerated every time"""
+        self.service.generate_content("Write a welcome email", temperature=0.7)
+        self.service.generate_content("Write a welcome email", temperature=0.7)
+        self.assertEqual(self.service.client.models.generate_content.call_count, 2)
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class TemplatedGenerationTest(TestCase):
+    """Tests for reusing one generated message across recipients"""
+
+    def setUp(self):
+        cache.clear()
+        self.service = CommunicationService()
+        self.service.client = mock.Mock()
+
+    def test_welcome_email_reused_across_tenants(self):
+        """Test later tenants get the cached email with their own details filled in"""
+        self.service.client.models.generate_content.return_value = mock.Mock(
+            text="Dear [[TENANT_NAME]], welcome to [[PROPERTY_ADDRESS]]! See you on [[MOVE_IN_DATE]]."
+        )
+
+        first = self.service.generate_tenant_welcome_email("Ann", "1 Main St", "2024-06-01")
+        second = self.service.generate_tenant_welcome_email("Bob", "2 Oak Ave", "2024-07-15")
+
+        self.assertEqual(first, "Dear Ann, welcome to 1 Main St! See you on 2024-06-01.")
+        self.assertEqual(second, "Dear Bob, welcome to 2 Oak Ave! See you on 2024-07-15.")
+        self.assertEqual(self.service.client.models.generate_content.call_count, 1)
+        self.assertIn("[[TENANT_NAME]]", self.service.client.models.generate_content.call_args.kwargs["contents"])
+
+    @override_settings(AI_TEMPLATE_CACHE_TIMEOUT=60)
+    def test_template_cached_for_template_timeout(self):
+        """Test templates expire after their own short timeout, not the response cache's"""
+        self.service.client.models.generate_content.return_value = mock.Mock(
+            text="Dear [[TENANT_NAME]], welcome to [[PROPERTY_ADDRESS]] on [[MOVE_IN_DATE]]!"
+        )
+
+        with mock.patch("ai.services.cache", wraps=cache) as cached:
+            self.service.generate_tenant_welcome_email("Ann", "1 Main St", "2024-06-01")
+
+        self.assertEqual(cached.set.call_args.args[2], 60)
+
+    def test_dropped_placeholder_generated_directly(self):
+        """Test a template missing a placeholder isn't cached and the real values are sent instead"""
+        self.service.client.models.generate_content.side_effect = [
+            mock.Mock(text="We will fix the leak soon."),
+            mock.Mock(text="We will fix the leak within 2 days."),
+            mock.Mock(text="We will fix the leak within [[ESTIMATED_TIME]]."),
+        ]
+
+        response = self.service.generate_maintenance_response("Leaking sink", "high", "2 days")
+
+        self.assertEqual(response, "We will fix the leak within 2 days.")
+        contents = self.service.client.models.generate_content.call_args.kwargs["contents"]
+        self.assertIn("Estimated Resolution Time: 2 days", contents)
+        self.assertEqual(
+            self.service.generate_maintenance_response("Leaking sink", "high", "3 days"),
+            "We will fix the leak within 3 days.",
+        )
+        self.assertEqual(self.service.client.models.generate_content.call_count, 3)
+
+        # Only the template with its placeholder intact was cached
+        self.assertEqual(
+            self.service.generate_maintenance_response("Leaking sink", "high", "4 days"),
+            "We will fix the leak within 4 days.",
+        )
+        self.assertEqual(self.service.client.models.generate_content.call_count, 3)
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class BatchExtractionTest(TestCase):
+    """Tests for extracting several documents in one request"""
+
+    def setUp(self):
+        cache.clear()
+        self.service = DocumentProcessingService()
+        self.service.client = mock.Mock()
+
+    def test_analyze_documents_concurrently(self):
+        """Test each document gets its own async call and results keep their order"""
+        replies = {"Lease for Ann": '{"tenant_name": "Ann"}', "App for Bob": '{"applicant_name": "Bob"}'}
+
+        async def chunks(text):
+            for chunk_text in (text[:10], text[10:], "\ntrailing"):
+                yield mock.Mock(text=chunk_text)
+
+        async def generate(model, contents, config):
+            return chunks(next(text for key, text in replies.items() if key in contents))
+
+        self.service.client.aio.models.generate_content_stream = mock.AsyncMock(side_effect=generate)
+
+        results = self.service.analyze_documents([("lease", "Lease for Ann"), ("application", "App for Bob")])
+
+        self.assertEqual(results, [{"tenant_name": "Ann"}, {"applicant_name": "Bob"}])
+        self.assertEqual(self.service.client.aio.models.generate_content_stream.await_count, 2)
+
+    @override_settings(GEMINI_API_KEY="test-key")
+    def test_analyze_documents_reuses_client_across_calls(self):
+        """Test repeated batches share one event loop, so the client's async pool stays usable"""
+        loops = []
+
+        async def handler(request):
+            loops.append(asyncio.get_running_loop())
+            chunk = {"candidates": [{"content": {"role": "model", "parts": [{"text": '{"tenant_name": "Ann"}'}]}}]}
+            return httpx.Response(
+                200, content=f"data: {json.dumps(chunk)}\n\n", headers={"content-type": "text/event-stream"}
+            )
+
+        http_options = types.HttpOptions(async_client_args={"transport": httpx.MockTransport(handler)})
+        get_gemini_client.cache_clear()
+        self.addCleanup(get_gemini_client.cache_clear)
+        with mock.patch("ai.services.gemini_http_options", return_value=http_options):
+            first = DocumentProcessingService().analyze_documents([("lease", "Lease for Ann")])
+            second = DocumentProcessingService().analyze_documents([("lease", "Another lease for Ann")])
+
+        self.assertEqual(first, [{"tenant_name": "Ann"}])
+        self.assertEqual(second, [{"tenant_name": "Ann"}])
+        self.assertEqual(len(loops), 2)
+        self.assertIs(loops[0], loops[1])
+        self.assertFalse(loops[0].is_closed())
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class StreamingJSONTest(TestCase):
+    """Tests for decoding JSON from a streamed Gemini response"""
+
+    def setUp(self):
+        cache.clear()
+        self.service = MaintenanceAnalysisService()
+        self.service.client = mock.Mock()
+        self.consumed = []
+
+    def stream(self, *texts):
+        for text in texts:
+            self.consumed.append(text)
+            yield mock.Mock(text=text)
+
+    def test_stops_when_object_closes(self):
+        """Test the stream is abandoned once the object is complete, and the result cached"""
+        self.service.client.models.generate_content_stream.return_value = self.stream(
+            '```json\n{"priority_assessment": "high", ', '"parts_needed": ["valve"]}', "\n```\nExtra notes", " more"
+        )
+
+        result = self.service.analyze_maintenance_request("Leaking pipe", "high", "apartment")
+
+        self.assertEqual(result, {"priority_assessment": "high", "parts_needed": ["valve"]})
+        self.assertEqual(len(self.consumed), 2)
+        config = self.service.client.models.generate_content_stream.call_args.kwargs["config"]
+        self.assertEqual(config.response_mime_type, "application/json")
+        self.assertIs(config.response_schema, MaintenanceExtraction)
+        self.assertEqual(self.service.analyze_maintenance_request("Leaking pipe", "high", "apartment"), result)
+        self.assertEqual(self.service.client.models.generate_content_stream.call_count, 1)
+
+    def test_low_confidence_retried_on_pro(self):
+        """Test a low-confidence flash result is retried on pro and the better one kept"""
+        streams = {
+            "gemini-2.5-flash": self.stream('{"tenant_name": "A. Smith", "confidence_score": 0.4}'),
+            "gemini-2.5-pro": self.stream('{"tenant_name": "Ann Smith", "confidence_score": "0.9"}'),
+        }
+        self.service.client.models.generate_content_stream.side_effect = lambda model, **kwargs: streams[model]
+
+        result = self.service.generate_json_streaming(
+            "Lease text", model="gemini-2.5-flash", temperature=0.1, fallback_model="gemini-2.5-pro"
+        )
+
+        self.assertEqual(result["tenant_name"], "Ann Smith")
+
+    def test_model_picked_by_input_length(self):
+        """Test short inputs start on flash-lite and longer ones on flash"""
+        self.service.client.models.generate_content_stream.side_effect = lambda **kwargs: self.stream(
+            '{"priority_assessment": "low"}'
+        )
+
+        self.service.analyze_maintenance_request("Loose handle", "low", "apartment")
+        self.service.analyze_maintenance_request("Leak " * 500, "low", "apartment")
+
+        models = [call.kwargs["model"] for call in self.service.client.models.generate_content_stream.call_args_list]
+        self.assertEqual(models, ["gemini-2.5-flash-lite", "gemini-2.5-flash"])
+
+    def test_malformed_object(self):
+        """Test a response that never holds a valid object gives None"""
+        self.service.client.models.generate_content_stream.return_value = self.stream('{"priority_assessment": }')
+        self.assertIsNone(self.service.analyze_maintenance_request("Leaking pipe", "high", "apartment"))
+
+    def test_invalid_object_reprompted_with_errors(self):
+        """Test a reply failing its schema is re-prompted once with the validation errors"""
+        self.service.client.models.generate_content_stream.side_effect = [
+            self.stream('{"priority_assessment": "high", "vendor_needed": "a plumber"}'),
+            self.stream('{"priority_assessment": "high", "vendor_needed": true}'),
+        ]
+
+        result = self.service.analyze_maintenance_request("Leaking pipe", "high", "apartment")
+
+        self.assertEqual(result, {"priority_assessment": "high", "vendor_needed": True})
+        calls = self.service.client.models.generate_content_stream.call_args_list
+        self.assertEqual(len(calls), 2)
+        self.assertIn("Your output had error:", calls[1].kwargs["contents"])
+        self.assertIn("vendor_needed", calls[1].kwargs["contents"])
+
+        # The validated result is what's cached, so a repeat needs neither call
+        self.assertEqual(self.service.analyze_maintenance_request("Leaking pipe", "high", "apartment"), result)
+        self.assertEqual(self.service.client.models.generate_content_stream.call_count, 2)
+
+    def test_async_invalid_object_reprompted(self):
+        """Test the async path re-prompts and caches the same way as the sync one"""
+        replies = iter(['{"follow_up_required": "maybe"}', '{"follow_up_required": false}'])
+
+        async def generate(model, contents, config):
+            async def chunks():
+                yield mock.Mock(text=next(replies))
+            return chunks()
+
+        self.service.client.aio.models.generate_content_stream = mock.AsyncMock(side_effect=generate)
+
+        for _ in range(2):
+            result = run_on_gemini_loop(
+                self.service.generate_json_async("Leaking pipe", temperature=0.1, schema=MaintenanceExtraction)
+            )
+            self.assertEqual(result, {"follow_up_required": False})
+        self.assertEqual(self.service.client.aio.models.generate_content_stream.await_count, 2)
+
+    def test_invalid_after_reprompt(self):
+        """Test a reply still failing its schema after the re-prompt gives None"""
+        self.service.client.models.generate_content_stream.side_effect = lambda **kwargs: self.stream(
+            '{"priority_assessment": "high", "follow_up_required": "maybe"}'
+        )
+        for _ in range(2):
+            self.assertIsNone(
+                self.service.generate_json_streaming("Leaking pipe", temperature=0.1, schema=MaintenanceExtraction)
+            )
+
+        # Nothing invalid was cached, so the repeat reaches Gemini again
+        self.assertEqual(self.service.client.models.generate_content_stream.call_count, 4)
+
+
+class GeminiClientTest(TestCase):
+    """Tests for sharing the Gemini client between services"""
+
+    def tearDown(self):
+        get_gemini_client.cache_clear()
+
+    @override_settings(GEMINI_API_KEY="test-key")
+    @mock.patch("ai.services.genai.Client")
+    def test_one_client_per_key(self, client_class):
+        """Test every service gets the same client instance"""
+        get_gemini_client.cache_clear()
+        document = DocumentProcessingService()
+        voice = VoiceAssistantService()
+
+        self.assertIs(document.client, voice.client)
+        client_class.assert_called_once()
+        self.assertEqual(client_class.call_args.kwargs["api_key"], "test-key")
+
+    @override_settings(GEMINI_API_KEY="test-key")
+    @mock.patch("ai.services.genai.Client")
+    def test_pooled_http_options(self, client_class):
+        """Test the shared client is given a keep-alive pool for sync and async calls"""
+        get_gemini_client.cache_clear()
+        DocumentProcessingService().client
+
+        http_options = client_class.call_args.kwargs["http_options"]
+        self.assertEqual(http_options.client_args["limits"].max_keepalive_connections, 50)
+        self.assertEqual(http_options.async_client_args, http_options.client_args)
+        httpx.Client(**http_options.client_args).close()
+
+    @override_settings(GEMINI_API_KEY="test-key")
+    @mock.patch("ai.services.genai.Client")
+    def test_client_created_on_first_use(self, client_class):
+        """Test constructing a service doesn't create the client until it is needed"""
+        get_gemini_client.cache_clear()
+        service = DocumentProcessingService()
+        client_class.assert_not_called()
+
+        self.assertTrue(service.is_available())
+        client_class.assert_called_once()
+
+    @override_settings(GEMINI_API_KEY="test-key")
+    @mock.patch("ai.services.genai.Client", side_effect=ValueError("bad key"))
+    def test_client_failure_disables_service(self, client_class):
+        """Test a client that fails to initialize disables the service without retrying"""
+        get_gemini_client.cache_clear()
+        service = DocumentProcessingService()
+
+        self.assertFalse(service.is_available())
+        self.assertFalse(service.is_available())
+        self.assertEqual(client_class.call_count, 1)
+
+
+class VoiceAudioURLTest(TestCase):
+    """Tests for generated audio URLs"""
+
+    def test_url_is_content_addressed(self):
+        """Test the same text always maps to the same URL"""
+        url = VoiceAssistantService()._generate_audio_response("Rent is due Friday")
+        self.assertEqual(url, "/api/audio/generated/e5a9c1cb6025da34429ecf37b10ff34c.mp3")
+        self.assertIsNone(VoiceAssistantService()._generate_audio_response(""))
+
+
+class ExtractJSONObjectTest(TestCase):
+    """Tests for pulling the JSON object out of a model response"""
+
+    def test_fenced_response_with_trailing_text(self):
+        """Test fences, prose and braces inside strings don't confuse decoding"""
+        text = 'Here you go:\n```json\n{"terms": "pay {rent} monthly", "fees": {"pet": 50}}\n```\nNote: {draft}'
+        self.assertEqual(extract_json_object(text), {"terms": "pay {rent} monthly", "fees": {"pet": 50}})
+
+    def test_fenced_object_only(self):
+        """Test the common fenced-object response decodes"""
+        self.assertEqual(extract_json_object('```json\n{"urgency_level": "high"}\n```\n'), {"urgency_level": "high"})
+
+    def test_prompt_data_matches_stdlib(self):
+        """Test prompt payloads serialize like json.dumps(indent=2)"""
+        data = {"rent": 1500.5, "units": [1, 2], "notes": None, 2024: "year"}
+        self.assertEqual(dump_prompt_data(data), json.dumps(data, indent=2))
+
+    def test_missing_and_malformed(self):
+        """Test no object gives None and a broken one raises"""
+        self.assertIsNone(extract_json_object("No JSON here"))
+        with self.assertRaises(json.JSONDecodeError):
+            extract_json_object('{"tenant_name": ')
+
+
+class CachedFieldsSerializerTest(TestCase):
+    """Tests for serializers that build their fields once per class"""
+
+    def test_fields_are_bound_per_instance(self):
+        """Test each instance gets its own bound copies of the cached fields"""
+        result = AIProcessingResult.objects.create(
+            processing_type="lease_analysis", ai_model_used="gemini-2.5-pro", input_text="Lease", status="completed"
+        )
+        analysis = LeaseAnalysis.objects.create(ai_result=result, tenant_name="Ann")
+
+        first = LeaseAnalysisSerializer(analysis)
+        second = LeaseAnalysisSerializer(analysis)
+
+        self.assertIsNot(first.fields["ai_result"], second.fields["ai_result"])
+        self.assertIs(second.fields["ai_result"].parent, second)
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(second.data["ai_result"]["ai_model_used"], "gemini-2.5-pro")
+
+    def test_list_field_child_gets_request_context(self):
+        """Test many=True fields get their own child, bound to the instance and its context"""
+        request = object()
+        first = DocumentBatchAnalysisRequestSerializer(context={"request": request})
+        second = DocumentBatchAnalysisRequestSerializer(context={"request": object()})
+
+        child = first.fields["documents"].child
+        self.assertIsNot(child, second.fields["documents"].child)
+        self.assertIs(child.root, first)
+        self.assertIs(child.context["request"], request)
+
+    def test_estimated_cost_range(self):
+        """Test the cost range is formatted on the model and passed through"""
+        result = AIProcessingResult.objects.create(
+            processing_type="maintenance_request", ai_model_used="gemini-2.5-pro", input_text="Leak", status="completed"
+        )
+        analysis = MaintenanceAnalysis.objects.create(
+            ai_result=result, estimated_cost_min=Decimal("100"), estimated_cost_max=Decimal("250.5")
+        )
+
+        self.assertEqual(MaintenanceAnalysisSerializer(analysis).data["estimated_cost_range"], "$100.00 - $250.50")
+        self.assertEqual(MaintenanceAnalysis(estimated_cost_max=Decimal("80")).estimated_cost_range, "Up to $80.00")
+        self.assertIsNone(MaintenanceAnalysis().estimated_cost_range)
+
+    def test_with_entity_names(self):
+        """Test result listings serialize related names without a query per row"""
+        owner = User.objects.create_user(username="owner", email="owner@example.com", password="owner123")
+        property_obj = Property.objects.create(
+            owner=owner,
+            property_name="Test Property",
+            address="123 Test St",
+            city="Test City",
+            state="TS",
+            zip_code="12345",
+            property_type="apartment",
+            total_units=5,
+        )
+        tenant = Tenant.objects.create(first_name="John", last_name="Doe", email="john@example.com")
+        lease = Lease.objects.create(
+            property_obj=property_obj,
+            tenant=tenant,
+            lease_start_date=date(2026, 1, 1),
+            lease_end_date=date(2026, 12, 31),
+            monthly_rent=Decimal("2000.00"),
+        )
+        for n in range(3):
+            AIProcessingResult.objects.create(
+                processing_type="lease_analysis",
+                ai_model_used="gemini-2.5-pro",
+                input_text=f"Lease {n}",
+                status="completed",
+                lease=lease,
+            )
+
+        with self.assertNumQueries(1):
+            data = AIProcessingResultSerializer(AIProcessingResult.objects.with_entity_names(), many=True).data
+
+        self.assertEqual([row["lease_tenant_name"] for row in data], ["John Doe"] * 3)
+        self.assertEqual(data[0]["tenant_name"], None)
+
+        # Results loaded without the annotations walk the relations instead
+        result = AIProcessingResult.objects.first()
+        result.property_obj = property_obj
+        data = AIProcessingResultSerializer(result).data
+        self.assertEqual(data["property_name"], "Test Property")
+        self.assertEqual(data["lease_tenant_name"], "John Doe")
+        self.assertEqual(data["maintenance_title"], None)
+
+    def test_summary_serializer(self):
+        """Test list serializers return the AI result id in place of the nested result"""
+        result = AIProcessingResult.objects.create(
+            processing_type="lease_analysis", ai_model_used="gemini-2.5-pro", input_text="Lease", status="completed"
+        )
+        analysis = LeaseAnalysis.objects.create(ai_result=result, tenant_name="Ann")
+
+        data = LeaseAnalysisSummarySerializer(analysis).data
+
+        self.assertNotIn("ai_result", data)
+        self.assertEqual(data["ai_result_id"], result.id)
+        self.assertEqual(list(data)[:3], ["id", "ai_result_id", "tenant_name"])
+        self.assertIn("ai_result", LeaseAnalysisSerializer(analysis).data)
+
+    def test_fields_prebuilt_at_startup(self):
+        """Test field templates exist before any serializer is instantiated by a request"""
+        self.assertIn("_cached_fields_template", VoiceReportSerializer.__dict__)
+        self.assertIn("_cached_fields_template", VoiceReportSummarySerializer.__dict__)
+        self.assertNotIn("_cached_fields_template", AIAnalysisSerializer.__dict__)
+
+    def test_readable_fields_resolved_once(self):
+        """Test readable fields are resolved once per serializer, not once per row"""
+        serializer = LeaseAnalysisSummarySerializer()
+
+        self.assertIs(serializer._readable_fields, serializer._readable_fields)
+        self.assertEqual([field.field_name for field in serializer._readable_fields][:2], ["id", "ai_result_id"])
+        self.assertIs(serializer._readable_fields[1].parent, serializer)
+
+    def test_stored_decimal_field(self):
+        """Test stored decimals render exactly as DRF's DecimalField renders them"""
+        stock = serializers.DecimalField(max_digits=10, decimal_places=2)
+        fast = StoredDecimalField(max_digits=10, decimal_places=2)
+        for value in [Decimal("1250.00"), Decimal("-0.50"), Decimal("0.00"), Decimal("7"), Decimal("3.14159")]:
+            self.assertEqual(fast.to_representation(value), stock.to_representation(value))
+
+        self.assertIsInstance(MaintenanceAnalysisSerializer().fields["estimated_cost_min"], StoredDecimalField)
+
+    def test_request_choices_built_once(self):
+        """Test request serializers share one choice map and still validate against it"""
+        invalid = FinancialAnalysisRequestSerializer(data={"property_id": 1, "analysis_period": "custom"})
+        valid = FinancialAnalysisRequestSerializer(data={"property_id": 1, "analysis_period": "6_months"})
+
+        self.assertFalse(invalid.is_valid())
+        self.assertIn("analysis_period", invalid.errors)
+        self.assertTrue(valid.is_valid())
+        self.assertEqual(valid.validated_data["report_type"], "monthly")
+        self.assertIs(
+            invalid.fields["report_type"].choice_strings_to_values,
+            valid.fields["report_type"].choice_strings_to_values,
+        )
+
+
+class AIProcessingResultAPITest(APITestCase):
+    """Tests for the AI result endpoints"""
+
+    def setUp(self):
+        self.owner = User.objects.create_user(username="owner", email="owner@example.com", password="owner123")
+        self.client.force_authenticate(user=self.owner)
+        self.property = Property.objects.create(
+            owner=self.owner,
+            property_name="Test Property",
+            address="123 Test St",
+            city="Test City",
+            state="TS",
+            zip_code="12345",
+            property_type="apartment",
+            total_units=5,
+        )
+        for n in range(3):
+            AIProcessingResult.objects.create(
+                processing_type="maintenance_request",
+                ai_model_used="gemini-2.5-flash",
+                input_text=f"Issue {n}",
+                status="completed",
+                property_obj=self.property,
+                cost_estimate=Decimal("0.000125"),
+            )
+
+    def test_fast_list(self):
+        """Test the values-based listing matches the serialized listing for its columns"""
+        full = self.client.get(reverse("aiprocessingresult-list")).data["results"]
+        response = self.client.get(reverse("aiprocessingresult-fast-list"))
+
+        self.assertEqual(response.status_code, 200)
+        fast = response.data["results"]
+        self.assertEqual([row["id"] for row in fast], [row["id"] for row in full])
+        self.assertEqual(fast[0]["property_name"], "Test Property")
+        self.assertEqual(fast[0]["ai_model_used"], "gemini-2.5-flash")
+        self.assertNotIn("structured_output", fast[0])
+
+    def test_export(self):
+        """Test export streams one JSON document per result"""
+        AIProcessingResult.objects.update(structured_output={"priority": "high"})
+
+        response = self.client.get(reverse("aiprocessingresult-export"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]["structured_output"], {"priority": "high"})
+        self.assertEqual(rows[0]["property_name"], "Test Property")
+
+    def test_analysis_fast_list(self):
+        """Test analysis viewsets list every column as plain rows"""
+        result = AIProcessingResult.objects.first()
+        MaintenanceAnalysis.objects.create(
+            ai_result=result,
+            priority_assessment="high",
+            required_skills=["plumbing"],
+            estimated_cost_min=Decimal("100"),
+            estimated_cost_max=Decimal("250.5"),
+        )
+
+        response = self.client.get(reverse("maintenanceanalysis-fast-list"))
+
+        self.assertEqual(response.status_code, 200)
+        row = response.data["results"][0]
+        self.assertEqual(row["ai_result_id"], result.id)
+        self.assertEqual(row["priority_assessment"], "high")
+        self.assertEqual(row["required_skills"], ["plumbing"])
+        self.assertEqual(row["estimated_cost_range"], "$100.00 - $250.50")
+
+    def test_maintenance_analysis_skill_and_part_filters(self):
+        """Test ?skill= and ?part= keep analyses whose lists hold the value, on any backend"""
+        plumbing, electrical, _ = AIProcessingResult.objects.order_by("id")
+        plumbing = MaintenanceAnalysis.objects.create(
+            ai_result=plumbing, required_skills=["plumbing", "general"], parts_needed=["valve"]
+        )
+        MaintenanceAnalysis.objects.create(
+            ai_result=electrical, required_skills=["electrical"], parts_needed=["breaker", "valve cover"]
+        )
+        url = reverse("maintenanceanalysis-list")
+
+        by_skill = self.client.get(url, {"skill": "plumbing"}).data["results"]
+        by_part = self.client.get(url, {"part": "valve"}).data["results"]
+
+        self.assertEqual([row["id"] for row in by_skill], [plumbing.id])
+        self.assertEqual([row["id"] for row in by_part], [plumbing.id])
+        self.assertEqual(self.client.get(url, {"skill": "roofing"}).data["results"], [])
+
+    def test_work_completion_retrieve(self):
+        """Test work completion analyses are read back through the model serializer"""
+        result = AIProcessingResult.objects.first()
+        analysis = WorkCompletionAnalysis.objects.create(ai_result=result, completion_quality="good")
+
+        response = self.client.get(reverse("workcompletionanalysis-detail", args=[analysis.id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["completion_quality"], "good")
+        self.assertEqual(response.data["ai_result"]["id"], result.id)
+
+    def test_analysis_retrieve_joins_result_entities(self):
+        """Test retrieving an analysis loads its nested result's entities in one query"""
+        result = AIProcessingResult.objects.first()
+        analysis = MaintenanceAnalysis.objects.create(ai_result=result, priority_assessment="high")
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("maintenanceanalysis-detail", args=[analysis.id]))
+
+        self.assertEqual(response.data["ai_result"]["property_name"], "Test Property")
+
+    def test_voice_report_list(self):
+        """Test voice reports are listed as voice reports"""
+        report = VoiceReport.objects.create(
+            ai_result=AIProcessingResult.objects.first(),
+            report_type="property_status",
+            property_obj=self.property,
+            report_text="All good",
+        )
+
+        response = self.client.get(reverse("voicereport-list"))
+
+        self.assertEqual([row["id"] for row in response.data["results"]], [report.id])
+        self.assertEqual(response.data["results"][0]["report_text"], "All good")
+
+    @mock.patch("ai.views.document_service")
+    def test_analyze_documents(self, document_service):
+        """Test a document batch is analyzed in one service call and saved together"""
+        document_service.is_available.return_value = True
+        document_service.analyze_documents.return_value = [{"tenant_name": "Ann", "confidence_score": 0.9}, None]
+        documents = [
+            {"document_content": "Lease for Ann", "document_type": "lease", "property_id": self.property.id},
+            {"document_content": "Application", "document_type": "application"},
+        ]
+
+        response = self.client.post(
+            reverse("ai-service-analyze-documents"), {"documents": documents}, format="json"
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(response.data[0]["property_name"], "Test Property")
+        self.assertEqual([row["status"] for row in response.data], ["completed", "failed"])
+        self.assertEqual(response.data[1]["error_message"], "AI analysis returned no result")
+        document_service.analyze_documents.assert_called_once_with(
+            [("lease", "Lease for Ann"), ("application", "Application")]
+        )
+        self.assertEqual(LeaseAnalysis.objects.get().tenant_name, "Ann")
+        self.assertFalse(TenantApplicationAnalysis.objects.exists())
+
+        # An identical lease is served from the stored extraction; the failed application is retried
+        document_service.analyze_documents.return_value = [{"applicant_name": "Bob"}]
+        self.client.post(reverse("ai-service-analyze-documents"), {"documents": documents}, format="json")
+        document_service.analyze_documents.assert_called_with([("application", "Application")])
+        self.assertEqual(LeaseAnalysis.objects.count(), 2)
+        self.assertEqual(TenantApplicationAnalysis.objects.get().applicant_name, "Bob")
+
+    @mock.patch("ai.views.document_service")
+    def test_analyze_document_failure(self, document_service):
+        """Test an extraction error marks the result failed and returns a 500"""
+        document_service.is_available.return_value = True
+        document_service.extract_lease_data.side_effect = RuntimeError("quota exceeded")
+
+        response = self.client.post(
+            reverse("ai-service-analyze-document"),
+            {"document_content": "Lease for Ann", "document_type": "lease"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 500)
+        ai_result = AIProcessingResult.objects.get(input_text="Lease for Ann")
+        self.assertEqual(ai_result.status, "failed")
+        self.assertEqual(ai_result.error_message, "quota exceeded")
+
+    @mock.patch("ai.views.document_service")
+    def test_analyze_documents_rejects_unsupported_type(self, document_service):
+        """Test a batch containing a document type with no extraction prompt is rejected"""
+        documents = [
+            {"document_content": "Lease for Ann", "document_type": "lease"},
+            {"document_content": "Vendor contract", "document_type": "contract"},
+        ]
+
+        response = self.client.post(
+            reverse("ai-service-analyze-documents"), {"documents": documents}, format="json"
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("contract", str(response.data["documents"]))
+        document_service.analyze_documents.assert_not_called()
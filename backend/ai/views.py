@@ -3,17 +3,26 @@ AI Views for TenantBase
 API endpoints for AI-powered document processing, analysis, and communication generation.
 """
 
+import json
 import logging
+from datetime import timedelta
 from typing import Optional, Dict, Any
 
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
-from django.db import models
+from django.db import connection, models
 from django.utils import timezone
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
+from accounting.models import FinancialTransaction, from_cents
+from leases.models import Lease
+from maintenance.models import MaintenanceRequest
+from payments.models import RentPayment
+from properties.models import Property
+
 from .models import (
     AIProcessingResult,
     LeaseAnalysis,
@@ -35,14 +44,24 @@ from .serializers import (
     FinancialAnalysisSerializer,
     VoiceInteractionSerializer,
     VoiceReportSerializer,
+    LeaseAnalysisSummarySerializer,
+    TenantApplicationAnalysisSummarySerializer,
+    MaintenanceAnalysisSummarySerializer,
+    PropertyInspectionSummarySerializer,
+    WorkCompletionAnalysisSummarySerializer,
+    FinancialAnalysisSummarySerializer,
+    VoiceInteractionSummarySerializer,
+    VoiceReportSummarySerializer,
     DocumentAnalysisRequestSerializer,
+    DocumentBatchAnalysisRequestSerializer,
     MaintenanceAnalysisRequestSerializer,
     CommunicationRequestSerializer,
     PropertyImageAnalysisSerializer,
     FinancialAnalysisRequestSerializer,
     InvestmentAnalysisRequestSerializer,
     VoiceCommandSerializer,
-    VoiceReportRequestSerializer
+    VoiceReportRequestSerializer,
+    WorkCompletionAnalysisRequestSerializer
 )
 from .services import (
     document_service,
@@ -50,23 +69,103 @@ from .services import (
     maintenance_service,
     inspection_service,
     financial_service,
-    voice_service
+    voice_service,
+    pick_extraction_model,
 )
+from .renderers import AIJSONRenderer, ORJSONViewMixin
 
 logger = logging.getLogger(__name__)
 
+# Columns (and with_entity_names() annotations) returned by the results fast_list
+FAST_LIST_FIELDS = (
+    'id', 'processing_type', 'confidence_score',
+    'property_obj', 'property_name', 'tenant', 'tenant_name',
+    'lease', 'lease_tenant_name', 'maintenance_request', 'maintenance_title',
+    'status', 'error_message', 'processing_time_ms', 'tokens_used', 'cost_estimate',
+    'created_by', 'created_at', 'updated_at',
+)
+EXPORT_CHUNK_SIZE = 500
+
+
+class AnalysisListMixin:
+    """Serialize list responses with summary_serializer_class (no nested AI result)."""
+
+    summary_serializer_class = None
+
+    def get_serializer_class(self):
+        if self.action == 'list' and self.summary_serializer_class is not None:
+            return self.summary_serializer_class
+        return super().get_serializer_class()
+
+
+class AIResultPrefetchMixin:
+    """
+    Join the AI result and the entities its nested serializer names when
+    serializing single analyses (retrieve); list responses use the summary
+    serializers and don't need them.
+    """
+
+    ai_result_related = (
+        'ai_result__property_obj', 'ai_result__tenant',
+        'ai_result__lease__tenant', 'ai_result__maintenance_request',
+    )
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action != 'list':
+            queryset = queryset.select_related(*self.ai_result_related)
+        return queryset
+
+
+class FastListMixin:
+    """
+    Adds a read-only fast_list action: paginated plain-dict rows from
+    .values(), with no model or serializer instances. Returns
+    fast_list_fields plus fast_list_expressions, or every concrete column
+    when fast_list_fields is unset. Computed fields are only included where
+    a viewset adds them in get_fast_list_row(); decimals render as numbers.
+    """
+
+    fast_list_fields = None
+    fast_list_expressions = {}
+
+    def get_fast_list_queryset(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        fields = self.fast_list_fields or [field.attname for field in queryset.model._meta.concrete_fields]
+        return queryset.values(*fields, **self.fast_list_expressions)
+
+    def get_fast_list_row(self, row):
+        """Hook to add computed values to a fast_list row dict."""
+        return row
+
+    @action(detail=False, methods=['get'])
+    def fast_list(self, request):
+        queryset = self.get_fast_list_queryset()
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response([self.get_fast_list_row(row) for row in page])
+        return Response([self.get_fast_list_row(row) for row in queryset])
+
+
+class AnalysisViewSet(ORJSONViewMixin, AnalysisListMixin, AIResultPrefetchMixin, FastListMixin,
+                      viewsets.ReadOnlyModelViewSet):
+    """Base read-only viewset for the per-type analysis results."""
+
 
-class AIProcessingResultViewSet(viewsets.ReadOnlyModelViewSet):
+class AIProcessingResultViewSet(ORJSONViewMixin, FastListMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet for AI processing results."""
 
     serializer_class = AIProcessingResultSerializer
     permission_classes = [IsAuthenticated]
     queryset = AIProcessingResult.objects.all()
+    # structured_output and generated_content are only in export/detail
+    fast_list_fields = FAST_LIST_FIELDS
+    fast_list_expressions = {'ai_model_used': models.F('ai_model__name')}
 
     def get_queryset(self):
         """Filter results based on user's permissions."""
         user = self.request.user
-        queryset = AIProcessingResult.objects.all()
+        queryset = AIProcessingResult.objects.with_entity_names()
 
         # Filter based on user role and associated entities
         if hasattr(user, 'user_type'):
@@ -83,18 +182,32 @@ class AIProcessingResultViewSet(viewsets.ReadOnlyModelViewSet):
 
         return queryset.order_by('-created_at')
 
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        Stream every visible result, structured output included, as
+        newline-delimited JSON so memory stays flat however many rows match.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            *FAST_LIST_FIELDS, 'structured_output', 'generated_content', **self.fast_list_expressions
+        )
+        renderer = AIJSONRenderer()
+        rows = (renderer.render(row) + b'\n' for row in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE))
+        return StreamingHttpResponse(rows, content_type='application/x-ndjson')
+
 
-class LeaseAnalysisViewSet(viewsets.ReadOnlyModelViewSet):
+class LeaseAnalysisViewSet(AnalysisViewSet):
     """ViewSet for lease analysis results."""
 
     serializer_class = LeaseAnalysisSerializer
+    summary_serializer_class = LeaseAnalysisSummarySerializer
     permission_classes = [IsAuthenticated]
     queryset = LeaseAnalysis.objects.all()
 
     def get_queryset(self):
         """Filter lease analyses based on user permissions."""
         user = self.request.user
-        queryset = LeaseAnalysis.objects.select_related('ai_result')
+        queryset = super().get_queryset()
 
         if hasattr(user, 'user_type'):
             if user.user_type == 'tenant':
@@ -109,17 +222,18 @@ class LeaseAnalysisViewSet(viewsets.ReadOnlyModelViewSet):
         return queryset
 
 
-class TenantApplicationAnalysisViewSet(viewsets.ReadOnlyModelViewSet):
+class TenantApplicationAnalysisViewSet(AnalysisViewSet):
     """ViewSet for tenant application analysis results."""
 
     serializer_class = TenantApplicationAnalysisSerializer
+    summary_serializer_class = TenantApplicationAnalysisSummarySerializer
     permission_classes = [IsAuthenticated]
     queryset = TenantApplicationAnalysis.objects.all()
 
     def get_queryset(self):
         """Filter application analyses based on user permissions."""
         user = self.request.user
-        queryset = TenantApplicationAnalysis.objects.select_related('ai_result')
+        queryset = super().get_queryset()
 
         if hasattr(user, 'user_type') and user.user_type == 'property_manager':
             queryset = queryset.filter(
@@ -131,69 +245,101 @@ class TenantApplicationAnalysisViewSet(viewsets.ReadOnlyModelViewSet):
         return queryset
 
 
-class MaintenanceAnalysisViewSet(viewsets.ReadOnlyModelViewSet):
+class MaintenanceAnalysisViewSet(AnalysisViewSet):
     """ViewSet for maintenance analysis results."""
 
     serializer_class = MaintenanceAnalysisSerializer
+    summary_serializer_class = MaintenanceAnalysisSummarySerializer
     permission_classes = [IsAuthenticated]
     queryset = MaintenanceAnalysis.objects.all()
 
+    def get_queryset(self):
+        """Optionally narrow to analyses needing a skill (?skill=) or part (?part=)."""
+        queryset = super().get_queryset()
+
+        skill = self.request.query_params.get('skill')
+        if skill:
+            queryset = self._filter_json_list(queryset, 'required_skills', skill)
+        part = self.request.query_params.get('part')
+        if part:
+            queryset = self._filter_json_list(queryset, 'parts_needed', part)
 
-class PropertyInspectionViewSet(viewsets.ReadOnlyModelViewSet):
+        return queryset
+
+    @staticmethod
+    def _filter_json_list(queryset, field, value):
+        """Rows whose JSON list in field holds value."""
+        if connection.features.supports_json_field_contains:
+            # JSON containment, served by the GIN indexes on PostgreSQL
+            return queryset.filter(**{f'{field}__contains': [value]})
+        # Backends without containment (SQLite) match the value's JSON encoding in the stored text
+        return queryset.filter(**{f'{field}__icontains': json.dumps(value)})
+
+    def get_fast_list_row(self, row):
+        row['estimated_cost_range'] = MaintenanceAnalysis.format_cost_range(row)
+        return row
+
+
+class PropertyInspectionViewSet(AnalysisViewSet):
     """ViewSet for property inspection analysis results."""
 
     serializer_class = PropertyInspectionSerializer
+    summary_serializer_class = PropertyInspectionSummarySerializer
     permission_classes = [IsAuthenticated]
     queryset = PropertyInspection.objects.all()
 
 
-class WorkCompletionAnalysisViewSet(viewsets.ReadOnlyModelViewSet):
+class WorkCompletionAnalysisViewSet(AnalysisViewSet):
     """ViewSet for work completion analysis results."""
 
     serializer_class = WorkCompletionAnalysisSerializer
+    summary_serializer_class = WorkCompletionAnalysisSummarySerializer
     permission_classes = [IsAuthenticated]
     queryset = WorkCompletionAnalysis.objects.all()
 
 
-class FinancialAnalysisViewSet(viewsets.ReadOnlyModelViewSet):
+class FinancialAnalysisViewSet(AnalysisViewSet):
     """ViewSet for financial analysis results."""
 
     serializer_class = FinancialAnalysisSerializer
+    summary_serializer_class = FinancialAnalysisSummarySerializer
     permission_classes = [IsAuthenticated]
     queryset = FinancialAnalysis.objects.all()
 
 
-class VoiceInteractionViewSet(viewsets.ReadOnlyModelViewSet):
+class VoiceInteractionViewSet(AnalysisViewSet):
     """ViewSet for voice interactions."""
 
     serializer_class = VoiceInteractionSerializer
+    summary_serializer_class = VoiceInteractionSummarySerializer
     permission_classes = [IsAuthenticated]
     queryset = VoiceInteraction.objects.all()
 
 
-class VoiceReportViewSet(viewsets.ReadOnlyModelViewSet):
+class VoiceReportViewSet(AnalysisViewSet):
     """ViewSet for voice reports."""
 
     serializer_class = VoiceReportSerializer
+    summary_serializer_class = VoiceReportSummarySerializer
     permission_classes = [IsAuthenticated]
     queryset = VoiceReport.objects.all()
 
     def get_queryset(self):
-        """Filter maintenance analyses based on user permissions."""
+        """Filter voice reports based on user permissions."""
         user = self.request.user
-        queryset = MaintenanceAnalysis.objects.select_related('ai_result')
+        queryset = super().get_queryset()
 
         if hasattr(user, 'user_type') and user.user_type == 'property_manager':
             queryset = queryset.filter(
-                ai_result__maintenance_request__property__owner=user
+                property_obj__owner=user
             ) | queryset.filter(
-                ai_result__maintenance_request__property__managers=user
+                property_obj__managers=user
             )
 
         return queryset
 
 
-class AIServiceViewSet(viewsets.ViewSet):
+class AIServiceViewSet(ORJSONViewMixin, viewsets.ViewSet):
     """ViewSet for AI processing services."""
 
     permission_classes = [IsAuthenticated]
@@ -218,57 +364,39 @@ class AIServiceViewSet(viewsets.ViewSet):
                 status=status.HTTP_503_SERVICE_UNAVAILABLE
             )
 
-        try:
-            # Create AI processing result record
-            ai_result = AIProcessingResult.objects.create(
-                processing_type=f"{document_type}_analysis",
-                ai_model_used="gemini-2.5-pro",
-                input_text=document_content[:5000],  # Store truncated input
-                status="processing",
-                created_by=request.user,
+        processing_type = f"{document_type}_analysis"
+        model_name = pick_extraction_model(document_content)
+        input_hash = AIProcessingResult.hash_input(document_content, model_name, processing_type)
 
-                # Associate with related entities if provided
-                property_obj_id=data.get('property_id'),
-                tenant_id=data.get('tenant_id'),
-            )
+        # Reuse the extraction from an identical document analyzed before
+        cached = AIProcessingResult.find_completed(input_hash)
+        cached_output = cached.structured_output if cached else None
 
-            result_data = None
-            analysis_obj = None
+        # Create AI processing result record
+        ai_result = AIProcessingResult.objects.create(
+            processing_type=processing_type,
+            ai_model_used=model_name,
+            input_text=document_content[:5000],  # Store truncated input
+            input_hash=input_hash,
+            status="processing",
+            created_by=request.user,
 
-            if document_type == 'lease':
-                result_data = document_service.extract_lease_data(document_content)
-                if result_data:
-                    analysis_obj = LeaseAnalysis.objects.create(
-                        ai_result=ai_result,
-                        tenant_name=result_data.get('tenant_name'),
-                        property_address=result_data.get('property_address'),
-                        monthly_rent=result_data.get('monthly_rent'),
-                        lease_start_date=result_data.get('lease_start_date'),
-                        lease_end_date=result_data.get('lease_end_date'),
-                        security_deposit=result_data.get('security_deposit'),
-                        pet_deposit=result_data.get('pet_deposit'),
-                        utilities_included=result_data.get('utilities_included'),
-                        special_terms=result_data.get('special_terms'),
-                    )
+            # Associate with related entities if provided
+            property_obj_id=data.get('property_id'),
+            tenant_id=data.get('tenant_id'),
+        )
 
+        try:
+            result_data = None
+            if document_type == 'lease':
+                result_data = cached_output or document_service.extract_lease_data(document_content)
             elif document_type == 'application':
-                result_data = document_service.analyze_tenant_application(document_content)
-                if result_data:
-                    analysis_obj = TenantApplicationAnalysis.objects.create(
-                        ai_result=ai_result,
-                        applicant_name=result_data.get('applicant_name'),
-                        current_address=result_data.get('current_address'),
-                        phone_number=result_data.get('phone_number'),
-                        email=result_data.get('email'),
-                        employment_status=result_data.get('employment_status'),
-                        monthly_income=result_data.get('monthly_income'),
-                        credit_score=result_data.get('credit_score_mentioned'),
-                        rental_history=result_data.get('rental_history'),
-                        risk_assessment=result_data.get('risk_assessment'),
-                        recommendations=result_data.get('recommendations'),
-                        pets_info=result_data.get('pets'),
-                        move_in_timeline=result_data.get('move_in_timeline'),
-                    )
+                result_data = cached_output or document_service.analyze_tenant_application(document_content)
+
+            analysis_obj = self._build_document_analysis(document_type, result_data)
+            if analysis_obj:
+                analysis_obj.ai_result = ai_result
+                analysis_obj.save()
 
             # Update the AI result with processed data
             ai_result.status = "completed"
@@ -297,6 +425,105 @@ class AIServiceViewSet(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @action(detail=False, methods=['post'])
+    def analyze_documents(self, request):
+        """
+        Analyze several documents (leases or tenant applications) using AI.
+        The Gemini calls run concurrently and all rows are saved together.
+        """
+        serializer = DocumentBatchAnalysisRequestSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        documents = serializer.validated_data['documents']
+
+        if not document_service.is_available():
+            return Response(
+                {"error": "AI service is not configured. Please check GEMINI_API_KEY."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
+        model_names = [pick_extraction_model(document['document_content']) for document in documents]
+        input_hashes = [
+            AIProcessingResult.hash_input(
+                document['document_content'], model_name, f"{document['document_type']}_analysis"
+            )
+            for document, model_name in zip(documents, model_names)
+        ]
+
+        # Reuse extractions of identical documents analyzed before, latest first
+        outputs = {}
+        completed = (
+            AIProcessingResult.objects.filter(input_hash__in=input_hashes, status='completed')
+            .order_by('created_at')
+            .values_list('input_hash', 'structured_output')
+        )
+        for input_hash, structured_output in completed:
+            outputs[bytes(input_hash)] = structured_output
+
+        to_analyze = [index for index in range(len(documents)) if not outputs.get(input_hashes[index])]
+        analyzed = document_service.analyze_documents(
+            [(documents[index]['document_type'], documents[index]['document_content']) for index in to_analyze]
+        )
+        for index, result_data in zip(to_analyze, analyzed):
+            outputs[input_hashes[index]] = result_data
+
+        payloads = []
+        for document, model_name, input_hash in zip(documents, model_names, input_hashes):
+            result_data = outputs.get(input_hash)
+            ai_result = AIProcessingResult(
+                processing_type=f"{document['document_type']}_analysis",
+                ai_model_used=model_name,
+                input_text=document['document_content'][:5000],
+                input_hash=input_hash,
+                # A document Gemini gave no usable extraction for is recorded as failed
+                status="completed" if result_data else "failed",
+                error_message=None if result_data else "AI analysis returned no result",
+                structured_output=result_data,
+                confidence_score=result_data.get('confidence_score') if result_data else None,
+                created_by=request.user,
+                property_obj_id=document.get('property_id'),
+                tenant_id=document.get('tenant_id'),
+            )
+            payloads.append((ai_result, self._build_document_analysis(document['document_type'], result_data)))
+
+        created = AIProcessingResult.bulk_persist(payloads)
+        return Response(AIProcessingResultSerializer(created, many=True).data, status=status.HTTP_201_CREATED)
+
+    @staticmethod
+    def _build_document_analysis(document_type, result_data):
+        """Unsaved LeaseAnalysis/TenantApplicationAnalysis for an extraction, or None."""
+        if not result_data:
+            return None
+        if document_type == 'lease':
+            return LeaseAnalysis(
+                tenant_name=result_data.get('tenant_name'),
+                property_address=result_data.get('property_address'),
+                monthly_rent=result_data.get('monthly_rent'),
+                lease_start_date=result_data.get('lease_start_date'),
+                lease_end_date=result_data.get('lease_end_date'),
+                security_deposit=result_data.get('security_deposit'),
+                pet_deposit=result_data.get('pet_deposit'),
+                utilities_included=result_data.get('utilities_included'),
+                special_terms=result_data.get('special_terms'),
+            )
+        if document_type == 'application':
+            return TenantApplicationAnalysis(
+                applicant_name=result_data.get('applicant_name'),
+                current_address=result_data.get('current_address'),
+                phone_number=result_data.get('phone_number'),
+                email=result_data.get('email'),
+                employment_status=result_data.get('employment_status'),
+                monthly_income=result_data.get('monthly_income'),
+                credit_score=result_data.get('credit_score_mentioned'),
+                rental_history=result_data.get('rental_history'),
+                risk_assessment=result_data.get('risk_assessment'),
+                recommendations=result_data.get('recommendations'),
+                pets_info=result_data.get('pets'),
+                move_in_timeline=result_data.get('move_in_timeline'),
+            )
+        return None
+
     @action(detail=False, methods=['post'])
     def analyze_maintenance(self, request):
         """
@@ -318,7 +545,7 @@ class AIServiceViewSet(viewsets.ViewSet):
             # Create AI processing result record
             ai_result = AIProcessingResult.objects.create(
                 processing_type="maintenance_request",
-                ai_model_used="gemini-2.5-pro",
+                ai_model_used=pick_extraction_model(data['description']),
                 input_text=data['description'],
                 status="processing",
                 created_by=request.user,
@@ -461,7 +688,7 @@ class AIServiceViewSet(viewsets.ViewSet):
             # Create AI processing result record
             ai_result = AIProcessingResult.objects.create(
                 processing_type="property_inspection",
-                ai_model_used="gemini-2.5-pro",
+                ai_model_used="gemini-2.5-flash",
                 input_text=data['image_description'],
                 status="processing",
                 created_by=request.user,
@@ -523,7 +750,7 @@ class AIServiceViewSet(viewsets.ViewSet):
         """
         Analyze before/after images of completed work.
         """
-        serializer = WorkCompletionAnalysisSerializer(data=request.data)
+        serializer = WorkCompletionAnalysisRequestSerializer(data=request.data)
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -539,7 +766,7 @@ class AIServiceViewSet(viewsets.ViewSet):
             # Create AI processing result record
             ai_result = AIProcessingResult.objects.create(
                 processing_type="work_completion",
-                ai_model_used="gemini-2.5-pro",
+                ai_model_used="gemini-2.5-flash",
                 input_text=f"Work completion analysis: {data.get('work_description', '')}",
                 status="processing",
                 created_by=request.user,
@@ -556,7 +783,6 @@ class AIServiceViewSet(viewsets.ViewSet):
             if analysis_data:
                 completion_obj = WorkCompletionAnalysis.objects.create(
                     ai_result=ai_result,
-                    maintenance_request_id=data.get('maintenance_request_id'),
                     completion_quality=analysis_data.get('work_completion_quality'),
                     issues_resolved=analysis_data.get('issues_resolved'),
                     remaining_issues=analysis_data.get('remaining_issues'),
@@ -616,11 +842,6 @@ class AIServiceViewSet(viewsets.ViewSet):
 
         try:
             # Get property and gather financial data
-            from properties.models import Property
-            from leases.models import Lease
-            from payments.models import RentPayment
-            from accounting.models import FinancialTransaction
-
             try:
                 property_obj = Property.objects.get(id=property_id)
             except Property.DoesNotExist:
@@ -638,7 +859,7 @@ class AIServiceViewSet(viewsets.ViewSet):
             # Create AI processing result record
             ai_result = AIProcessingResult.objects.create(
                 processing_type="financial_analysis",
-                ai_model_used="gemini-2.5-pro",
+                ai_model_used="gemini-2.5-flash",
                 input_text=f"Financial analysis for property {property_id}",
                 status="processing",
                 created_by=request.user,
@@ -713,8 +934,6 @@ class AIServiceViewSet(viewsets.ViewSet):
 
         try:
             # Get property and gather financial data
-            from properties.models import Property
-
             try:
                 property_obj = Property.objects.get(id=property_id)
             except Property.DoesNotExist:
@@ -962,7 +1181,6 @@ class AIServiceViewSet(viewsets.ViewSet):
 
         # Add user's managed properties
         try:
-            from properties.models import Property
             if hasattr(user, 'user_type') and user.user_type == 'property_manager':
                 properties = Property.objects.filter(
                     owner=user
@@ -983,7 +1201,6 @@ class AIServiceViewSet(viewsets.ViewSet):
             "Generated financial report"
         ]
 
-        from django.utils import timezone
         context['current_time'] = timezone.now().strftime('%Y-%m-%d %H:%M:%S')
 
         return context
@@ -992,7 +1209,6 @@ class AIServiceViewSet(viewsets.ViewSet):
         """Execute detected voice intent."""
         try:
             if intent == 'property_info' and parameters.get('property_id'):
-                from properties.models import Property
                 property_obj = Property.objects.get(id=parameters['property_id'])
                 return {
                     'action': 'property_info_retrieved',
@@ -1004,7 +1220,6 @@ class AIServiceViewSet(viewsets.ViewSet):
                 }
 
             elif intent == 'maintenance_status':
-                from maintenance.models import MaintenanceRequest
                 urgent_count = MaintenanceRequest.objects.filter(
                     property__owner=user,
                     priority='emergency',
@@ -1016,7 +1231,6 @@ class AIServiceViewSet(viewsets.ViewSet):
                 }
 
             elif intent == 'occupancy_report':
-                from properties.models import Property
                 properties = Property.objects.filter(owner=user)
                 total_units = sum(p.total_units for p in properties)
                 occupied_units = sum(
@@ -1043,12 +1257,6 @@ class AIServiceViewSet(viewsets.ViewSet):
 
     def _gather_property_financial_data(self, property_obj, period):
         """Gather financial data for a property over the specified period."""
-        from django.utils import timezone
-        from datetime import timedelta
-        from leases.models import Lease
-        from payments.models import RentPayment
-        from accounting.models import FinancialTransaction
-
         # Calculate date range
         end_date = timezone.now().date()
         if period == '3_months':
@@ -1067,12 +1275,12 @@ class AIServiceViewSet(viewsets.ViewSet):
             status='completed'
         ).aggregate(total=models.Sum('amount'))['total'] or 0
 
-        # Gather expenses
-        expenses = FinancialTransaction.objects.filter(
+        # Gather expenses (integer cents sum over the expense partial index)
+        expenses = from_cents(FinancialTransaction.objects.filter(
             property_obj=property_obj,
             transaction_date__range=[start_date, end_date],
-            transaction_type__in=['expense', 'maintenance']
-        ).aggregate(total=models.Sum('amount'))['total'] or 0
+            is_expense=True
+        ).aggregate(total=models.Sum('amount_cents'))['total'])
 
         # Current occupancy
         active_leases = Lease.objects.filter(
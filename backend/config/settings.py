@@ -348,6 +348,12 @@ STRIPE_WEBHOOK_SECRET = os.getenv("STRIPE_WEBHOOK_SECRET", "")
 
 # Google Gemini AI Configuration
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
+AI_BULK_BATCH_SIZE = int(os.getenv("AI_BULK_BATCH_SIZE", "100"))
+# Seconds to reuse Gemini responses for identical low-temperature prompts
+AI_RESPONSE_CACHE_TIMEOUT = int(os.getenv("AI_RESPONSE_CACHE_TIMEOUT", "1800"))
+# Seconds to reuse a generated message template across recipients. Kept short:
+# templates are cached at any temperature, so everyone in the window gets the same wording
+AI_TEMPLATE_CACHE_TIMEOUT = int(os.getenv("AI_TEMPLATE_CACHE_TIMEOUT", "300"))
 
 # Logging
 LOGGING = {
@@ -0,0 +1,52 @@
+"""
+Custom model fields for the Property Management System.
+
+Provides drop-in field replacements shared across apps.
+"""
+
+from typing import Any
+
+from django.db.models import JSONField
+from django.db.models.fields.json import KeyTransform
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def orjson_dumps(value: Any) -> str:
+    """Encode a JSON document with orjson, allowing non-string dict keys like json.dumps"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class OrjsonField(JSONField):
+    """
+    JSONField that encodes and decodes with orjson instead of the stdlib json
+    module.
+
+    Falls back to the stock JSONField behaviour when a custom encoder or
+    decoder is configured, for SQL expressions, and for stored documents
+    orjson rejects (e.g. NaN written by older stdlib encodes).
+    """
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if orjson is None or self.encoder is not None:
+            return super().get_db_prep_value(value, connection, prepared)
+        if not prepared:
+            value = self.get_prep_value(value)
+        if hasattr(value, "as_sql"):
+            return super().get_db_prep_value(value, connection, prepared=True)
+        if connection.vendor == "postgresql":
+            from django.db.backends.postgresql.psycopg_any import Jsonb
+
+            return Jsonb(value, dumps=orjson_dumps)
+        return orjson_dumps(value)
+
+    def from_db_value(self, value, expression, connection):
+        if orjson is None or self.decoder is not None or not isinstance(value, (str, bytes)) or isinstance(expression, KeyTransform):
+            return super().from_db_value(value, expression, connection)
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return super().from_db_value(value, expression, connection)
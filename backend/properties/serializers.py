@@ -1,6 +1,9 @@
 from datetime import date
 from rest_framework import serializers
 
+from ai.models import AIProcessingResult
+from ai.serializers import AIResultSummarySerializer
+
 from .models import Property, PropertyImage
 
 
@@ -17,6 +20,7 @@ class PropertySerializer(serializers.ModelSerializer):
     owner_name = serializers.CharField(source="owner.get_full_name", read_only=True)
     full_address = serializers.CharField(read_only=True)
     images = PropertyImageSerializer(many=True, read_only=True)
+    recent_ai_results = serializers.SerializerMethodField()
 
     class Meta:
         model = Property
@@ -49,6 +53,7 @@ class PropertySerializer(serializers.ModelSerializer):
             "occupancy_rate",
             "monthly_income",
             "images",
+            "recent_ai_results",
             "created_at",
             "updated_at",
         ]
@@ -57,6 +62,13 @@ class PropertySerializer(serializers.ModelSerializer):
     def get_occupancy_rate(self, obj):
         return obj.get_occupancy_rate()
 
+    def get_recent_ai_results(self, obj):
+        # Prefetched by the viewset on retrieve; create/update responses query directly
+        results = getattr(obj, "recent_ai_results", None)
+        if results is None:
+            results = AIProcessingResult.recent_completed().filter(property_obj=obj)[:10]
+        return AIResultSummarySerializer(results, many=True).data
+
     def get_monthly_income(self, obj):
         return str(obj.get_monthly_income())
 
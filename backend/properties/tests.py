@@ -161,6 +161,33 @@ class PropertyAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["property_name"], "Updated Property")
 
+    def test_retrieve_recent_ai_results(self):
+        """Test property detail includes only its latest completed AI results"""
+        from ai.models import AIProcessingResult
+
+        for n in range(12):
+            AIProcessingResult.objects.create(
+                property_obj=self.property,
+                processing_type="property_inspection",
+                ai_model_used="gemini-2.5-pro",
+                input_text=f"Inspection {n}",
+                status="completed",
+            )
+        AIProcessingResult.objects.create(
+            property_obj=self.property,
+            processing_type="property_inspection",
+            ai_model_used="gemini-2.5-pro",
+            input_text="Still running",
+            status="processing",
+        )
+
+        self.client.force_authenticate(user=self.owner)
+        url = reverse("property-detail", kwargs={"pk": self.property.id})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["recent_ai_results"]), 10)
+        self.assertEqual(response.data["recent_ai_results"][0]["processing_type"], "property_inspection")
+
     def test_delete_property(self):
         """Test deleting a property"""
         self.client.force_authenticate(user=self.owner)
@@ -6,6 +6,7 @@ from rest_framework.decorators import action
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
+from ai.models import AIProcessingResult
 from core.mixins import BaseViewSet
 from .models import Property, PropertyImage
 from .serializers import PropertyImageSerializer, PropertyListSerializer, PropertySerializer
@@ -55,6 +56,11 @@ class PropertyViewSet(BaseViewSet):
     ordering = ["-created_at"]
     pagination_class = PropertyPagination
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "retrieve":
+            queryset = queryset.prefetch_related(AIProcessingResult.recent_prefetch())
+        return queryset
 
     def get_serializer_class(self):
         if self.action == "list":